@@ -0,0 +1,24 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson is optional (pip install "arvo[fast]"). Its JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch the same exception either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    
+    def dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return orjson.dumps(obj)
+    
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    loads = json.loads
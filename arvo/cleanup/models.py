@@ -2,14 +2,31 @@
 Data models for cleanup and resource management.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+# Tag keys repeated on nearly every resource; one shared string object each
+_KEY_POOL = {
+    k: sys.intern(k)
+    for k in ("project", "deployment_id", "created_at", "owner", "stage", "env", "ttl_hours", "expires_at", "expires_at_epoch")
+}
 
-@dataclass
+# Longer values (timestamps, ARNs) are rarely shared, so are not interned
+_INTERN_MAX_LEN = 32
+
+
+@dataclass(slots=True)
 class FoundResource:
     """Represents a found AWS resource with tagging information."""
     service: str  # "ec2", "eip", "sg", "alb", "tg", "listener", "ecs", "ecr", "logs", "s3", "cloudfront", "iam", etc.
     arn_or_id: str
     tags: Dict[str, str]
     reason: Optional[str] = None  # Why we think it belongs to this deployment
+    
+    def __post_init__(self):
+        # Share repeated tag strings across the many resources a sweep finds
+        self.tags = {
+            _KEY_POOL.get(k, k): sys.intern(v) if isinstance(v, str) and len(v) < _INTERN_MAX_LEN else v
+            for k, v in self.tags.items()
+        }
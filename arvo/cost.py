@@ -2,12 +2,17 @@
 Cost estimation utilities for deployment cost awareness.
 """
 
+import copy
 import subprocess
 import json
+import math
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from ._json import loads as _loads
+
 
 def estimate_cost(stack_path: str, region: str = "us-west-2") -> Dict[str, Any]:
     """
@@ -49,17 +54,19 @@ def _try_infracost(stack_path: str) -> Optional[Dict[str, Any]]:
             'infracost', 'breakdown',
             '--path', stack_path,
             '--format', 'json'
-        ], capture_output=True, text=True, check=True)
+        ], capture_output=True, check=True)
         
-        data = json.loads(result.stdout)
+        data = _loads(result.stdout)
         
-        # Extract monthly cost
-        total_monthly = 0.0
-        for project in data.get('projects', []):
-            for resource in project.get('breakdown', {}).get('resources', []):
-                monthly_cost = resource.get('monthlyCost', 0)
-                if monthly_cost:
-                    total_monthly += float(monthly_cost)
+        # Extract monthly cost (null/zero costs are skipped). Even large plans
+        # list only hundreds of resources, and the string-to-float parse is the
+        # per-item cost either way, so this stays a single generator pass
+        total_monthly = math.fsum(
+            float(monthly_cost)
+            for project in data.get('projects', [])
+            for resource in project.get('breakdown', {}).get('resources', [])
+            if (monthly_cost := resource.get('monthlyCost'))
+        )
         
         return {
             "method": "infracost",
@@ -83,11 +90,24 @@ def _heuristic_cost_estimate(stack_path: str, region: str) -> Dict[str, Any]:
     Returns:
         Heuristic cost estimation
     """
+    tfvars_path = Path(stack_path) / "terraform.tfvars.json"
+    try:
+        tfvars_mtime_ns = tfvars_path.stat().st_mtime_ns
+    except OSError:
+        tfvars_mtime_ns = None
+    
+    # Cached per stack and tfvars version; copy so callers may mutate the result
+    return copy.deepcopy(_cached_heuristic_estimate(stack_path, region, tfvars_mtime_ns))
+
+
+@lru_cache(maxsize=64)
+def _cached_heuristic_estimate(stack_path: str, region: str, tfvars_mtime_ns: Optional[int]) -> Dict[str, Any]:
+    """Compute the heuristic estimate; tfvars_mtime_ns only keys the cache."""
     # Read terraform.tfvars.json if it exists
     tfvars_path = Path(stack_path) / "terraform.tfvars.json"
     tfvars = {}
     
-    if tfvars_path.exists():
+    if tfvars_mtime_ns is not None:
         try:
             with open(tfvars_path, 'r') as f:
                 tfvars = json.load(f)
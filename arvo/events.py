@@ -5,7 +5,7 @@ Event logging utilities for NDJSON format.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .state import get_deployment_dir
 
@@ -19,17 +19,31 @@ def emit_event(deployment_id: str, event_type: str, data: Dict[str, Any]) -> Non
         event_type: Event type (e.g., "INIT", "TF_PLAN", "ERROR")
         data: Event data
     """
+    emit_events(deployment_id, [(event_type, data)])
+
+
+def emit_events(deployment_id: str, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    Emit several events to the deployment's logs.ndjson file in one write.
+    
+    Args:
+        deployment_id: Deployment ID
+        events: (event_type, data) pairs, in order
+    """
     deployment_dir = get_deployment_dir(deployment_id)
     logs_file = deployment_dir / "logs.ndjson"
     
-    event = {
-        "ts": datetime.now().isoformat(),
-        "type": event_type,
-        "data": data
-    }
+    lines = []
+    for event_type, data in events:
+        event = {
+            "ts": datetime.now().isoformat(),
+            "type": event_type,
+            "data": data
+        }
+        lines.append(json.dumps(event) + "\n")
     
     with open(logs_file, "a") as f:
-        f.write(json.dumps(event) + "\n")
+        f.write("".join(lines))
         f.flush()  # Ensure immediate write
 
 
@@ -77,38 +91,73 @@ def get_last_event(deployment_id: str) -> Optional[Dict[str, Any]]:
     return events[-1] if events else None
 
 
+# Map event types to status
+_STATUS_MAP = {
+    "INIT": "queued",
+    "TF_INIT": "init",
+    "TF_PLAN": "tf_init",
+    "TF_APPLY_START": "tf_plan",
+    "TF_APPLY_DONE": "tf_apply",
+    "BOOTSTRAP_WAIT": "bootstrapping",
+    "VERIFY_OK": "verifying",
+    "DONE": "healthy",
+    "ERROR": "failed",
+    "DESTROY_START": "destroying",
+    "DESTROY_DONE": "destroyed"
+}
+
+# logs.ndjson path -> (inode, mtime_ns, bytes consumed, status after those bytes)
+_STATUS_CACHE: Dict[str, Tuple[int, int, int, str]] = {}
+
+
 def get_status_from_events(deployment_id: str) -> str:
     """
     Determine deployment status from events.
     
+    Only the part of the log appended since the previous call is parsed. A
+    log that was replaced (new inode), shrank, or was rewritten in place at
+    the same size is rescanned from the start.
+    
     Args:
         deployment_id: Deployment ID
         
     Returns:
         Status string
     """
-    last_event = get_last_event(deployment_id)
-    if not last_event:
+    logs_file = get_deployment_dir(deployment_id) / "logs.ndjson"
+    key = str(logs_file)
+    
+    try:
+        st = logs_file.stat()
+    except FileNotFoundError:
+        _STATUS_CACHE.pop(key, None)
         return "unknown"
+    size = st.st_size
+    
+    ino, mtime_ns, offset, status = _STATUS_CACHE.get(key, (st.st_ino, st.st_mtime_ns, 0, "unknown"))
+    if ino == st.st_ino and size == offset and mtime_ns == st.st_mtime_ns:
+        return status
+    if ino != st.st_ino or size <= offset:
+        offset, status = 0, "unknown"
+    
+    with open(logs_file, "rb") as f:
+        f.seek(offset)
+        chunk = f.read(size - offset)
+    
+    # Leave a trailing partial line for the next call
+    consumed = chunk.rfind(b"\n") + 1
+    for line in chunk[:consumed].splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # Skip malformed lines
+        status = _STATUS_MAP.get(event.get("type", ""), "unknown")
     
-    event_type = last_event.get("type", "")
-    
-    # Map event types to status
-    status_map = {
-        "INIT": "queued",
-        "TF_INIT": "init",
-        "TF_PLAN": "tf_init",
-        "TF_APPLY_START": "tf_plan",
-        "TF_APPLY_DONE": "tf_apply",
-        "BOOTSTRAP_WAIT": "bootstrapping",
-        "VERIFY_OK": "verifying",
-        "DONE": "healthy",
-        "ERROR": "failed",
-        "DESTROY_START": "destroying",
-        "DESTROY_DONE": "destroyed"
-    }
-    
-    return status_map.get(event_type, "unknown")
+    _STATUS_CACHE[key] = (st.st_ino, st.st_mtime_ns, offset + consumed, status)
+    return status
 
 
 def tail_events(deployment_id: str, follow: bool = False):
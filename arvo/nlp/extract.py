@@ -2,6 +2,8 @@
 Main extraction orchestrator for NLP processing.
 """
 
+import copy
+import os
 import time
 import logging
 from typing import Dict, Any, Optional, Tuple
@@ -13,6 +15,15 @@ from .examples import get_examples
 
 logger = logging.getLogger(__name__)
 
+# Finished extractions as (overrides dict, report dict), keyed on every input
+_EXTRACT_CACHE: Dict[Tuple, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_EXTRACT_CACHE_MAX = 128
+
+# Assumptions recorded when a run failed part-way; such results are not reused.
+# Providers swallow their own errors and return {}, which shows up as
+# "LLM unavailable", so that degraded result must not be cached either.
+_TRANSIENT_FAILURES = ("LLM failed", "LLM unavailable", "Extraction failed")
+
 
 def extract_overrides(
     instructions: str,
@@ -37,6 +48,57 @@ def extract_overrides(
     Returns:
         Tuple of (overrides, report)
     """
+    if not instructions or not instructions.strip():
+        return _default_extraction(default_cloud, default_region)
+    
+    start_time = time.time()
+    key = (instructions, *_resolve_provider(provider, model), default_cloud, default_region, timeout_s)
+    
+    cached = _EXTRACT_CACHE.get(key)
+    if cached is not None:
+        # Rebuild fresh objects so callers can mutate them without touching the cache
+        overrides_data, report_data = copy.deepcopy(cached)
+        report = NLPReport.from_dict(report_data)
+        report.duration_ms = int((time.time() - start_time) * 1000)
+        return Overrides.from_dict(overrides_data), report
+    
+    final_overrides, report = _extract_overrides_uncached(
+        instructions, provider, model, default_cloud, default_region, timeout_s
+    )
+    
+    if not any(a.startswith(_TRANSIENT_FAILURES) for a in report.assumptions):
+        if len(_EXTRACT_CACHE) >= _EXTRACT_CACHE_MAX:
+            del _EXTRACT_CACHE[next(iter(_EXTRACT_CACHE))]
+        _EXTRACT_CACHE[key] = copy.deepcopy((final_overrides.to_dict(), report.to_dict()))
+    
+    return final_overrides, report
+
+
+def _default_extraction(default_cloud: str, default_region: str) -> Tuple[Overrides, NLPReport]:
+    """Build the result for empty instructions without running either pass."""
+    overrides = Overrides(cloud=default_cloud, region=default_region)
+    report = NLPReport(assumptions=["No instructions provided; used defaults"])
+    
+    overrides.confidence = report.confidence = _compute_confidence(overrides, report)
+    _add_default_assumptions(overrides, report, default_cloud, default_region)
+    return overrides, report
+
+
+def _resolve_provider(provider: Optional[str], model: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Resolve provider and model the same way get_provider does, for cache keys."""
+    provider_name = (provider or os.getenv("ARVO_NLP_PROVIDER", "mock")).lower()
+    return provider_name, model or os.getenv("ARVO_NLP_MODEL")
+
+
+def _extract_overrides_uncached(
+    instructions: str,
+    provider: Optional[str],
+    model: Optional[str],
+    default_cloud: str,
+    default_region: str,
+    timeout_s: float,
+) -> Tuple[Overrides, NLPReport]:
+    """Run both extraction passes, normalization and confidence scoring."""
     start_time = time.time()
     report = NLPReport()
     
@@ -2,22 +2,168 @@
 Deterministic regex/phrase rules for Pass A extraction.
 """
 
+import copy
 import re
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from .schema import Overrides, DatabaseConfig
 
 
+# Precompiled Pass A patterns (text is already lowercased before matching)
+_CLOUD_PATTERNS = [
+    (re.compile(r'\bon aws\b|\bamazon\b|\baws\b'), "aws"),
+    (re.compile(r'\bon gcp\b|\bgoogle cloud\b|\bgcp\b'), "gcp"),
+    (re.compile(r'\bon azure\b|\bmicrosoft azure\b|\bazure\b'), "azure")
+]
+
+# Keyword aliases, declared in priority order: when several appear in the
+# text the earliest entry wins, as with the ordered regex lists they replace
+_INFRA_ALIASES = {
+    'serverless': 'lambda',
+    'lambda': 'lambda',
+    'function': 'lambda',
+    'vm': 'ec2',
+    'virtual machine': 'ec2',
+    'ec2': 'ec2',
+    'container': 'ecs_fargate',
+    'containerize': 'ecs_fargate',
+    'docker': 'ecs_fargate',
+    'ecs': 'ecs_fargate',
+    'fargate': 'ecs_fargate',
+    'lightsail container': 'ecs_fargate',
+    'lightsail containers': 'ecs_fargate',
+    'static site': 's3_cf',
+    'cdn': 's3_cf',
+    'cloudfront': 's3_cf',
+    's3 website': 's3_cf'
+}
+
+_RE_REGION = re.compile(r'\b(us-[a-z]+-\d+|eu-[a-z]+-\d+|ap-[a-z]+-\d+|ca-[a-z]+-\d+|sa-[a-z]+-\d+)\b')
+
+_REGION_ALIASES = {
+    'oregon': 'us-west-2',
+    'n. virginia': 'us-east-1',
+    'northern virginia': 'us-east-1',
+    'frankfurt': 'eu-central-1',
+    'ireland': 'eu-west-1',
+    'london': 'eu-west-2',
+    'tokyo': 'ap-northeast-1',
+    'singapore': 'ap-southeast-1',
+    'sydney': 'ap-southeast-2',
+    'mumbai': 'ap-south-1',
+    'seoul': 'ap-northeast-2',
+    'california': 'us-west-1',
+    'ohio': 'us-east-2'
+}
+
+_INFRA_ALIAS_RANK = {alias: rank for rank, alias in enumerate(_INFRA_ALIASES)}
+_REGION_ALIAS_RANK = {alias: rank for rank, alias in enumerate(_REGION_ALIASES)}
+
+_RE_WORD = re.compile(r'\w+')
+
+# First words of two-word aliases: the first level of a prefix trie, so a
+# two-word phrase is only sliced out when it could start an alias
+_INFRA_ALIAS_HEADS = frozenset(_RE_WORD.match(a).group() for a in _INFRA_ALIASES if ' ' in a)
+_REGION_ALIAS_HEADS = frozenset(_RE_WORD.match(a).group() for a in _REGION_ALIASES if ' ' in a)
+
+_SIZE_PATTERNS = [
+    (re.compile(r'\btiny\b|\bvery small\b'), "micro"),
+    (re.compile(r'\bmicro\b'), "micro"),
+    (re.compile(r'\bsmall\b'), "small"),
+    (re.compile(r'\bmedium\b'), "medium"),
+    (re.compile(r'\blarge\b'), "large"),
+    (re.compile(r'\bxlarge\b|\bextra large\b'), "xlarge")
+]
+
+_INSTANCE_TYPE_PATTERNS = [
+    (re.compile(r'\bt3\.micro\b'), "t3.micro"),
+    (re.compile(r'\bt3\.small\b'), "t3.small"),
+    (re.compile(r'\bt3\.medium\b'), "t3.medium"),
+    (re.compile(r'\bt3\.large\b'), "t3.large"),
+    (re.compile(r'\bt3\.xlarge\b'), "t3.xlarge"),
+    (re.compile(r'\bc6g\.large\b'), "c6g.large"),
+    (re.compile(r'\bm5\.large\b'), "m5.large"),
+    (re.compile(r'\br5\.large\b'), "r5.large")
+]
+
+_INSTANCE_TYPE_SIZES = {
+    't3.micro': 'micro',
+    't3.small': 'small',
+    't3.medium': 'medium',
+    't3.large': 'large',
+    't3.xlarge': 'xlarge',
+    'c6g.large': 'large',
+    'm5.large': 'large',
+    'r5.large': 'large'
+}
+
+_RE_CONTAINERIZED = re.compile(r'\bcontaineriz\w+\b|\bdocker\b|\bcontainer\b')
+
+_DOMAIN_PATTERNS = [
+    re.compile(r'\bdomain\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'),
+    re.compile(r'\bcustom domain\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'),
+    re.compile(r'\b([a-zA-Z0-9.-]+\.(?:com|org|net|io|dev|app))\b')
+]
+
+_RE_SSL = re.compile(r'\bhttps\b|\bssl\b|\btls\b|\bsecure\b')
+
+_RE_AUTOSCALING = re.compile(r'\bautoscaling\b')
+_RE_MIN_INSTANCES = re.compile(r'\bmin\s+(\d+)\b')
+_RE_MAX_INSTANCES = re.compile(r'\bmax\s+(\d+)\b')
+_RE_SCALE_TO = re.compile(r'\bscale\s+to\s+(\d+)\b')
+_RE_INSTANCE_RANGE = re.compile(r'\b(\d+)\s*\.\.\s*(\d+)\b')
+
+_DB_PATTERNS = [
+    (re.compile(r'\bwith postgres\b|\bpostgresql\b'), "postgres"),
+    (re.compile(r'\bwith mysql\b'), "mysql"),
+    (re.compile(r'\bwith sqlite\b'), "sqlite"),
+    (re.compile(r'\bno db\b|\bno database\b|\bwithout database\b'), "none")
+]
+
+_RE_PORT = re.compile(r'\bport\s+(\d+)\b')
+
+_HEALTH_PATTERNS = [
+    re.compile(r'\bhealth\s+(?:path\s+)?(/\S*)'),
+    re.compile(r'\bhealth\s+check\s+(?:path\s+)?(/\S*)')
+]
+
+# Conservative pattern for uppercase environment variables (case insensitive)
+_RE_ENV = re.compile(r'\b([A-Z][A-Z0-9_]*)\s*=\s*([^\s,]+)', re.IGNORECASE)
+
+_TTL_PATTERNS = [
+    re.compile(r'\b(\d+)\s*h\b'),  # 24h
+    re.compile(r'\b(\d+)\s*hours?\b'),  # 24 hours
+    re.compile(r'\bauto-destroy\s+in\s+(\d+)\s*h\b'),  # auto-destroy in 24h
+    re.compile(r'\bttl\s+(\d+)\s*h\b')  # ttl 24h
+]
+
+
 def extract_pass_a(instructions: str) -> Tuple[Overrides, List[str]]:
     """
     Extract deployment overrides using deterministic rules (Pass A).
     
+    Results are memoized on the normalized text; every call gets a fresh
+    Overrides and hits list, so callers may mutate them freely.
+    
     Args:
         instructions: Raw instruction text
         
     Returns:
         Tuple of (partial_overrides, hits) where hits are the rules that fired
     """
-    text = instructions.lower()
+    frozen, hits = _extract_pass_a_cached(instructions.strip().lower())
+    return Overrides.from_dict(copy.deepcopy(dict(frozen))), list(hits)
+
+
+@lru_cache(maxsize=256)
+def _extract_pass_a_cached(text: str) -> Tuple[Tuple[Tuple[str, Any], ...], Tuple[str, ...]]:
+    """Run the Pass A rules over normalized text and return an immutable result."""
+    overrides, hits = _run_pass_a(text)
+    return tuple(overrides.to_dict().items()), tuple(hits)
+
+
+def _run_pass_a(text: str) -> Tuple[Overrides, List[str]]:
+    """Apply every Pass A rule to lowercased text."""
     hits = []
     overrides = Overrides()
     
@@ -97,65 +243,53 @@ def extract_pass_a(instructions: str) -> Tuple[Overrides, List[str]]:
 
 def _extract_cloud(text: str, hits: List[str]) -> Optional[str]:
     """Extract cloud provider from text."""
-    patterns = [
-        (r'\bon aws\b|\bamazon\b|\baws\b', "aws"),
-        (r'\bon gcp\b|\bgoogle cloud\b|\bgcp\b', "gcp"),
-        (r'\bon azure\b|\bmicrosoft azure\b|\bazure\b', "azure")
-    ]
-    
-    for pattern, cloud in patterns:
-        if re.search(pattern, text):
+    for pattern, cloud in _CLOUD_PATTERNS:
+        if pattern.search(text):
             hits.append(f"cloud:{cloud}")
             return cloud
     return None
 
 
+def _phrases(text: str, heads: FrozenSet[str]) -> Iterator[str]:
+    """Yield every word in text, and each two-word phrase starting with one of heads."""
+    prev = None
+    for match in _RE_WORD.finditer(text):
+        yield match.group()
+        if prev is not None and prev.group() in heads:
+            yield text[prev.start():match.end()]
+        prev = match
+
+
+def _find_alias(text: str, rank: Dict[str, int], heads: FrozenSet[str]) -> Optional[str]:
+    """Return the highest-priority alias present in text, in one pass over it."""
+    found = [phrase for phrase in _phrases(text, heads) if phrase in rank]
+    return min(found, key=rank.__getitem__) if found else None
+
+
 def _extract_infra(text: str, hits: List[str]) -> Optional[str]:
     """Extract infrastructure type from text."""
-    patterns = [
-        (r'\bserverless\b|\blambda\b|\bfunction\b', "lambda"),
-        (r'\bvm\b|\bvirtual machine\b|\bec2\b', "ec2"),
-        (r'\bcontainer\b|\bcontainerize\b|\bdocker\b|\becs\b|\bfargate\b|\blightsail containers?\b', "ecs_fargate"),
-        (r'\bstatic site\b|\bcdn\b|\bcloudfront\b|\bs3 website\b', "s3_cf")
-    ]
-    
-    for pattern, infra in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            hits.append(f"infra:{infra}")
-            return infra
+    alias = _find_alias(text, _INFRA_ALIAS_RANK, _INFRA_ALIAS_HEADS)
+    if alias:
+        infra = _INFRA_ALIASES[alias]
+        hits.append(f"infra:{infra}")
+        return infra
     return None
 
 
 def _extract_region(text: str, hits: List[str]) -> Optional[str]:
     """Extract region from text."""
     # Direct region patterns
-    region_pattern = r'\b(us-[a-z]+-\d+|eu-[a-z]+-\d+|ap-[a-z]+-\d+|ca-[a-z]+-\d+|sa-[a-z]+-\d+)\b'
-    match = re.search(region_pattern, text)
+    match = _RE_REGION.search(text)
     if match:
         hits.append(f"region:direct:{match.group(1)}")
         return match.group(1)
     
     # Region aliases
-    aliases = {
-        'oregon': 'us-west-2',
-        'n. virginia': 'us-east-1',
-        'northern virginia': 'us-east-1',
-        'frankfurt': 'eu-central-1',
-        'ireland': 'eu-west-1',
-        'london': 'eu-west-2',
-        'tokyo': 'ap-northeast-1',
-        'singapore': 'ap-southeast-1',
-        'sydney': 'ap-southeast-2',
-        'mumbai': 'ap-south-1',
-        'seoul': 'ap-northeast-2',
-        'california': 'us-west-1',
-        'ohio': 'us-east-2'
-    }
-    
-    for alias, canonical in aliases.items():
-        if re.search(rf'\b{re.escape(alias)}\b', text):
-            hits.append(f"region:alias:{alias}->{canonical}")
-            return canonical
+    alias = _find_alias(text, _REGION_ALIAS_RANK, _REGION_ALIAS_HEADS)
+    if alias:
+        canonical = _REGION_ALIASES[alias]
+        hits.append(f"region:alias:{alias}->{canonical}")
+        return canonical
     
     return None
 
@@ -163,52 +297,22 @@ def _extract_region(text: str, hits: List[str]) -> Optional[str]:
 def _extract_instance_size(text: str, hits: List[str]) -> Tuple[Optional[str], Optional[str]]:
     """Extract instance size and type from text."""
     # Abstract size mappings
-    size_patterns = [
-        (r'\btiny\b|\bvery small\b', "micro"),
-        (r'\bmicro\b', "micro"),
-        (r'\bsmall\b', "small"),
-        (r'\bmedium\b', "medium"),
-        (r'\blarge\b', "large"),
-        (r'\bxlarge\b|\bextra large\b', "xlarge")
-    ]
-    
     instance_size = None
-    for pattern, size in size_patterns:
-        if re.search(pattern, text):
+    for pattern, size in _SIZE_PATTERNS:
+        if pattern.search(text):
             instance_size = size
             hits.append(f"size:abstract:{size}")
             break
     
     # Specific instance types
-    instance_type_patterns = [
-        (r'\bt3\.micro\b', "t3.micro"),
-        (r'\bt3\.small\b', "t3.small"),
-        (r'\bt3\.medium\b', "t3.medium"),
-        (r'\bt3\.large\b', "t3.large"),
-        (r'\bt3\.xlarge\b', "t3.xlarge"),
-        (r'\bc6g\.large\b', "c6g.large"),
-        (r'\bm5\.large\b', "m5.large"),
-        (r'\br5\.large\b', "r5.large")
-    ]
-    
     instance_type = None
-    for pattern, inst_type in instance_type_patterns:
-        if re.search(pattern, text):
+    for pattern, inst_type in _INSTANCE_TYPE_PATTERNS:
+        if pattern.search(text):
             instance_type = inst_type
             hits.append(f"type:specific:{inst_type}")
             # Infer size from type if not already set
             if not instance_size:
-                size_map = {
-                    't3.micro': 'micro',
-                    't3.small': 'small', 
-                    't3.medium': 'medium',
-                    't3.large': 'large',
-                    't3.xlarge': 'xlarge',
-                    'c6g.large': 'large',
-                    'm5.large': 'large',
-                    'r5.large': 'large'
-                }
-                instance_size = size_map.get(inst_type)
+                instance_size = _INSTANCE_TYPE_SIZES.get(inst_type)
             break
     
     return instance_size, instance_type
@@ -216,31 +320,17 @@ def _extract_instance_size(text: str, hits: List[str]) -> Tuple[Optional[str], O
 
 def _extract_containerized(text: str, hits: List[str]) -> Optional[bool]:
     """Extract containerization preference from text."""
-    container_patterns = [
-        r'\bcontaineriz\w+\b',
-        r'\bdocker\b',
-        r'\bcontainer\b'
-    ]
-    
-    for pattern in container_patterns:
-        if re.search(pattern, text):
-            hits.append("containerized:true")
-            return True
+    if _RE_CONTAINERIZED.search(text):
+        hits.append("containerized:true")
+        return True
     
     return None
 
 
 def _extract_domain(text: str, hits: List[str]) -> Optional[str]:
     """Extract domain from text."""
-    # Domain patterns
-    domain_patterns = [
-        r'\bdomain\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
-        r'\bcustom domain\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
-        r'\b([a-zA-Z0-9.-]+\.(?:com|org|net|io|dev|app))\b'
-    ]
-    
-    for pattern in domain_patterns:
-        match = re.search(pattern, text)
+    for pattern in _DOMAIN_PATTERNS:
+        match = pattern.search(text)
         if match:
             domain = match.group(1)
             hits.append(f"domain:{domain}")
@@ -251,17 +341,9 @@ def _extract_domain(text: str, hits: List[str]) -> Optional[str]:
 
 def _extract_ssl(text: str, hits: List[str]) -> Optional[bool]:
     """Extract SSL/HTTPS preference from text."""
-    ssl_patterns = [
-        r'\bhttps\b',
-        r'\bssl\b',
-        r'\btls\b',
-        r'\bsecure\b'
-    ]
-    
-    for pattern in ssl_patterns:
-        if re.search(pattern, text):
-            hits.append("ssl:true")
-            return True
+    if _RE_SSL.search(text):
+        hits.append("ssl:true")
+        return True
     
     return None
 
@@ -273,33 +355,33 @@ def _extract_autoscaling(text: str, hits: List[str]) -> Tuple[Optional[bool], Op
     max_inst = None
     
     # Autoscaling detection
-    if re.search(r'\bautoscaling\b', text):
+    if _RE_AUTOSCALING.search(text):
         autoscale = True
         hits.append("autoscale:true")
     
     # Min instances
-    min_match = re.search(r'\bmin\s+(\d+)\b', text)
+    min_match = _RE_MIN_INSTANCES.search(text)
     if min_match:
         min_inst = int(min_match.group(1))
         hits.append(f"min_instances:{min_inst}")
         autoscale = True  # If min instances specified, enable autoscaling
     
     # Max instances
-    max_match = re.search(r'\bmax\s+(\d+)\b', text)
+    max_match = _RE_MAX_INSTANCES.search(text)
     if max_match:
         max_inst = int(max_match.group(1))
         hits.append(f"max_instances:{max_inst}")
         autoscale = True  # If max instances specified, enable autoscaling
     
     # Scale range
-    range_match = re.search(r'\bscale\s+to\s+(\d+)\b', text)
+    range_match = _RE_SCALE_TO.search(text)
     if range_match:
         max_inst = int(range_match.group(1))
         hits.append(f"scale_to:{max_inst}")
         autoscale = True  # If scale specified, enable autoscaling
     
     # Instance range
-    range_match = re.search(r'\b(\d+)\s*\.\.\s*(\d+)\b', text)
+    range_match = _RE_INSTANCE_RANGE.search(text)
     if range_match:
         min_inst = int(range_match.group(1))
         max_inst = int(range_match.group(2))
@@ -311,15 +393,8 @@ def _extract_autoscaling(text: str, hits: List[str]) -> Tuple[Optional[bool], Op
 
 def _extract_database(text: str, hits: List[str]) -> Optional[DatabaseConfig]:
     """Extract database configuration from text."""
-    db_patterns = [
-        (r'\bwith postgres\b|\bpostgresql\b', "postgres"),
-        (r'\bwith mysql\b', "mysql"),
-        (r'\bwith sqlite\b', "sqlite"),
-        (r'\bno db\b|\bno database\b|\bwithout database\b', "none")
-    ]
-    
-    for pattern, engine in db_patterns:
-        if re.search(pattern, text):
+    for pattern, engine in _DB_PATTERNS:
+        if pattern.search(text):
             hits.append(f"db:{engine}")
             return DatabaseConfig(engine=engine)
     
@@ -328,7 +403,7 @@ def _extract_database(text: str, hits: List[str]) -> Optional[DatabaseConfig]:
 
 def _extract_port(text: str, hits: List[str]) -> Optional[int]:
     """Extract port from text."""
-    port_match = re.search(r'\bport\s+(\d+)\b', text)
+    port_match = _RE_PORT.search(text)
     if port_match:
         port = int(port_match.group(1))
         hits.append(f"port:{port}")
@@ -338,13 +413,8 @@ def _extract_port(text: str, hits: List[str]) -> Optional[int]:
 
 def _extract_health_path(text: str, hits: List[str]) -> Optional[str]:
     """Extract health check path from text."""
-    health_patterns = [
-        r'\bhealth\s+(?:path\s+)?(/\S*)',
-        r'\bhealth\s+check\s+(?:path\s+)?(/\S*)'
-    ]
-    
-    for pattern in health_patterns:
-        match = re.search(pattern, text)
+    for pattern in _HEALTH_PATTERNS:
+        match = pattern.search(text)
         if match:
             path = match.group(1)
             hits.append(f"health_path:{path}")
@@ -357,28 +427,19 @@ def _extract_env_vars(text: str, hits: List[str]) -> Optional[Dict[str, str]]:
     """Extract environment variables from text."""
     env_vars = {}
     
-    # Conservative pattern for uppercase environment variables (case insensitive)
-    env_pattern = r'\b([A-Z][A-Z0-9_]*)\s*=\s*([^\s,]+)'
-    matches = re.findall(env_pattern, text, re.IGNORECASE)
-    
-    for key, value in matches:
-        env_vars[key.upper()] = value  # Normalize to uppercase
-        hits.append(f"env:{key.upper()}={value}")
+    # One sweep over the text yields every KEY=VALUE pair
+    for match in _RE_ENV.finditer(text):
+        key, value = match.group(1).upper(), match.group(2)  # Normalize key to uppercase
+        env_vars[key] = value
+        hits.append(f"env:{key}={value}")
     
     return env_vars if env_vars else None
 
 
 def _extract_ttl(text: str, hits: List[str]) -> Optional[int]:
     """Extract TTL from text."""
-    ttl_patterns = [
-        r'\b(\d+)\s*h\b',  # 24h
-        r'\b(\d+)\s*hours?\b',  # 24 hours
-        r'\bauto-destroy\s+in\s+(\d+)\s*h\b',  # auto-destroy in 24h
-        r'\bttl\s+(\d+)\s*h\b'  # ttl 24h
-    ]
-    
-    for pattern in ttl_patterns:
-        match = re.search(pattern, text)
+    for pattern in _TTL_PATTERNS:
+        match = pattern.search(text)
         if match:
             ttl = int(match.group(1))
             hits.append(f"ttl:{ttl}h")
@@ -2,7 +2,8 @@
 JSON Schema and dataclasses for NLP extraction results.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 import json
 
@@ -111,14 +112,14 @@ OVERRIDES_SCHEMA = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration."""
     engine: Optional[str] = None  # "postgres", "mysql", "sqlite", "none"
     size: Optional[str] = None    # Database instance size
 
 
-@dataclass
+@dataclass(slots=True)
 class Overrides:
     """Normalized deployment overrides extracted from instructions."""
     # Cloud and infrastructure
@@ -155,53 +156,69 @@ class Overrides:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        result = {}
-        for field_name, field_value in self.__dict__.items():
-            if field_value is not None:
-                if field_name == "db" and isinstance(field_value, DatabaseConfig):
-                    result[field_name] = {
-                        "engine": field_value.engine,
-                        "size": field_value.size
-                    }
-                else:
-                    result[field_name] = field_value
+        result = {
+            name: value
+            for name in _OVERRIDES_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+        if isinstance(self.db, DatabaseConfig):
+            result["db"] = {
+                "engine": self.db.engine,
+                "size": self.db.size
+            }
         return result
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Overrides":
         """Create from dictionary."""
+        # Missing keys fall back to the dataclass defaults
+        kwargs = {name: data[name] for name in _OVERRIDES_FIELDS if name in data}
+        
         # Handle database config
-        db_config = None
-        if "db" in data and data["db"]:
-            db_data = data["db"]
-            db_config = DatabaseConfig(
-                engine=db_data.get("engine"),
-                size=db_data.get("size")
-            )
+        db_data = kwargs.get("db")
+        kwargs["db"] = DatabaseConfig(
+            engine=db_data.get("engine"),
+            size=db_data.get("size")
+        ) if db_data else None
         
-        return cls(
-            cloud=data.get("cloud"),
-            infra=data.get("infra"),
-            region=data.get("region"),
-            instance_size=data.get("instance_size"),
-            instance_type=data.get("instance_type"),
-            containerized=data.get("containerized"),
-            domain=data.get("domain"),
-            ssl=data.get("ssl"),
-            autoscale=data.get("autoscale"),
-            min_instances=data.get("min_instances"),
-            max_instances=data.get("max_instances"),
-            port=data.get("port"),
-            health_path=data.get("health_path"),
-            db=db_config,
-            env_overrides=data.get("env_overrides"),
-            ttl_hours=data.get("ttl_hours"),
-            notes=data.get("notes", []),
-            confidence=data.get("confidence", 0.5)
-        )
+        return cls(**kwargs)
+    
+    def to_json(self) -> str:
+        """Serialize to JSON, reusing the string for identical overrides."""
+        return _dumps_frozen(_freeze(self.to_dict()))
+
+
+# Field names in declaration order, resolved once for to_dict/from_dict
+_OVERRIDES_FIELDS = tuple(f.name for f in fields(Overrides))
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists to hashable tuples, keeping order and types."""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    # Tag scalars with their type so True/1/1.0 do not share a cache entry
+    return (type(value), value)
 
 
-@dataclass
+def _thaw(frozen: Any) -> Any:
+    """Inverse of _freeze."""
+    kind, value = frozen
+    if kind is dict:
+        return {k: _thaw(v) for k, v in value}
+    if kind is list:
+        return [_thaw(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=256)
+def _dumps_frozen(frozen: Any) -> str:
+    """JSON-encode a frozen value once per distinct content."""
+    return json.dumps(_thaw(frozen))
+
+
+@dataclass(slots=True)
 class NLPReport:
     """Report of NLP extraction process and results."""
     assumptions: List[str] = field(default_factory=list)  # Defaults chosen
@@ -223,6 +240,19 @@ class NLPReport:
             "duration_ms": self.duration_ms,
             "confidence": self.confidence
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NLPReport":
+        """Create from dictionary."""
+        return cls(
+            assumptions=data.get("assumptions", []),
+            conflicts=data.get("conflicts", []),
+            raw_provider=data.get("raw_provider", ""),
+            raw_text_used=data.get("raw_text_used", ""),
+            passA_hits=data.get("passA_hits", []),
+            duration_ms=data.get("duration_ms", 0),
+            confidence=data.get("confidence", 0.0)
+        )
 
 
 def validate_overrides(overrides: Overrides) -> List[str]:
@@ -9,6 +9,7 @@ from .classify import FailureClassifier, FailureRule, Severity
 from .status import StatusDeriver, DeploymentStatus
 from .diag import DiagnosticReporter
 from .cw_links import CloudWatchLinkBuilder
+from .event_store import EventStore
 
 __all__ = [
     "StreamManager",
@@ -20,4 +21,5 @@ __all__ = [
     "DeploymentStatus",
     "DiagnosticReporter",
     "CloudWatchLinkBuilder",
+    "EventStore",
 ]
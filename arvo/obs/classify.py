@@ -3,6 +3,7 @@ Failure detection and classification system.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -34,6 +35,50 @@ class FailureClassifier:
     def __init__(self):
         self.rules = self._load_default_rules()
         self.detected_failures: Dict[str, FailureRule] = {}
+        self._compile_rules()
+    
+    def _compile_rules(self):
+        """
+        Fold every rule's regexes into one pattern matched once per message.
+        
+        Each rule becomes a lookahead alternative that scans the whole message,
+        tried in rule order, so the first rule with any matching regex wins
+        exactly as with a rule-by-rule search. Invalid regexes are skipped.
+        """
+        alternatives = []
+        for idx, rule in enumerate(self.rules):
+            patterns = []
+            for regex_pattern in rule.regexes:
+                try:
+                    re.compile(regex_pattern)
+                except re.error:
+                    continue
+                patterns.append(f"(?:{regex_pattern})")
+            if patterns:
+                alternatives.append(f"(?=(?s:.)*?(?:{'|'.join(patterns)}))(?P<r{idx}>)")
+        
+        try:
+            self._combined = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        except re.error:
+            # Patterns that cannot be embedded (e.g. clashing group names); scan rule by rule
+            self._combined = None
+        
+        # Static part of detect_failure's result, per rule
+        self._rule_meta = [
+            {
+                "reason_code": rule.id,
+                "name": rule.name,
+                "message": rule.message,
+                "hint": rule.hint,
+                "severity": rule.severity.value
+            }
+            for rule in self.rules
+        ]
+        self._compiled_rule_count = len(self.rules)
+        
+        # Classification is pure for a fixed rule set, so repeated log lines
+        # skip the regex scan; rebuilt (and thereby cleared) with the rules
+        self._match_cached = lru_cache(maxsize=10000)(self._match_rule)
     
     def _load_default_rules(self) -> List[FailureRule]:
         """Load default failure detection rules."""
@@ -216,13 +261,28 @@ class FailureClassifier:
     
     def classify_message(self, message: str, source: str = "unknown") -> Optional[FailureRule]:
         """Classify a log message and return the first matching failure rule."""
+        idx = self._classify_index(message)
+        return self.rules[idx] if idx is not None else None
+    
+    def _classify_index(self, message: str) -> Optional[int]:
+        """Return the index of the first rule matching message, if any."""
+        if self._compiled_rule_count != len(self.rules):
+            self._compile_rules()
+        return self._match_cached(message)
+    
+    def _match_rule(self, message: str) -> Optional[int]:
+        """Scan message against the compiled rules (uncached)."""
         message_lower = message.lower()
         
-        for rule in self.rules:
+        if self._combined is not None:
+            match = self._combined.match(message_lower)
+            return int(match.lastgroup[1:]) if match else None
+        
+        for idx, rule in enumerate(self.rules):
             for regex_pattern in rule.regexes:
                 try:
                     if re.search(regex_pattern, message_lower, re.IGNORECASE):
-                        return rule
+                        return idx
                 except re.error:
                     # Skip invalid regex patterns
                     continue
@@ -231,17 +291,16 @@ class FailureClassifier:
     
     def detect_failure(self, message: str, source: str = "unknown") -> Optional[Dict[str, Any]]:
         """Detect failure from a log message and return failure details."""
-        rule = self.classify_message(message, source)
+        idx = self._classify_index(message)
+        if idx is None:
+            return None
         
-        if rule and rule.id not in self.detected_failures:
+        rule = self.rules[idx]
+        if rule.id not in self.detected_failures:
             self.detected_failures[rule.id] = rule
             
             return {
-                "reason_code": rule.id,
-                "name": rule.name,
-                "message": rule.message,
-                "hint": rule.hint,
-                "severity": rule.severity.value,
+                **self._rule_meta[idx],
                 "source": source,
                 "original_message": message
             }
@@ -259,6 +318,7 @@ class FailureClassifier:
     def add_custom_rule(self, rule: FailureRule):
         """Add a custom failure detection rule."""
         self.rules.append(rule)
+        self._compile_rules()
     
     def get_rule_by_id(self, rule_id: str) -> Optional[FailureRule]:
         """Get a rule by its ID."""
@@ -3,8 +3,20 @@ CloudWatch and AWS console link builders.
 """
 
 import urllib.parse
+from functools import lru_cache
 from typing import Dict, Optional
 
+_CONSOLE = "https://console.aws.amazon.com"
+_LOG_GROUP_TPL = _CONSOLE + "/cloudwatch/home?region={region}#logsV2:log-groups/log-group/{group}"
+_LOG_STREAM_TPL = _LOG_GROUP_TPL + "/log-events/{stream}"
+_EC2_INSTANCE_TPL = _CONSOLE + "/ec2/home?region={region}#InstanceDetails:instanceId={instance_id}"
+
+
+@lru_cache(maxsize=512)
+def _encode(segment: str) -> str:
+    """Percent-encode a URL path segment; log group names repeat across links."""
+    return urllib.parse.quote(segment, safe='')
+
 
 class CloudWatchLinkBuilder:
     """Builds AWS console URLs for logs and resources."""
@@ -14,18 +26,17 @@ class CloudWatchLinkBuilder:
     
     def build_log_group_url(self, log_group: str) -> str:
         """Build CloudWatch log group console URL."""
-        encoded_group = urllib.parse.quote(log_group, safe='')
-        return f"https://console.aws.amazon.com/cloudwatch/home?region={self.region}#logsV2:log-groups/log-group/{encoded_group}"
+        return _LOG_GROUP_TPL.format(region=self.region, group=_encode(log_group))
     
     def build_log_stream_url(self, log_group: str, log_stream: str) -> str:
         """Build CloudWatch log stream console URL."""
-        encoded_group = urllib.parse.quote(log_group, safe='')
-        encoded_stream = urllib.parse.quote(log_stream, safe='')
-        return f"https://console.aws.amazon.com/cloudwatch/home?region={self.region}#logsV2:log-groups/log-group/{encoded_group}/log-events/{encoded_stream}"
+        return _LOG_STREAM_TPL.format(
+            region=self.region, group=_encode(log_group), stream=_encode(log_stream)
+        )
     
     def build_ec2_console_url(self, instance_id: str) -> str:
         """Build EC2 instance console URL."""
-        return f"https://console.aws.amazon.com/ec2/home?region={self.region}#InstanceDetails:instanceId={instance_id}"
+        return _EC2_INSTANCE_TPL.format(region=self.region, instance_id=instance_id)
     
     def build_ecs_service_url(self, cluster_name: str, service_name: str) -> str:
         """Build ECS service console URL."""
@@ -47,17 +58,20 @@ class CloudWatchLinkBuilder:
     
     def build_log_links(self, deployment_id: str, outputs: Dict[str, str]) -> Dict[str, str]:
         """Build comprehensive log links based on deployment outputs."""
-        links = {}
+        region = self.region
+        log_group = f"/arvo/{deployment_id}"
+        group = _encode(log_group)
         
         # CloudWatch log group (always present)
-        log_group = f"/arvo/{deployment_id}"
-        links["cloudwatch_group"] = self.build_log_group_url(log_group)
+        links = {"cloudwatch_group": _LOG_GROUP_TPL.format(region=region, group=group)}
         
-        # EC2 specific links
+        # EC2 specific links, sharing the encoded group
         if "instance_id" in outputs:
-            links["ec2_console"] = self.build_ec2_console_url(outputs["instance_id"])
-            links["ec2_cloud_init"] = self.build_log_stream_url(log_group, "ec2/cloud-init")
-            links["ec2_systemd"] = self.build_log_stream_url(log_group, "ec2/service")
+            links.update({
+                "ec2_console": _EC2_INSTANCE_TPL.format(region=region, instance_id=outputs["instance_id"]),
+                "ec2_cloud_init": _LOG_STREAM_TPL.format(region=region, group=group, stream=_encode("ec2/cloud-init")),
+                "ec2_systemd": _LOG_STREAM_TPL.format(region=region, group=group, stream=_encode("ec2/service")),
+            })
         
         # ECS specific links
         if "service_arn" in outputs:
@@ -67,7 +81,9 @@ class CloudWatchLinkBuilder:
                 cluster_name = arn_parts[1]
                 service_name = arn_parts[2]
                 links["ecs_service_console"] = self.build_ecs_service_url(cluster_name, service_name)
-                links["ecs_task_logs"] = self.build_log_stream_url(log_group, f"ecs/{service_name}")
+                links["ecs_task_logs"] = _LOG_STREAM_TPL.format(
+                    region=region, group=group, stream=_encode(f"ecs/{service_name}")
+                )
         
         # ALB specific links
         if "alb_arn" in outputs:
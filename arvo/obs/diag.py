@@ -2,10 +2,24 @@
 Diagnostic reporting and failure analysis.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import time
 
+from .event_store import EventStore
+
+# Last-event types that fix the reported status outright
+_TERMINAL_STATUS = {
+    "DONE": "healthy",
+    "ERROR": "failed",
+    "DESTROY_DONE": "destroyed",
+}
+
+_IN_PROGRESS_EVENTS = frozenset({"TF_APPLY_START", "BOOTSTRAP_WAIT"})
+
+# Failure severities that mark the deployment as failed
+_SEVERE = frozenset({"critical", "high"})
+
 
 @dataclass
 class DiagnosticReport:
@@ -40,11 +54,11 @@ class DiagnosticReporter:
     ) -> DiagnosticReport:
         """Generate comprehensive diagnostic report."""
         
-        # Analyze events for failures
-        failures = self._analyze_failures(events)
+        # Analyze events for failures, noting severe ones in the same pass
+        failures, has_severe = self._scan_events(events)
         
         # Determine overall status
-        status = self._determine_status(events, failures)
+        status = self._determine_status(events, failures, has_severe)
         
         # Generate summary
         summary = self._generate_summary(status, failures)
@@ -71,50 +85,67 @@ class DiagnosticReporter:
     
     def _analyze_failures(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Analyze events for failure patterns."""
+        return self._scan_events(events)[0]
+    
+    def _scan_events(self, events: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Collect failures from events in one pass.
+        
+        Returns:
+            Tuple of (failures sorted by severity, critical first;
+            whether any failure is high or critical severity)
+        """
+        if isinstance(events, EventStore):
+            failure_events = events.of_type("FAILURE_DETECTED")
+        else:
+            failure_events = [event for event in events if event.get("type") == "FAILURE_DETECTED"]
+        
         failures = []
+        has_severe = False
         
-        for event in events:
-            if event.get("type") == "FAILURE_DETECTED":
-                failure = {
-                    "reason_code": event.get("reason_code"),
-                    "message": event.get("message"),
-                    "hint": event.get("hint"),
-                    "severity": event.get("severity", "medium"),
-                    "timestamp": event.get("timestamp"),
-                    "source": event.get("source", "unknown")
-                }
-                failures.append(failure)
+        for event in failure_events:
+            severity = event.get("severity", "medium")
+            failures.append({
+                "reason_code": event.get("reason_code"),
+                "message": event.get("message"),
+                "hint": event.get("hint"),
+                "severity": severity,
+                "timestamp": event.get("timestamp"),
+                "source": event.get("source", "unknown")
+            })
+            has_severe = has_severe or severity in _SEVERE
         
         # Sort by severity (critical first)
-        failures.sort(key=lambda f: self.failure_priorities.get(f["severity"], 0), reverse=True)
+        priorities = self.failure_priorities
+        failures.sort(key=lambda f: priorities.get(f["severity"], 0), reverse=True)
         
-        return failures
+        return failures, has_severe
     
-    def _determine_status(self, events: List[Dict[str, Any]], failures: List[Dict[str, Any]]) -> str:
+    def _determine_status(
+        self,
+        events: List[Dict[str, Any]],
+        failures: List[Dict[str, Any]],
+        has_severe: Optional[bool] = None
+    ) -> str:
         """Determine overall deployment status."""
         if not events:
             return "unknown"
         
-        last_event = events[-1]
-        event_type = last_event.get("type", "")
+        event_type = events[-1].get("type", "")
         
         # Check for explicit status events
-        if event_type == "DONE":
-            return "healthy"
-        elif event_type == "ERROR":
-            return "failed"
-        elif event_type == "DESTROY_DONE":
-            return "destroyed"
+        status = _TERMINAL_STATUS.get(event_type)
+        if status:
+            return status
         
-        # Check for failures
-        if failures:
-            # Consider high and critical severity as failures
-            high_or_critical_failures = [f for f in failures if f["severity"] in ["critical", "high"]]
-            if high_or_critical_failures:
-                return "failed"
+        # Consider high and critical severity as failures
+        if has_severe is None:
+            has_severe = any(f["severity"] in _SEVERE for f in failures)
+        if has_severe:
+            return "failed"
         
         # Check for ongoing processes
-        if event_type in ["TF_APPLY_START", "BOOTSTRAP_WAIT"]:
+        if event_type in _IN_PROGRESS_EVENTS:
             return "in_progress"
         
         return "unknown"
@@ -177,7 +208,9 @@ class DiagnosticReporter:
         if outputs and "log_links" in outputs:
             try:
                 import json
-                log_links = json.loads(outputs["log_links"])
+                log_links = outputs["log_links"]
+                if isinstance(log_links, str):
+                    log_links = json.loads(log_links)
                 if "cloudwatch_group" in log_links:
                     sources.append({
                         "id": "cloudwatch_group",
@@ -234,8 +267,7 @@ class DiagnosticReporter:
         
         if report.recommendations:
             lines.append("💡 Recommendations:")
-            for i, rec in enumerate(report.recommendations, 1):
-                lines.append(f"  {i}. {rec}")
+            lines.extend(f"  {i}. {rec}" for i, rec in enumerate(report.recommendations, 1))
             lines.append("")
         
         if report.log_sources:
@@ -249,7 +281,6 @@ class DiagnosticReporter:
         
         if report.next_steps:
             lines.append("🎯 Next Steps:")
-            for i, step in enumerate(report.next_steps, 1):
-                lines.append(f"  {i}. {step}")
+            lines.extend(f"  {i}. {step}" for i, step in enumerate(report.next_steps, 1))
         
         return "\n".join(lines)
@@ -0,0 +1,62 @@
+"""
+Columnar storage for long deployment event streams.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class EventStore(Sequence):
+    """
+    Append-only events kept as parallel columns plus a per-type position index.
+
+    Behaves as a read-only sequence of the original event dicts, so it can be
+    passed anywhere a list of events is accepted, while lookups by event type
+    cost O(matches) instead of a scan over every event. Events are treated as
+    immutable once appended.
+    """
+
+    def __init__(self, events: Optional[Iterable[Dict[str, Any]]] = None):
+        self.types: List[str] = []
+        self.payloads: List[Dict[str, Any]] = []
+        self._positions: Dict[str, List[int]] = {}
+        if events is not None:
+            self.extend(events)
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Add an event to the end of the store."""
+        event_type = event.get("type", "")
+        self._positions.setdefault(event_type, []).append(len(self.payloads))
+        self.types.append(event_type)
+        self.payloads.append(event)
+
+    def extend(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Add events to the end of the store, in order."""
+        for event in events:
+            self.append(event)
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def __getitem__(self, index):
+        return self.payloads[index]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.payloads)
+
+    def positions(self, event_type: str) -> List[int]:
+        """Indices of the events of event_type, oldest first."""
+        return self._positions.get(event_type, [])
+
+    def of_type(self, event_type: str) -> List[Dict[str, Any]]:
+        """Events of event_type, oldest first."""
+        return [self.payloads[i] for i in self.positions(event_type)]
+
+    def last_position(self, event_types: Iterable[str]) -> Optional[int]:
+        """Index of the most recent event whose type is in event_types, if any."""
+        last = None
+        for event_type in event_types:
+            positions = self._positions.get(event_type)
+            if positions and (last is None or positions[-1] > last):
+                last = positions[-1]
+        return last
@@ -2,12 +2,16 @@
 Status derivation from events and log signals.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import json
 import time
 
+from .._json import loads as _loads
+from .event_store import EventStore
+
 
 class DeploymentStatus(Enum):
     """Deployment status states."""
@@ -24,6 +28,39 @@ class DeploymentStatus(Enum):
     DESTROYED = "destroyed"
 
 
+# Events that settle the deployment in a terminal status
+TERMINAL_MAP = {
+    "VERIFY_OK": DeploymentStatus.HEALTHY,
+    "DONE": DeploymentStatus.HEALTHY,
+    "ERROR": DeploymentStatus.FAILED,
+    "DESTROY_DONE": DeploymentStatus.DESTROYED,
+}
+
+# Events that move the deployment through its intermediate stages
+PROGRESS_MAP = {
+    "INIT": DeploymentStatus.INIT,
+    "TF_INIT": DeploymentStatus.TF_INIT,
+    "TF_PLAN": DeploymentStatus.TF_PLAN,
+    "TF_APPLY_START": DeploymentStatus.TF_APPLY,
+    "TF_APPLY_DONE": DeploymentStatus.BOOTSTRAPPING,
+    "BOOTSTRAP_WAIT": DeploymentStatus.BOOTSTRAPPING,
+    "DESTROY_START": DeploymentStatus.DESTROYING,
+}
+
+
+# Every event type that sets the status, for EventStore lookups
+_STATUS_EVENTS = {**PROGRESS_MAP, **TERMINAL_MAP}
+
+
+@lru_cache(maxsize=64)
+def _parse_links(raw: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse a log_links JSON object; status polls see the same string repeatedly."""
+    parsed = _loads(raw)
+    if not isinstance(parsed, dict):
+        raise TypeError("log_links must be a JSON object")
+    return tuple(parsed.items())
+
+
 @dataclass
 class StatusInfo:
     """Comprehensive status information."""
@@ -68,21 +105,19 @@ class StatusDeriver:
         event_type = last_event.get("type", "")
         timestamp = last_event.get("timestamp", time.time())
         
-        # Check for failure detection first
-        failure_info = self._check_for_failures(events)
-        if failure_info:
+        status, failure_event = self._reduce_events(events)
+        
+        # A detected failure overrides whatever stage was reached
+        if failure_event is not None:
             return StatusInfo(
                 status=DeploymentStatus.FAILED,
-                message=failure_info["message"],
+                message=failure_event.get("message"),
                 last_event=last_event,
-                failure_reason=failure_info["reason_code"],
-                failure_hint=failure_info["hint"],
+                failure_reason=failure_event.get("reason_code"),
+                failure_hint=failure_event.get("hint"),
                 timestamp=timestamp
             )
         
-        # Derive status from last significant event
-        status = self._derive_from_events(events)
-        
         # Get public URL and log links from outputs
         public_url = None
         log_links = None
@@ -99,43 +134,36 @@ class StatusDeriver:
             timestamp=timestamp
         )
     
-    def _check_for_failures(self, events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Check for FAILURE_DETECTED events."""
-        for event in reversed(events):  # Check most recent first
-            if event.get("type") == "FAILURE_DETECTED":
-                return {
-                    "reason_code": event.get("reason_code"),
-                    "message": event.get("message"),
-                    "hint": event.get("hint"),
-                    "severity": event.get("severity")
-                }
-        return None
-    
-    def _derive_from_events(self, events: List[Dict[str, Any]]) -> DeploymentStatus:
-        """Derive status from event sequence."""
-        # Map event types to status
-        event_to_status = {
-            "INIT": DeploymentStatus.INIT,
-            "TF_INIT": DeploymentStatus.TF_INIT,
-            "TF_PLAN": DeploymentStatus.TF_PLAN,
-            "TF_APPLY_START": DeploymentStatus.TF_APPLY,
-            "TF_APPLY_DONE": DeploymentStatus.BOOTSTRAPPING,
-            "BOOTSTRAP_WAIT": DeploymentStatus.BOOTSTRAPPING,
-            "VERIFY_OK": DeploymentStatus.HEALTHY,
-            "DONE": DeploymentStatus.HEALTHY,
-            "ERROR": DeploymentStatus.FAILED,
-            "DESTROY_START": DeploymentStatus.DESTROYING,
-            "DESTROY_DONE": DeploymentStatus.DESTROYED,
-        }
+    def _reduce_events(
+        self, events: List[Dict[str, Any]]
+    ) -> Tuple[DeploymentStatus, Optional[Dict[str, Any]]]:
+        """
+        Fold the event sequence into its latest status in a single pass.
+        
+        Returns:
+            Tuple of (status from the most recent significant event,
+            most recent FAILURE_DETECTED event or None)
+        """
+        if isinstance(events, EventStore):
+            # The type index answers both questions without walking the events
+            failure_pos = events.last_position(("FAILURE_DETECTED",))
+            status_pos = events.last_position(_STATUS_EVENTS)
+            status = _STATUS_EVENTS[events.types[status_pos]] if status_pos is not None else DeploymentStatus.QUEUED
+            return status, events[failure_pos] if failure_pos is not None else None
+        
+        status = DeploymentStatus.QUEUED
+        failure_event = None
         
-        # Find the most recent significant event
-        for event in reversed(events):
+        for event in events:
             event_type = event.get("type", "")
-            if event_type in event_to_status:
-                return event_to_status[event_type]
+            if event_type == "FAILURE_DETECTED":
+                failure_event = event
+            elif event_type in TERMINAL_MAP:
+                status = TERMINAL_MAP[event_type]
+            elif event_type in PROGRESS_MAP:
+                status = PROGRESS_MAP[event_type]
         
-        # Default to queued if no significant events
-        return DeploymentStatus.QUEUED
+        return status, failure_event
     
     def _get_status_message(self, status: DeploymentStatus, last_event: Dict[str, Any]) -> str:
         """Get human-readable status message."""
@@ -161,14 +189,18 @@ class StatusDeriver:
         
         return base_message
     
-    def _extract_log_links(self, outputs: Dict[str, str]) -> Dict[str, str]:
+    def _extract_log_links(self, outputs: Dict[str, Any]) -> Dict[str, str]:
         """Extract log links from outputs."""
         log_links = {}
         
-        # Look for log_links in outputs
-        if "log_links" in outputs:
+        # Look for log_links in outputs; in-process producers hand over a dict,
+        # external callers may still pass it as a JSON string
+        raw = outputs.get("log_links")
+        if isinstance(raw, dict):
+            log_links = dict(raw)
+        elif raw:
             try:
-                log_links = json.loads(outputs["log_links"])
+                log_links = dict(_parse_links(raw))
             except (json.JSONDecodeError, TypeError):
                 pass
         
@@ -11,8 +11,8 @@ from .state import (
     create_deployment_dir, write_env_json, write_outputs_json,
     read_env_json, read_outputs_json, deployment_exists
 )
-from .events import emit_event, EventTypes, get_status_from_events, read_events
-from .terraform import tf_init, tf_plan, tf_apply, tf_destroy, get_terraform_outputs, get_terraform_output
+from .events import emit_event, emit_events, EventTypes, get_status_from_events, read_events
+from .terraform import prepare_workdir, tf_init, tf_plan, tf_apply, tf_destroy, get_terraform_outputs_cached, get_terraform_output
 from arvo.selector import select_infra
 from arvo.analyzer.spec import DeploymentSpec
 from .obs import StreamManager, LogSource, FailureClassifier, StatusDeriver, CloudWatchLinkBuilder
@@ -54,18 +54,19 @@ def deploy(instructions: str, repo: str, region: str = "us-west-2", deployment_i
     if ttl_hours:
         tags = add_ttl_tags(tags, ttl_hours)
     
-    emit_event(deployment_id, EventTypes.INIT, {
-        "deployment_id": deployment_id,
-        "region": region,
-        "repo": repo,
-        "instructions": instructions,
-        "ttl_hours": ttl_hours
-    })
-    
-    emit_event(deployment_id, EventTypes.TAGS_APPLIED, {
-        "count": len(tags),
-        "sample": dict(list(tags.items())[:3])  # Show first 3 tags
-    })
+    emit_events(deployment_id, [
+        (EventTypes.INIT, {
+            "deployment_id": deployment_id,
+            "region": region,
+            "repo": repo,
+            "instructions": instructions,
+            "ttl_hours": ttl_hours
+        }),
+        (EventTypes.TAGS_APPLIED, {
+            "count": len(tags),
+            "sample": dict(list(tags.items())[:3])  # Show first 3 tags
+        })
+    ])
 
     # Stage 1: NLP extraction
     try:
@@ -76,29 +77,29 @@ def deploy(instructions: str, repo: str, region: str = "us-west-2", deployment_i
             timeout_s=15.0
         )
         
-        emit_event(deployment_id, EventTypes.NLP_PASS_A, {
-            "hits": nlp_report.passA_hits
-        })
-        
-        emit_event(deployment_id, EventTypes.NLP_PASS_B, {
-            "provider": nlp_report.raw_provider,
-            "model": nlp_report.raw_provider.split(":")[1] if ":" in nlp_report.raw_provider else "default",
-            "used_examples": 3,  # We use 3 examples
-            "took_ms": nlp_report.duration_ms
-        })
-        
-        emit_event(deployment_id, EventTypes.NLP_OVERRIDES, {
-            "cloud": nlp_overrides.cloud,
-            "infra": nlp_overrides.infra,
-            "region": nlp_overrides.region,
-            "size": nlp_overrides.instance_size,
-            "domain": nlp_overrides.domain,
-            "ssl": nlp_overrides.ssl,
-            "autoscale": nlp_overrides.autoscale,
-            "confidence": nlp_overrides.confidence,
-            "assumptions": nlp_report.assumptions,
-            "conflicts": nlp_report.conflicts
-        })
+        emit_events(deployment_id, [
+            (EventTypes.NLP_PASS_A, {
+                "hits": nlp_report.passA_hits
+            }),
+            (EventTypes.NLP_PASS_B, {
+                "provider": nlp_report.raw_provider,
+                "model": nlp_report.raw_provider.split(":")[1] if ":" in nlp_report.raw_provider else "default",
+                "used_examples": 3,  # We use 3 examples
+                "took_ms": nlp_report.duration_ms
+            }),
+            (EventTypes.NLP_OVERRIDES, {
+                "cloud": nlp_overrides.cloud,
+                "infra": nlp_overrides.infra,
+                "region": nlp_overrides.region,
+                "size": nlp_overrides.instance_size,
+                "domain": nlp_overrides.domain,
+                "ssl": nlp_overrides.ssl,
+                "autoscale": nlp_overrides.autoscale,
+                "confidence": nlp_overrides.confidence,
+                "assumptions": nlp_report.assumptions,
+                "conflicts": nlp_report.conflicts
+            })
+        ])
         
         # Merge NLP overrides with user-provided overrides
         if nlp_overrides.ttl_hours and not ttl_hours:
@@ -209,39 +210,41 @@ def deploy(instructions: str, repo: str, region: str = "us-west-2", deployment_i
         recipe_plan = None
 
     try:
-        # Terraform workflow
-        if not tf_init(deployment_id):
-            return _create_error_result(deployment_id, "Terraform init failed")
+        # Terraform workflow (files are copied once and one log handle is
+        # shared by init/plan/apply)
+        deployment_dir = prepare_workdir(deployment_id)
         
-        if not tf_plan(deployment_id):
-            return _create_error_result(deployment_id, "Terraform plan failed")
-        
-        # Cost estimation before apply
-        try:
-            from .state import get_deployment_dir
-            deployment_dir = get_deployment_dir(deployment_id)
-            stack_path = str(deployment_dir / "terraform")
+        with open(deployment_dir / "terraform.log", "a") as tf_log:
+            if not tf_init(deployment_id, log_file=tf_log):
+                return _create_error_result(deployment_id, "Terraform init failed")
             
-            cost_data = estimate_cost(stack_path, region)
-            emit_event(deployment_id, EventTypes.COST_HINT, cost_data)
-        except Exception as e:
-            # Don't fail deployment if cost estimation fails
-            emit_event(deployment_id, EventTypes.COST_HINT, {
-                "method": "error",
-                "monthly_usd": None,
-                "error": str(e)
-            })
-        
-        # Use recipe plan variables if available
-        tf_vars = {"tags": tags}
-        if recipe_plan:
-            tf_vars.update(recipe_plan.vars)
-            # Add user_data if available (separate from tags)
-            if recipe_plan.user_data:
-                tf_vars["user_data"] = recipe_plan.user_data
-        
-        if not tf_apply(deployment_id, tf_vars):
-            return _create_error_result(deployment_id, "Terraform apply failed")
+            if not tf_plan(deployment_id, log_file=tf_log):
+                return _create_error_result(deployment_id, "Terraform plan failed")
+            
+            # Cost estimation before apply
+            try:
+                stack_path = str(deployment_dir / "terraform")
+                
+                cost_data = estimate_cost(stack_path, region)
+                emit_event(deployment_id, EventTypes.COST_HINT, cost_data)
+            except Exception as e:
+                # Don't fail deployment if cost estimation fails
+                emit_event(deployment_id, EventTypes.COST_HINT, {
+                    "method": "error",
+                    "monthly_usd": None,
+                    "error": str(e)
+                })
+            
+            # Use recipe plan variables if available
+            tf_vars = {"tags": tags}
+            if recipe_plan:
+                tf_vars.update(recipe_plan.vars)
+                # Add user_data if available (separate from tags)
+                if recipe_plan.user_data:
+                    tf_vars["user_data"] = recipe_plan.user_data
+            
+            if not tf_apply(deployment_id, tf_vars, log_file=tf_log):
+                return _create_error_result(deployment_id, "Terraform apply failed")
         
         # Wait for bootstrap
         emit_event(deployment_id, EventTypes.BOOTSTRAP_WAIT, {
@@ -249,7 +252,7 @@ def deploy(instructions: str, repo: str, region: str = "us-west-2", deployment_i
         })
         
         # Get outputs
-        outputs = get_terraform_outputs(deployment_id)
+        outputs = get_terraform_outputs_cached(deployment_id)
         write_outputs_json(deployment_id, outputs)
         
         public_url = get_terraform_output(deployment_id, "application_url")
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import time
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Tuple
 
 from arvo.analyzer.spec import DeploymentSpec
 from arvo.selector.plan import InfraPlan
 from .report import PatchResult
-from .rewrites import rewrite_file
+from .rewrites import SAFE_EXT, rewrite_safe_file
 from .commands import synthesize_start
 from .systemd import generate_systemd_unit
 from .container import generate_container_cmd, generate_container_entrypoint
@@ -14,6 +17,89 @@ from .cors import decide_cors
 from .health import normalize_health_path
 
 
+# Files that need no (further) patching, as path -> (stat signature, digest)
+# when last seen. Patched files carry MARK and untouched ones matched no
+# rewrite, so a file whose signature is unchanged can be skipped without
+# rescanning it.
+_SETTLED_FILES: Dict[str, Tuple[Tuple[int, int, int, int], Optional[bytes]]] = {}
+_SETTLED_FILES_MAX = 10_000
+
+# A file changed this recently may change again within the same timestamp tick
+# without its stat changing, so such "racy" files also record a content digest
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _signature(st: os.stat_result) -> Tuple[int, int, int, int]:
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _digest(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+    except OSError:
+        return None
+
+
+def _is_racy(st: os.stat_result) -> bool:
+    return time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) < _RACY_WINDOW_NS
+
+
+def _settle(path: str, st: os.stat_result) -> None:
+    if len(_SETTLED_FILES) >= _SETTLED_FILES_MAX:
+        del _SETTLED_FILES[next(iter(_SETTLED_FILES))]
+    _SETTLED_FILES[path] = (_signature(st), _digest(path) if _is_racy(st) else None)
+
+
+def _is_settled(path: str, st: os.stat_result) -> bool:
+    """Check whether path is unchanged since it was settled."""
+    entry = _SETTLED_FILES.get(path)
+    if entry is None or entry[0] != _signature(st):
+        return False
+    if entry[1] is None:
+        return True
+    if _digest(path) != entry[1]:
+        return False
+    # Verified by content; once out of the racy window the stat alone suffices
+    if not _is_racy(st):
+        _SETTLED_FILES[path] = (entry[0], None)
+    return True
+
+
+def _iter_safe_files(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yield (path, stat) for rewrite candidates under root, in the order
+    Path.rglob("*") visits them.
+    
+    os.scandir entries carry their file type, so only files with a safe
+    extension cost a stat (for the size limit).
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs: List[str] = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            if not entry.is_file():
+                continue
+            if os.path.splitext(entry.name)[1].lower() not in SAFE_EXT:
+                continue
+            st = entry.stat()
+            if st.st_size < 1_000_000:
+                yield entry.path, st
+        except OSError:
+            continue
+
+    for subdir in subdirs:
+        yield from _iter_safe_files(subdir)
+
+
 def apply_patches(
     spec: DeploymentSpec,
     plan: InfraPlan,
@@ -27,10 +113,17 @@ def apply_patches(
 
     # 1) Rewrites over safe files
     default_port = spec.port or 8080
-    for p in ws.rglob("*"):
-        ch = rewrite_file(p, default_port, service_origin=service_origin, force_origin=spec.multi_service)
+    for p, st in _iter_safe_files(str(ws)):
+        if _is_settled(p, st):
+            continue
+        ch = rewrite_safe_file(Path(p), default_port, service_origin=service_origin, force_origin=spec.multi_service)
         if ch:
             changes.extend([f"{p}: {c}" for c in ch])
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+        _settle(p, st)
 
     # 2) CORS decision
     cors_mode, cors_notes = decide_cors(spec.multi_service)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Set, Tuple, Optional
 
 MARK = "ARVO_PATCH"
 
@@ -10,6 +10,17 @@ SAFE_EXT = {".py", ".js", ".ts", ".jsx", ".tsx", ".json", ".html", ".env", ".tom
 
 LOCALHOST_URL = re.compile(r"http://(localhost|127\.0\.0\.1):\d+/?")
 
+LOOPBACK_BIND = re.compile(r"(['\"])(127\.0\.0\.1|localhost)(['\"])")
+
+# Both host rewrites as one substitution table applied in a single pass. Their
+# matches never overlap (URLs start at "http://", binds at a quote), so this
+# equals running the URL rewrite and then the bind rewrite.
+HOST_REWRITES = re.compile(rf"(?P<url>{LOCALHOST_URL.pattern})|(?P<bind>{LOOPBACK_BIND.pattern})")
+
+# Tokens the rewrites below depend on, grouped by the rewrites they enable:
+# "host" for the localhost URL and loopback bind rewrites, "port" for ensure_env_port
+PATCH_SCAN = re.compile(rb"(?P<host>localhost|127\.0\.0\.1)|(?P<port>port|listen\()")
+
 
 def is_safe_file(path: Path) -> bool:
     if not path.is_file():
@@ -42,12 +53,36 @@ def replace_localhost_with_origin(text: str, placeholder: str) -> Tuple[str, Lis
 
 def replace_loopback_binds(text: str) -> Tuple[str, List[str]]:
     changes: List[str] = []
-    new = re.sub(r"(['\"])(127\.0\.0\.1|localhost)(['\"])", r"'0.0.0.0'", text)
+    new = LOOPBACK_BIND.sub("'0.0.0.0'", text)
     if new != text:
         changes.append(f"{MARK}: bind=0.0.0.0")
     return new, changes
 
 
+def rewrite_hosts(text: str, placeholder: Optional[str] = None) -> Tuple[str, List[str]]:
+    """
+    Apply the localhost URL and loopback bind rewrites in one pass.
+    
+    URLs become relative, or point at placeholder when one is given;
+    the change notes match the individual replace_* helpers.
+    """
+    url_replacement = f"{placeholder}/" if placeholder else "/"
+    fired: Set[str] = set()
+
+    def _replace(m: re.Match) -> str:
+        fired.add(m.lastgroup)
+        return url_replacement if m.lastgroup == "url" else "'0.0.0.0'"
+
+    text = HOST_REWRITES.sub(_replace, text)
+
+    changes: List[str] = []
+    if "url" in fired:
+        changes.append(f"{MARK}: api_base={'service_origin' if placeholder else 'relative'}")
+    if "bind" in fired:
+        changes.append(f"{MARK}: bind=0.0.0.0")
+    return text, changes
+
+
 def ensure_env_port(text: str, default_port: int) -> Tuple[str, List[str]]:
     changes: List[str] = []
     # Python: app.run(port=5000) → env default
@@ -64,37 +99,61 @@ def ensure_env_port(text: str, default_port: int) -> Tuple[str, List[str]]:
 def rewrite_file(path: Path, default_port: int, service_origin: Optional[str] = None, force_origin: bool = False) -> List[str]:
     if not is_safe_file(path):
         return []
+    return rewrite_safe_file(path, default_port, service_origin=service_origin, force_origin=force_origin)
+
+
+def scan_triggers(data: bytes) -> Set[str]:
+    """Return which PATCH_SCAN groups occur in data, in one pass over the bytes."""
+    found: Set[str] = set()
+    for m in PATCH_SCAN.finditer(data):
+        found.add(m.lastgroup)
+        if len(found) == 2:
+            break
+    return found
+
+
+def _decode(data: bytes) -> str:
+    """Decode like Path.read_text(encoding="utf-8", errors="ignore"), newlines included."""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def rewrite_safe_file(path: Path, default_port: int, service_origin: Optional[str] = None, force_origin: bool = False) -> List[str]:
+    """Rewrite a file the caller has already checked with is_safe_file (or equivalent)."""
     try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
+        with open(path, "rb") as f:
+            data = f.read()
     except Exception:
         return []
 
+    triggers = scan_triggers(data)
+    if not triggers:
+        return []
+    content = _decode(data)
+
     if MARK in content:
         return []  # already patched
 
     changed = False
     changes: List[str] = []
 
-    if force_origin and service_origin:
-        new, ch = replace_localhost_with_origin(content, "${SERVICE_ORIGIN}")
-    else:
-        new, ch = replace_localhost_with_relative(content)
-    if ch:
-        content = new
-        changes.extend(ch)
-        changed = True
-
-    new, ch = replace_loopback_binds(content)
-    if ch:
-        content = new
-        changes.extend(ch)
-        changed = True
-
-    new, ch = ensure_env_port(content, default_port)
-    if ch:
-        content = new
-        changes.extend(ch)
-        changed = True
+    if "host" in triggers:
+        placeholder = "${SERVICE_ORIGIN}" if force_origin and service_origin else None
+        new, ch = rewrite_hosts(content, placeholder)
+        if ch:
+            content = new
+            changes.extend(ch)
+            changed = True
+
+    # None of the host rewrites introduce a port token, so the scan still holds
+    if "port" in triggers:
+        new, ch = ensure_env_port(content, default_port)
+        if ch:
+            content = new
+            changes.extend(ch)
+            changed = True
 
     if changed:
         content = content + f"\n# {MARK}\n"
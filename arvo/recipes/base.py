@@ -4,11 +4,77 @@ Base recipe interface and common helpers.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+_SCORE_CACHE_MAX = 256
+
+# Manifest sniffing table read by the recipes' applies():
+# signal -> (manifest name, or None for any manifest; substrings; case-sensitive)
+SIGNAL_TOKENS: Dict[str, Tuple[Optional[str], Tuple[str, ...], bool]] = {
+    "flask_requirements": ("requirements.txt", ("flask",), False),
+    "flask_pyproject": ("pyproject.toml", ("Flask",), True),
+    "flask_code": (None, ("from flask import", "flask("), False),
+    "fastapi_requirements": ("requirements.txt", ("fastapi",), False),
+    "fastapi_pyproject": ("pyproject.toml", ("fastapi",), False),
+    "fastapi_code": (None, ("from fastapi import", "fastapi("), False),
+    "django_requirements": ("requirements.txt", ("django",), False),
+    "django_pyproject": ("pyproject.toml", ("django",), False),
+    "django_code": (None, ("from django", "django"), False),
+    "express_package": ("package.json", ("express",), False),
+    "express_code": (None, ("require('express')", "import express"), True),
+    "next_package": ("package.json", ("next",), False),
+    "next_code": (None, ("from 'next'", "import next"), True),
+    "export_code": (None, ("export",), False),
+    "docker_code": (None, ("docker",), False),
+}
+
+
+def precompute_signals(spec) -> Dict[str, bool]:
+    """
+    Evaluate SIGNAL_TOKENS against the spec's manifests.
+    
+    Each manifest is lowercased once here instead of once per recipe check,
+    and repeated manifests reuse the previous result.
+    
+    Args:
+        spec: DeploymentSpec from analyzer
+        
+    Returns:
+        Mapping of signal name to whether any of its substrings occur
+        (shared between calls; treat as read-only)
+    """
+    return _signals_for_manifests(_manifest_key(spec))
+
+
+@lru_cache(maxsize=_SCORE_CACHE_MAX)
+def _signals_for_manifests(manifest_items: Tuple[Tuple[str, str], ...]) -> Dict[str, bool]:
+    """Evaluate SIGNAL_TOKENS for one set of manifests (cached per manifests)."""
+    manifests = dict(manifest_items)
+    lowered = {name: content.lower() for name, content in manifests.items()}
+    
+    signals = {}
+    for signal, (manifest, tokens, case_sensitive) in SIGNAL_TOKENS.items():
+        texts = manifests if case_sensitive else lowered
+        contents = texts.values() if manifest is None else (texts.get(manifest, ""),)
+        signals[signal] = any(token in content for content in contents for token in tokens)
+    return signals
+
+
+def _manifest_key(spec) -> Tuple[Tuple[str, str], ...]:
+    """Hashable, order-independent form of the spec's manifests."""
+    return tuple(sorted(spec.manifests.items()))
+
+
+def _spec_key(spec, manifest_key: Optional[Tuple[Tuple[str, str], ...]] = None) -> Tuple:
+    """Key on every spec field a recipe's applies() reads."""
+    if manifest_key is None:
+        manifest_key = _manifest_key(spec)
+    return (spec.runtime, spec.framework, spec.containerized, manifest_key)
+
 
 @dataclass
 class RecipePlan:
@@ -29,18 +95,41 @@ class Recipe(ABC):
     """Abstract base class for deployment recipes."""
     
     @abstractmethod
-    def applies(self, spec) -> int:
+    def applies(self, spec, signals: Optional[Dict[str, bool]] = None) -> int:
         """
         Return score (0..100) for how well this recipe fits the spec.
         
         Args:
             spec: DeploymentSpec from analyzer
+            signals: precompute_signals(spec), computed here when omitted
             
         Returns:
             Score from 0-100, where 100 is perfect match
         """
         pass
     
+    def score(self, spec, signals: Optional[Dict[str, bool]] = None, key: Optional[Tuple] = None) -> int:
+        """
+        Memoized applies(): repeated specs with the same runtime, framework,
+        containerization and manifests are scored once per recipe.
+        
+        Args:
+            spec: DeploymentSpec from analyzer
+            signals: precompute_signals(spec), shared across recipes
+            key: _spec_key(spec), shared across recipes
+            
+        Returns:
+            Score from 0-100, as returned by applies()
+        """
+        cache: Dict[Tuple, int] = self.__dict__.setdefault("_score_cache", {})
+        if key is None:
+            key = _spec_key(spec)
+        if key not in cache:
+            if len(cache) >= _SCORE_CACHE_MAX:
+                del cache[next(iter(cache))]
+            cache[key] = self.applies(spec, signals)
+        return cache[key]
+    
     @abstractmethod
     def plan(self, spec, infra_plan, patch_result, env_inject, repo_url: str = None) -> RecipePlan:
         """
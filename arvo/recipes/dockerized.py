@@ -2,19 +2,22 @@
 Dockerfile-based application recipe for ECS Fargate deployment.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import os
 import subprocess
 import boto3
 from pathlib import Path
-from .base import Recipe, RecipePlan, get_default_port, get_health_path
+from .base import Recipe, RecipePlan, precompute_signals, get_default_port, get_health_path
 
 
 class DockerizedRecipe(Recipe):
     """Recipe for Dockerfile-based applications on ECS Fargate."""
     
-    def applies(self, spec) -> int:
+    def applies(self, spec, signals: Optional[Dict[str, bool]] = None) -> int:
         """Score how well this recipe fits the Dockerized spec."""
+        if signals is None:
+            signals = precompute_signals(spec)
+        
         score = 0
         
         # Check for containerization
@@ -30,7 +33,7 @@ class DockerizedRecipe(Recipe):
             score += 30
         
         # Check for container-related files
-        if any("docker" in content.lower() for content in spec.manifests.values()):
+        if signals["docker_code"]:
             score += 20
         
         # Prefer containerized deployments
@@ -2,19 +2,22 @@
 Next.js static export recipe for S3 + CloudFront deployment.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import os
 import subprocess
 import shutil
 from pathlib import Path
-from .base import Recipe, RecipePlan
+from .base import Recipe, RecipePlan, precompute_signals
 
 
 class NextStaticRecipe(Recipe):
     """Recipe for Next.js static export to S3 + CloudFront."""
     
-    def applies(self, spec) -> int:
+    def applies(self, spec, signals: Optional[Dict[str, bool]] = None) -> int:
         """Score how well this recipe fits the Next.js static spec."""
+        if signals is None:
+            signals = precompute_signals(spec)
+        
         score = 0
         
         # Check runtime
@@ -28,7 +31,7 @@ class NextStaticRecipe(Recipe):
             score += 50
         elif spec.framework is None:
             # Check for Next.js in manifests
-            if "next" in spec.manifests.get("package.json", "").lower():
+            if signals["next_package"]:
                 score += 40
         
         # Check for Next.js specific files
@@ -36,12 +39,11 @@ class NextStaticRecipe(Recipe):
             score += 20
         
         # Check for Next.js imports in code
-        if any("from 'next'" in content or "import next" in content 
-               for content in spec.manifests.values()):
+        if signals["next_code"]:
             score += 20
         
         # Prefer static export capability
-        if any("export" in content.lower() for content in spec.manifests.values()):
+        if signals["export_code"]:
             score += 10
         
         return min(score, 100)
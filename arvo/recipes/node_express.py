@@ -2,15 +2,18 @@
 Node.js/Express application recipe for EC2 deployment.
 """
 
-from typing import Dict, List, Any
-from .base import Recipe, RecipePlan, get_default_port, get_health_path, create_user_data_template, create_node_install_commands, create_start_command
+from typing import Dict, List, Any, Optional
+from .base import Recipe, RecipePlan, precompute_signals, get_default_port, get_health_path, create_user_data_template, create_node_install_commands, create_start_command
 
 
 class NodeExpressRecipe(Recipe):
     """Recipe for Node.js/Express applications on EC2."""
     
-    def applies(self, spec) -> int:
+    def applies(self, spec, signals: Optional[Dict[str, bool]] = None) -> int:
         """Score how well this recipe fits the Node.js/Express spec."""
+        if signals is None:
+            signals = precompute_signals(spec)
+        
         score = 0
         
         # Check runtime
@@ -24,7 +27,7 @@ class NodeExpressRecipe(Recipe):
             score += 50
         elif spec.framework is None:
             # Check for Express in manifests
-            if "express" in spec.manifests.get("package.json", "").lower():
+            if signals["express_package"]:
                 score += 40
         
         # Check for package.json
@@ -32,8 +35,7 @@ class NodeExpressRecipe(Recipe):
             score += 20
         
         # Check for Express imports in code
-        if any("require('express')" in content or "import express" in content 
-               for content in spec.manifests.values()):
+        if signals["express_code"]:
             score += 20
         
         # Prefer non-containerized
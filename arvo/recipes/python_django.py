@@ -2,15 +2,18 @@
 Django application recipe for EC2 deployment.
 """
 
-from typing import Dict, List, Any
-from .base import Recipe, RecipePlan, get_default_port, get_health_path, create_user_data_template, create_python_install_commands, create_start_command
+from typing import Dict, List, Any, Optional
+from .base import Recipe, RecipePlan, precompute_signals, get_default_port, get_health_path, create_user_data_template, create_python_install_commands, create_start_command
 
 
 class DjangoRecipe(Recipe):
     """Recipe for Django applications on EC2."""
     
-    def applies(self, spec) -> int:
+    def applies(self, spec, signals: Optional[Dict[str, bool]] = None) -> int:
         """Score how well this recipe fits the Django spec."""
+        if signals is None:
+            signals = precompute_signals(spec)
+        
         score = 0
         
         # Check runtime
@@ -24,9 +27,9 @@ class DjangoRecipe(Recipe):
             score += 50
         elif spec.framework is None:
             # Check for Django in manifests
-            if "django" in spec.manifests.get("requirements.txt", "").lower():
+            if signals["django_requirements"]:
                 score += 40
-            elif "django" in spec.manifests.get("pyproject.toml", "").lower():
+            elif signals["django_pyproject"]:
                 score += 40
         
         # Check for Django-specific files
@@ -34,8 +37,7 @@ class DjangoRecipe(Recipe):
             score += 30
         
         # Check for Django imports in code
-        if any("from django" in content.lower() or "django" in content.lower() 
-               for content in spec.manifests.values()):
+        if signals["django_code"]:
             score += 20
         
         # Prefer non-containerized
@@ -2,15 +2,18 @@
 Flask application recipe for EC2 deployment.
 """
 
-from typing import Dict, List, Any
-from .base import Recipe, RecipePlan, get_default_port, get_health_path, create_user_data_template, create_python_install_commands, create_start_command
+from typing import Dict, List, Any, Optional
+from .base import Recipe, RecipePlan, precompute_signals, get_default_port, get_health_path, create_user_data_template, create_python_install_commands, create_start_command
 
 
 class FlaskRecipe(Recipe):
     """Recipe for Flask applications on EC2."""
     
-    def applies(self, spec) -> int:
+    def applies(self, spec, signals: Optional[Dict[str, bool]] = None) -> int:
         """Score how well this recipe fits the Flask spec."""
+        if signals is None:
+            signals = precompute_signals(spec)
+        
         score = 0
         
         # Check runtime
@@ -24,14 +27,13 @@ class FlaskRecipe(Recipe):
             score += 50
         elif spec.framework is None:
             # Check for Flask in manifests
-            if "flask" in spec.manifests.get("requirements.txt", "").lower():
+            if signals["flask_requirements"]:
                 score += 40
-            elif "Flask" in spec.manifests.get("pyproject.toml", ""):
+            elif signals["flask_pyproject"]:
                 score += 40
         
         # Check for Flask imports in code
-        if any("from flask import" in content.lower() or "flask(" in content.lower() 
-               for content in spec.manifests.values()):
+        if signals["flask_code"]:
             score += 20
         
         # Prefer non-containerized
@@ -2,29 +2,43 @@
 Recipe registry for selecting the best recipe based on DeploymentSpec and InfraPlan.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from importlib import import_module
+from typing import List, Optional, Tuple
 import logging
 
-from .base import Recipe
-from .python_flask import FlaskRecipe
-from .python_fastapi import FastAPIRecipe
-from .python_django import DjangoRecipe
-from .node_express import NodeExpressRecipe
-from .next_static import NextStaticRecipe
-from .dockerized import DockerizedRecipe
+from .base import Recipe, _manifest_key, _signals_for_manifests, _spec_key
 
 logger = logging.getLogger(__name__)
 
 
-# Registry of all available recipes
-AVAILABLE_RECIPES: List[Recipe] = [
-    FlaskRecipe(),
-    FastAPIRecipe(),
-    DjangoRecipe(),
-    NodeExpressRecipe(),
-    NextStaticRecipe(),
-    DockerizedRecipe()
-]
+# Registry of all available recipes as (module, class), in priority order.
+# Recipe modules pull in heavy dependencies (boto3 for DockerizedRecipe),
+# so they are imported on first use rather than with the registry.
+_RECIPE_SPECS: Tuple[Tuple[str, str], ...] = (
+    (".python_flask", "FlaskRecipe"),
+    (".python_fastapi", "FastAPIRecipe"),
+    (".python_django", "DjangoRecipe"),
+    (".node_express", "NodeExpressRecipe"),
+    (".next_static", "NextStaticRecipe"),
+    (".dockerized", "DockerizedRecipe"),
+)
+
+
+@lru_cache(maxsize=None)
+def available_recipes() -> Tuple[Recipe, ...]:
+    """Instantiate every registered recipe once; the singletons keep their score caches."""
+    return tuple(
+        getattr(import_module(module, __package__), class_name)()
+        for module, class_name in _RECIPE_SPECS
+    )
+
+
+def __getattr__(name: str):
+    # AVAILABLE_RECIPES stays importable as before, resolved lazily (PEP 562)
+    if name == "AVAILABLE_RECIPES":
+        return available_recipes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def select_recipe(spec, infra_plan) -> Optional[Recipe]:
@@ -40,10 +54,14 @@ def select_recipe(spec, infra_plan) -> Optional[Recipe]:
     """
     logger.info(f"Selecting recipe for {spec.runtime}/{spec.framework} app")
     
-    # Score all recipes
+    # Score all recipes with one cache key; the manifests are only sniffed
+    # (lowercased and searched) the first time they are seen
+    manifest_key = _manifest_key(spec)
+    key = _spec_key(spec, manifest_key)
+    signals = _signals_for_manifests(manifest_key)
     recipe_scores = []
-    for recipe in AVAILABLE_RECIPES:
-        score = recipe.applies(spec)
+    for recipe in available_recipes():
+        score = recipe.score(spec, signals, key)
         recipe_scores.append((recipe, score))
         logger.debug(f"Recipe {recipe.__class__.__name__}: score {score}")
     
@@ -62,12 +80,12 @@ def select_recipe(spec, infra_plan) -> Optional[Recipe]:
 
 def list_available_recipes() -> List[str]:
     """List all available recipe names."""
-    return [recipe.__class__.__name__ for recipe in AVAILABLE_RECIPES]
+    return [recipe.__class__.__name__ for recipe in available_recipes()]
 
 
 def get_recipe_by_name(name: str) -> Optional[Recipe]:
     """Get a specific recipe by name."""
-    for recipe in AVAILABLE_RECIPES:
+    for recipe in available_recipes():
         if recipe.__class__.__name__.lower().replace("recipe", "") == name.lower():
             return recipe
     return None
@@ -3,12 +3,21 @@ Smoke testing system for deployed applications.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated probes of one deployment reuse keep-alive connections
+# instead of paying DNS + TCP + TLS setup per request; retries stay ours
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 class SmokeTestResult:
     """Result of a smoke test."""
@@ -40,68 +49,16 @@ def run_smoke_test(public_url: str, smoke_checks: List[Dict], max_retries: int =
     # Ensure public_url doesn't end with /
     public_url = public_url.rstrip('/')
     
-    failed_checks = []
-    successful_checks = []
+    # Checks are independent and network-bound, so probe them concurrently;
+    # map() keeps results in check order
+    with ThreadPoolExecutor(max_workers=min(8, len(smoke_checks))) as executor:
+        results = list(executor.map(
+            lambda check: _run_check_with_retries(public_url, check, max_retries, retry_delay),
+            smoke_checks
+        ))
     
-    for check in smoke_checks:
-        path = check.get("path", "/")
-        expected_status = check.get("expect", 200)
-        expected_content = check.get("contains")
-        max_tries = check.get("max_tries", max_retries)
-        
-        # Convert single status to list for easier handling
-        if isinstance(expected_status, int):
-            expected_status = [expected_status]
-        
-        logger.info(f"Testing {path} (expecting status {expected_status})")
-        
-        success = False
-        last_error = None
-        
-        for attempt in range(max_tries):
-            try:
-                # Make request
-                url = f"{public_url}{path}"
-                response = requests.get(url, timeout=10)
-                
-                # Check status code
-                if response.status_code in expected_status:
-                    # Check content if specified
-                    if expected_content:
-                        if expected_content in response.text:
-                            success = True
-                            break
-                        else:
-                            last_error = f"Expected content '{expected_content}' not found in response"
-                    else:
-                        success = True
-                        break
-                else:
-                    last_error = f"Expected status {expected_status}, got {response.status_code}"
-                
-            except requests.exceptions.RequestException as e:
-                last_error = f"Request failed: {str(e)}"
-            
-            if attempt < max_tries - 1:
-                logger.debug(f"Attempt {attempt + 1} failed, retrying in {retry_delay}s...")
-                time.sleep(retry_delay)
-        
-        if success:
-            successful_checks.append({
-                "path": path,
-                "status": response.status_code,
-                "content_check": expected_content is not None
-            })
-            logger.info(f"✅ {path} passed")
-        else:
-            failed_checks.append({
-                "path": path,
-                "expected_status": expected_status,
-                "expected_content": expected_content,
-                "error": last_error,
-                "attempts": max_tries
-            })
-            logger.error(f"❌ {path} failed: {last_error}")
+    successful_checks = [details for passed, details in results if passed]
+    failed_checks = [details for passed, details in results if not passed]
     
     # Determine overall result
     if failed_checks:
@@ -126,6 +83,79 @@ def run_smoke_test(public_url: str, smoke_checks: List[Dict], max_retries: int =
         )
 
 
+def _run_check_with_retries(public_url: str, check: Dict, max_retries: int, retry_delay: int) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Run one smoke check, retrying until it passes or its attempts run out.
+    
+    Args:
+        public_url: Base URL of the deployed application, without trailing /
+        check: Single smoke check configuration
+        max_retries: Default number of attempts when the check sets no max_tries
+        retry_delay: Delay between retries in seconds
+        
+    Returns:
+        Tuple of (passed, details for the successful or failed checks list)
+    """
+    path = check.get("path", "/")
+    expected_status = check.get("expect", 200)
+    expected_content = check.get("contains")
+    max_tries = check.get("max_tries", max_retries)
+    
+    # Convert single status to list for easier handling
+    if isinstance(expected_status, int):
+        expected_status = [expected_status]
+    
+    logger.info(f"Testing {path} (expecting status {expected_status})")
+    
+    success = False
+    last_error = None
+    
+    for attempt in range(max_tries):
+        try:
+            # Make request
+            url = f"{public_url}{path}"
+            response = _session.get(url, timeout=10)
+            
+            # Check status code
+            if response.status_code in expected_status:
+                # Check content if specified
+                if expected_content:
+                    if expected_content in response.text:
+                        success = True
+                        break
+                    else:
+                        last_error = f"Expected content '{expected_content}' not found in response"
+                else:
+                    success = True
+                    break
+            else:
+                last_error = f"Expected status {expected_status}, got {response.status_code}"
+            
+        except requests.exceptions.RequestException as e:
+            last_error = f"Request failed: {str(e)}"
+        
+        if attempt < max_tries - 1:
+            logger.debug(f"Attempt {attempt + 1} failed, retrying in {retry_delay}s...")
+            time.sleep(retry_delay)
+    
+    if success:
+        logger.info(f"✅ {path} passed")
+        return True, {
+            "path": path,
+            "status": response.status_code,
+            "content_check": expected_content is not None
+        }
+    
+    logger.error(f"❌ {path} failed: {last_error}")
+    return False, {
+        "path": path,
+        "expected_status": expected_status,
+        "expected_content": expected_content,
+        "error": last_error,
+        "attempts": max_tries
+    }
+
+
 def run_single_smoke_check(public_url: str, check: Dict, timeout: int = 10) -> Dict[str, Any]:
     """
     Run a single smoke check.
@@ -148,7 +178,7 @@ def run_single_smoke_check(public_url: str, check: Dict, timeout: int = 10) -> D
     
     try:
         url = f"{public_url.rstrip('/')}{path}"
-        response = requests.get(url, timeout=timeout)
+        response = _session.get(url, timeout=timeout)
         
         result = {
             "path": path,
@@ -3,10 +3,100 @@ Smart deployment system that actually uses LLM responses effectively.
 """
 
 import os
+import re
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 
+# Shared session so repeated LLM calls reuse pooled keep-alive connections.
+# The LLM calls are POSTs, which urllib3 does not retry unless allowed; once
+# retries run out the last response is returned for the status check below.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Captures the payload of a ```json ... ``` (or bare ```) fenced LLM response
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+def _extract_json(text: str) -> str:
+    """Strip a markdown code fence from an LLM response, if present."""
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+# Patterns for instructions regular enough to plan without the LLM; URLs are
+# removed first so e.g. "https://github.com/..." does not read as an SSL request
+_URL_RE = re.compile(r"\b[a-z][a-z0-9+.-]*://\S+", re.IGNORECASE)
+_REGION_RE = re.compile(r"\b(?:us|eu|ap|sa|ca|af|me)-[a-z]+-\d\b", re.IGNORECASE)
+_INSTANCE_RE = re.compile(r"\b[tmcrdi]\d[a-z]?\.(?:nano|micro|small|medium|large|xlarge|\d+xlarge)\b", re.IGNORECASE)
+_FRAMEWORK_RE = re.compile(r"\b(flask|django|fastapi|express|rails)\b", re.IGNORECASE)
+_SSL_RE = re.compile(r"\b(?:ssl|tls|https)\b", re.IGNORECASE)
+_DATABASE_RE = re.compile(r"\b(?:postgres(?:ql)?|mysql|redis)\b", re.IGNORECASE)
+_AUTOSCALE_RE = re.compile(r"\bauto-?scal", re.IGNORECASE)
+_MONITORING_RE = re.compile(r"\b(?:cloudwatch|monitoring)\b", re.IGNORECASE)
+
+FRAMEWORK_PORTS = {"flask": 5000, "django": 8000, "fastapi": 8000, "express": 3000, "rails": 3000}
+
+
+def _try_rule_parse(instructions: str) -> Optional[Dict[str, Any]]:
+    """
+    Build a deployment plan from instructions without calling the LLM.
+    
+    Args:
+        instructions: Natural language instructions
+        
+    Returns:
+        Deployment plan, or None when the instructions do not name both a
+        region and a framework
+    """
+    instructions = _URL_RE.sub(" ", instructions)
+    region = _REGION_RE.search(instructions)
+    framework = _FRAMEWORK_RE.search(instructions)
+    if not region or not framework:
+        return None
+    
+    framework_name = framework.group(1).lower()
+    instance = _INSTANCE_RE.search(instructions)
+    ssl = bool(_SSL_RE.search(instructions))
+    needs_database = bool(_DATABASE_RE.search(instructions))
+    monitoring = bool(_MONITORING_RE.search(instructions))
+    
+    deployment_steps = ["provision_vm", "install_dependencies", "deploy_app"]
+    if ssl:
+        deployment_steps.append("configure_ssl")
+    
+    return {
+        "infrastructure_type": "scaled_vm" if _AUTOSCALE_RE.search(instructions) else "simple_vm",
+        "instance_config": {
+            "type": instance.group(0).lower() if instance else "t2.micro",
+            "count": 1,
+            "region": region.group(0).lower()
+        },
+        "application_config": {
+            "framework": framework_name,
+            "port": FRAMEWORK_PORTS[framework_name],
+            "needs_database": needs_database
+        },
+        "security_config": {"ssl": ssl, "custom_domain": None, "firewall_rules": []},
+        "monitoring_config": {"enabled": monitoring, "alerts": []},
+        "deployment_steps": deployment_steps
+    }
+
+
 def get_free_llm_response(prompt: str, provider: str = "groq") -> str:
     """
     Get LLM response using free APIs.
@@ -24,11 +114,12 @@ def get_free_llm_response(prompt: str, provider: str = "groq") -> str:
             return "No Groq API key found"
         
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 "https://api.groq.com/openai/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
+                    "Content-Type": "application/json",
+                    "Connection": "keep-alive"
                 },
                 json={
                     "model": "llama3-8b-8192",  # Free model
@@ -53,9 +144,9 @@ def get_free_llm_response(prompt: str, provider: str = "groq") -> str:
             return "No Hugging Face API key found"
         
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 "https://api-inference.huggingface.co/models/microsoft/DialoGPT-medium",
-                headers={"Authorization": f"Bearer {api_key}"},
+                headers={"Authorization": f"Bearer {api_key}", "Connection": "keep-alive"},
                 json={"inputs": prompt},
                 timeout=10
             )
@@ -81,6 +172,11 @@ def smart_analyze_instructions(instructions: str) -> Dict[str, Any]:
     Returns:
         Deployment plan with specific actions
     """
+    # Regular instructions (region + framework named) need no LLM round-trip
+    plan = _try_rule_parse(instructions)
+    if plan is not None:
+        return plan
+    
     prompt = f"""
     Analyze these deployment instructions and create a specific deployment plan:
     
@@ -101,12 +197,7 @@ def smart_analyze_instructions(instructions: str) -> Dict[str, Any]:
     
     try:
         # Try to parse JSON from LLM response
-        if llm_response.startswith("```json"):
-            llm_response = llm_response.replace("```json", "").replace("```", "").strip()
-        elif llm_response.startswith("```"):
-            llm_response = llm_response.replace("```", "").strip()
-        
-        plan = json.loads(llm_response)
+        plan = json.loads(_extract_json(llm_response))
         return plan
         
     except json.JSONDecodeError:
@@ -150,12 +241,7 @@ def smart_analyze_repository(repo_url: str) -> Dict[str, Any]:
     llm_response = get_free_llm_response(prompt)
     
     try:
-        if llm_response.startswith("```json"):
-            llm_response = llm_response.replace("```json", "").replace("```", "").strip()
-        elif llm_response.startswith("```"):
-            llm_response = llm_response.replace("```", "").strip()
-        
-        analysis = json.loads(llm_response)
+        analysis = json.loads(_extract_json(llm_response))
         return analysis
         
     except json.JSONDecodeError:
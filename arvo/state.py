@@ -4,6 +4,7 @@ State management for deployments.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -18,8 +19,13 @@ def get_arvo_home() -> Path:
     Returns:
         Path: Arvo home directory
     """
-    arvo_home = os.environ.get("ARVO_HOME", ".arvo")
-    return Path(arvo_home).resolve()
+    return _resolve_home(os.environ.get("ARVO_HOME", ".arvo"), os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _resolve_home(arvo_home: str, cwd: str) -> Path:
+    """Resolve ARVO_HOME once per (value, working directory) pair."""
+    return (Path(cwd) / arvo_home).resolve()
 
 
 def get_deployment_dir(deployment_id: str) -> Path:
@@ -2,8 +2,13 @@
 Tagging utilities for consistent resource tagging across deployments.
 """
 
+import re
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+# "key=value", split at the first "="; surrounding whitespace is trimmed later
+_TAG_RE = re.compile(r"([^=]*)=(.*)", re.DOTALL)
 
 
 def base_tags(deployment_id: str, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
@@ -43,19 +48,20 @@ def parse_user_tags(tag_strings: list[str]) -> Dict[str, str]:
     Raises:
         ValueError: If tag string format is invalid
     """
-    tags = {}
+    return dict(_split_tag(tag_str) for tag_str in tag_strings)
+
+
+def _split_tag(tag_str: str) -> Tuple[str, str]:
+    """Split one "key=value" tag string, raising ValueError if it is malformed."""
+    match = _TAG_RE.fullmatch(tag_str)
+    if match is None:
+        raise ValueError(f"Invalid tag format: {tag_str}. Expected 'key=value'")
     
-    for tag_str in tag_strings:
-        if "=" not in tag_str:
-            raise ValueError(f"Invalid tag format: {tag_str}. Expected 'key=value'")
-        
-        key, value = tag_str.split("=", 1)
-        if not key.strip() or not value.strip():
-            raise ValueError(f"Invalid tag format: {tag_str}. Key and value must not be empty")
-        
-        tags[key.strip()] = value.strip()
+    key, value = match.group(1).strip(), match.group(2).strip()
+    if not key or not value:
+        raise ValueError(f"Invalid tag format: {tag_str}. Key and value must not be empty")
     
-    return tags
+    return key, value
 
 
 def add_ttl_tags(tags: Dict[str, str], ttl_hours: int) -> Dict[str, str]:
@@ -75,6 +81,8 @@ def add_ttl_tags(tags: Dict[str, str], ttl_hours: int) -> Dict[str, str]:
     tags_with_ttl = tags.copy()
     tags_with_ttl["ttl_hours"] = str(ttl_hours)
     tags_with_ttl["expires_at"] = expires_iso
+    # Integer epoch copy so expiry checks can skip ISO parsing
+    tags_with_ttl["expires_at_epoch"] = str(int(time.time()) + ttl_hours * 3600)
     
     return tags_with_ttl
 
@@ -89,6 +97,13 @@ def is_expired(tags: Dict[str, str]) -> bool:
     Returns:
         True if resource is expired, False otherwise
     """
+    epoch = tags.get("expires_at_epoch")
+    if epoch is not None:
+        try:
+            return int(epoch) < int(time.time())
+        except ValueError:
+            pass  # Fall back to the ISO timestamp
+    
     if "expires_at" not in tags:
         return False
     
@@ -3,21 +3,68 @@ Terraform wrapper functions for deployment orchestration.
 """
 
 import os
+import asyncio
+import copy
 import subprocess
 import shutil
 import json
 from pathlib import Path
-from typing import Dict, Any, Generator, Tuple
+from typing import Dict, Any, Generator, Optional, TextIO, Tuple
 
 from .state import get_deployment_dir
 from .events import emit_event, EventTypes
 
+# Exit codes of `terraform plan -detailed-exitcode` that mean success
+# (0 = no changes, 2 = changes present)
+PLAN_OK_CODES = (0, 2)
+
+# Per-process cache of terraform outputs: deployment_id -> (tfstate mtime_ns, outputs)
+_OUTPUTS_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Marker touched whenever the terraform files have been copied into a deployment dir
+PREPARED_SENTINEL = ".arvo_prepared"
+
+# Terraform files copied from the current directory, alongside infra/
+TERRAFORM_FILES = ("main.tf", "variables.tf", "outputs.tf", "bootstrap.sh")
+
+
+def prepare_workdir(deployment_id: str) -> Path:
+    """
+    Copy terraform files into the deployment directory when they have changed.
+    
+    Subsequent terraform commands for the deployment reuse the copied files
+    until a source file is modified after the last copy.
+    
+    Args:
+        deployment_id: Deployment ID
+        
+    Returns:
+        Path: Prepared deployment directory
+    """
+    deployment_dir = get_deployment_dir(deployment_id)
+    sentinel = deployment_dir / PREPARED_SENTINEL
+    
+    try:
+        prepared_ns = sentinel.stat().st_mtime_ns
+    except FileNotFoundError:
+        prepared_ns = None
+    
+    # Only mark the directory prepared once something was copied, so running
+    # from a directory without terraform files does not block a later copy
+    if prepared_ns is None or _latest_source_mtime_ns() >= prepared_ns:
+        if _copy_terraform_files(deployment_dir):
+            sentinel.touch()
+    
+    return deployment_dir
+
 
 def _run_terraform_command(
     deployment_id: str, 
     command: list[str], 
     event_type: str,
-    success_data: Dict[str, Any] = None
+    success_data: Dict[str, Any] = None,
+    log_file: Optional[TextIO] = None,
+    ok_codes: Tuple[int, ...] = (0,)
 ) -> Tuple[bool, str]:
     """
     Run a terraform command and emit events.
@@ -27,15 +74,13 @@ def _run_terraform_command(
         command: Terraform command to run
         event_type: Event type to emit on success
         success_data: Additional data for success event
+        log_file: Open terraform log handle to reuse (opened per call if None)
+        ok_codes: Process exit codes treated as success
         
     Returns:
         Tuple of (success, output)
     """
-    deployment_dir = get_deployment_dir(deployment_id)
-    terraform_log = deployment_dir / "terraform.log"
-    
-    # Copy terraform files to deployment directory
-    _copy_terraform_files(deployment_dir)
+    deployment_dir = prepare_workdir(deployment_id)
     
     try:
         # Run terraform command
@@ -49,24 +94,16 @@ def _run_terraform_command(
             universal_newlines=True
         )
         
-        output_lines = []
-        with open(terraform_log, "a") as log_file:
-            log_file.write(f"=== {' '.join(command)} ===\n")
-            
-            for line in process.stdout:
-                line = line.rstrip()
-                output_lines.append(line)
-                log_file.write(line + "\n")
-                log_file.flush()
-                
-                # Emit line events for apply command
-                if "apply" in command and line.strip():
-                    emit_event(deployment_id, EventTypes.TF_APPLY_LINE, {"line": line})
+        if log_file is None:
+            with open(deployment_dir / "terraform.log", "a") as own_log:
+                output_lines = _stream_output(deployment_id, command, process, own_log)
+        else:
+            output_lines = _stream_output(deployment_id, command, process, log_file)
         
         process.wait()
         output = "\n".join(output_lines)
         
-        if process.returncode == 0:
+        if process.returncode in ok_codes:
             # Success
             data = success_data or {}
             emit_event(deployment_id, event_type, data)
@@ -89,21 +126,83 @@ def _run_terraform_command(
         return False, str(e)
 
 
-def _copy_terraform_files(deployment_dir: Path) -> None:
+def _stream_output(
+    deployment_id: str,
+    command: list[str],
+    process: subprocess.Popen,
+    log_file: TextIO
+) -> list[str]:
+    """
+    Stream terraform output into the log file and collect its lines.
+    
+    Args:
+        deployment_id: Deployment ID
+        command: Terraform command being run
+        process: Running terraform process
+        log_file: Open terraform log handle
+        
+    Returns:
+        List of output lines
+    """
+    output_lines = []
+    log_file.write(f"=== {' '.join(command)} ===\n")
+    
+    for line in process.stdout:
+        line = line.rstrip()
+        output_lines.append(line)
+        log_file.write(line + "\n")
+        log_file.flush()
+        
+        # Emit line events for apply command
+        if "apply" in command and line.strip():
+            emit_event(deployment_id, EventTypes.TF_APPLY_LINE, {"line": line})
+    
+    return output_lines
+
+
+def _latest_source_mtime_ns() -> int:
+    """Get the newest modification time among the terraform source files (0 if none)."""
+    latest = 0
+    
+    for file_name in TERRAFORM_FILES:
+        try:
+            latest = max(latest, os.stat(file_name).st_mtime_ns)
+        except OSError:
+            continue
+    
+    stack = ["infra"]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    latest = max(latest, entry.stat().st_mtime_ns)
+        except OSError:
+            continue
+    
+    return latest
+
+
+def _copy_terraform_files(deployment_dir: Path) -> bool:
     """
     Copy terraform files to deployment directory.
     
     Args:
         deployment_dir: Deployment directory
+        
+    Returns:
+        True if any file or the infra directory was copied
     """
-    # Find terraform files in current directory
-    terraform_files = ["main.tf", "variables.tf", "outputs.tf", "bootstrap.sh"]
+    copied = False
     
-    for file_name in terraform_files:
+    # Find terraform files in current directory
+    for file_name in TERRAFORM_FILES:
         src_file = Path(file_name)
         if src_file.exists():
             dst_file = deployment_dir / file_name
             shutil.copy2(src_file, dst_file)
+            copied = True
     
     # Copy the infra directory if it exists
     infra_dir = Path("infra")
@@ -112,6 +211,9 @@ def _copy_terraform_files(deployment_dir: Path) -> None:
         if dst_infra.exists():
             shutil.rmtree(dst_infra)
         shutil.copytree(infra_dir, dst_infra)
+        copied = True
+    
+    return copied
 
 
 def _write_tfvars(deployment_id: str, tfvars: Dict[str, Any]) -> None:
@@ -129,12 +231,13 @@ def _write_tfvars(deployment_id: str, tfvars: Dict[str, Any]) -> None:
         json.dump(tfvars, f, indent=2)
 
 
-def tf_init(deployment_id: str) -> bool:
+def tf_init(deployment_id: str, log_file: Optional[TextIO] = None) -> bool:
     """
     Run terraform init.
     
     Args:
         deployment_id: Deployment ID
+        log_file: Open terraform log handle to reuse
         
     Returns:
         True if successful
@@ -143,50 +246,83 @@ def tf_init(deployment_id: str) -> bool:
         deployment_id,
         ["terraform", "init", "-upgrade", "-no-color"],
         EventTypes.TF_INIT,
-        {"ok": True}
+        {"ok": True},
+        log_file=log_file
     )
     return success
 
 
-def tf_plan(deployment_id: str) -> bool:
+def tf_plan(deployment_id: str, log_file: Optional[TextIO] = None) -> bool:
     """
     Run terraform plan.
     
     Args:
         deployment_id: Deployment ID
+        log_file: Open terraform log handle to reuse
         
     Returns:
         True if successful
     """
     success, output = _run_terraform_command(
         deployment_id,
-        ["terraform", "plan", "-no-color"],
-        EventTypes.TF_PLAN
+        ["terraform", "plan", "-no-color", "-json", "-detailed-exitcode"],
+        EventTypes.TF_PLAN,
+        log_file=log_file,
+        ok_codes=PLAN_OK_CODES
     )
     
     if success:
-        # Parse plan output for resource counts
-        adds = output.count("will be created")
-        changes = output.count("will be updated")
-        destroys = output.count("will be destroyed")
-        
-        emit_event(deployment_id, EventTypes.TF_PLAN, {
-            "adds": adds,
-            "changes": changes,
-            "destroys": destroys,
-            "ok": True
-        })
+        counts = _count_planned_changes(output)
+        counts["ok"] = True
+        emit_event(deployment_id, EventTypes.TF_PLAN, counts)
     
     return success
 
 
-def tf_apply(deployment_id: str, tf_vars: Dict[str, Any] = None) -> bool:
+def _count_planned_changes(output: str) -> Dict[str, int]:
+    """
+    Count resource actions from `terraform plan -json` output.
+    
+    Args:
+        output: Machine-readable plan output (one JSON message per line)
+        
+    Returns:
+        Dictionary with adds, changes and destroys counts
+    """
+    counts = {"adds": 0, "changes": 0, "destroys": 0}
+    
+    for line in output.splitlines():
+        if '"planned_change"' not in line:
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if message.get("type") != "planned_change":
+            continue
+        
+        action = message.get("change", {}).get("action")
+        if action == "create":
+            counts["adds"] += 1
+        elif action == "update":
+            counts["changes"] += 1
+        elif action == "delete":
+            counts["destroys"] += 1
+        elif action == "replace":
+            counts["adds"] += 1
+            counts["destroys"] += 1
+    
+    return counts
+
+
+def tf_apply(deployment_id: str, tf_vars: Dict[str, Any] = None, log_file: Optional[TextIO] = None) -> bool:
     """
     Run terraform apply.
     
     Args:
         deployment_id: Deployment ID
         tf_vars: Terraform variables to write
+        log_file: Open terraform log handle to reuse
         
     Returns:
         True if successful
@@ -201,7 +337,8 @@ def tf_apply(deployment_id: str, tf_vars: Dict[str, Any] = None) -> bool:
         deployment_id,
         ["terraform", "apply", "-auto-approve", "-no-color"],
         EventTypes.TF_APPLY_DONE,
-        {"ok": True}
+        {"ok": True},
+        log_file=log_file
     )
     
     return success
@@ -250,7 +387,6 @@ def get_terraform_outputs(deployment_id: str) -> Dict[str, Any]:
             check=True
         )
         
-        import json
         return json.loads(result.stdout)
         
     except subprocess.CalledProcessError as e:
@@ -267,33 +403,108 @@ def get_terraform_outputs(deployment_id: str) -> Dict[str, Any]:
         return {}
 
 
-def get_terraform_output(deployment_id: str, output_name: str) -> str:
+def get_terraform_outputs_cached(deployment_id: str) -> Dict[str, Any]:
     """
-    Get a specific terraform output value.
+    Get terraform outputs, reusing the last result while the state is unchanged.
+    
+    The cache is invalidated whenever terraform.tfstate is modified. Callers
+    get their own copy, so mutating it does not affect later reads.
     
     Args:
         deployment_id: Deployment ID
-        output_name: Name of the output
         
     Returns:
-        Output value as string
+        Dictionary of terraform outputs
+    """
+    return copy.deepcopy(_cached_outputs(deployment_id))
+
+
+def _cached_outputs(deployment_id: str) -> Dict[str, Any]:
+    """Get the shared cached terraform outputs (must not be mutated)."""
+    state_file = get_deployment_dir(deployment_id) / "terraform.tfstate"
+    
+    try:
+        mtime_ns = state_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    
+    cached = _OUTPUTS_CACHE.get(deployment_id)
+    if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    outputs = get_terraform_outputs(deployment_id)
+    if mtime_ns is not None and outputs:
+        _OUTPUTS_CACHE[deployment_id] = (mtime_ns, outputs)
+    
+    return outputs
+
+
+async def aget_terraform_outputs(deployment_id: str) -> Dict[str, Any]:
+    """
+    Get terraform outputs as JSON without blocking the event loop.
+    
+    Args:
+        deployment_id: Deployment ID
+        
+    Returns:
+        Dictionary of terraform outputs
     """
     deployment_dir = get_deployment_dir(deployment_id)
     
     try:
-        result = subprocess.run(
-            ["terraform", "output", "-raw", output_name],
+        process = await asyncio.create_subprocess_exec(
+            "terraform", "output", "-json",
             cwd=deployment_dir,
-            capture_output=True,
-            text=True,
-            check=True
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        stdout, stderr = await process.communicate()
+    except OSError as e:
+        emit_event(deployment_id, EventTypes.ERROR, {
+            "reason": f"Failed to get terraform outputs: {str(e)}",
+            "hint": "Check terraform installation and permissions"
+        })
+        return {}
+    
+    if process.returncode != 0:
+        emit_event(deployment_id, EventTypes.ERROR, {
+            "reason": f"Failed to get terraform outputs: {stderr.decode(errors='replace')}",
+            "hint": "Terraform apply may have failed"
+        })
+        return {}
+    
+    try:
+        return json.loads(stdout)
+    except json.JSONDecodeError as e:
+        emit_event(deployment_id, EventTypes.ERROR, {
+            "reason": f"Failed to parse terraform outputs: {str(e)}",
+            "hint": "Terraform output format may be unexpected"
+        })
+        return {}
+
+
+def get_terraform_output(deployment_id: str, output_name: str) -> str:
+    """
+    Get a specific terraform output value.
+    
+    Args:
+        deployment_id: Deployment ID
+        output_name: Name of the output
         
-        return result.stdout.strip()
-        
-    except subprocess.CalledProcessError as e:
+    Returns:
+        Output value as string
+    """
+    outputs = _cached_outputs(deployment_id)
+    
+    if output_name not in outputs:
+        # get_terraform_outputs already reported a failed load with its stderr
+        if not outputs:
+            return ""
         emit_event(deployment_id, EventTypes.ERROR, {
-            "reason": f"Failed to get terraform output '{output_name}': {e.stderr}",
-            "hint": "Output may not exist or terraform apply may have failed"
+            "reason": f"Failed to get terraform output '{output_name}'",
+            "hint": "Output may not be defined by this terraform stack"
         })
         return ""
+    
+    value = outputs[output_name].get("value", "")
+    return value if isinstance(value, str) else json.dumps(value)
@@ -3,18 +3,46 @@ TTL (Time To Live) management for automatic deployment cleanup.
 """
 
 import json
+import os
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 import logging
 
-from .state import get_deployment_dir, list_deployments
+try:
+    import fcntl
+except ImportError:  # Windows: journal writers are not serialized
+    fcntl = None
+
+from ._json import dumps as _dumps, loads as _loads
+from .state import get_arvo_home, get_deployment_dir, list_deployments
 from .tags import is_expired
 # Note: We'll import destroy dynamically to avoid circular imports
 
 logger = logging.getLogger(__name__)
 
+# Global TTL registry journal: one JSON record per line, last write wins
+TTL_JOURNAL_NAME = "ttl.jsonl"
+
+# Whole-file registry written by earlier versions; folded into the journal once
+LEGACY_TTL_REGISTRY_NAME = "ttl.json"
+
+# Rewrite the journal once it holds this many times more lines than live entries
+JOURNAL_COMPACT_FACTOR = 4
+JOURNAL_COMPACT_MIN_LINES = 64
+
+# Maximum number of expired deployments destroyed concurrently by a sweep
+SWEEP_MAX_WORKERS = 8
+
+# Deployment IDs already reported as having a legacy TTL entry
+_LEGACY_TTL_WARNED: set = set()
+
 
 def schedule_ttl_deployment(deployment_id: str, ttl_hours: int) -> Dict[str, Any]:
     """
@@ -30,20 +58,20 @@ def schedule_ttl_deployment(deployment_id: str, ttl_hours: int) -> Dict[str, Any
     deployment_dir = get_deployment_dir(deployment_id)
     ttl_file = deployment_dir / "ttl.json"
     
-    expires_at = datetime.utcnow().timestamp() + (ttl_hours * 3600)
+    now = datetime.utcnow()
+    expires_at = now.timestamp() + (ttl_hours * 3600)
     expires_iso = datetime.fromtimestamp(expires_at).isoformat() + "Z"
     
     ttl_data = {
         "deployment_id": deployment_id,
         "ttl_hours": ttl_hours,
-        "scheduled_at": datetime.utcnow().isoformat() + "Z",
+        "scheduled_at": now.isoformat() + "Z",
         "expires_at": expires_iso,
         "expires_timestamp": expires_at
     }
     
     # Write TTL data to deployment directory
-    with open(ttl_file, 'w') as f:
-        json.dump(ttl_data, f, indent=2)
+    ttl_file.write_bytes(_dumps(ttl_data))
     
     # Also write to global TTL registry
     _update_global_ttl_registry(deployment_id, ttl_data)
@@ -62,26 +90,50 @@ def run_ttl_sweep() -> Dict[str, Any]:
     destroyed_count = 0
     failed_count = 0
     
-    # Get all deployments
-    deployment_ids = list_deployments()
+    # Only deployments in the TTL registry can expire; fall back to scanning
+    # every deployment when no registry has been written yet
+    if _ttl_journal_file().exists() or _legacy_ttl_registry_file().exists():
+        registry = _cached_ttl_registry()
+        total_checked = len(registry)
+        expired_candidates = _expired_registry_entries(registry, time.time())
+    else:
+        deployment_ids = list_deployments()
+        total_checked = len(deployment_ids)
+        expired_candidates = []
+        now = time.time()
+        
+        for deployment_id in deployment_ids:
+            try:
+                # Check if deployment has TTL
+                ttl_data = _get_ttl_data(deployment_id)
+                if ttl_data and _is_deployment_expired(ttl_data, now):
+                    expired_candidates.append(deployment_id)
+            except Exception as e:
+                logger.error(f"Error checking TTL for deployment {deployment_id}: {e}")
     
-    for deployment_id in deployment_ids:
-        try:
-            # Check if deployment has TTL
-            ttl_data = _get_ttl_data(deployment_id)
-            if not ttl_data:
-                continue
+    existing = _existing_deployment_dirs() if expired_candidates else set()
+    
+    for deployment_id in expired_candidates:
+        # Skip deployments already removed from disk
+        if deployment_id in existing:
+            expired_deployments.append(deployment_id)
+            logger.info(f"Deployment {deployment_id} has expired, destroying...")
+    
+    if expired_deployments:
+        # Destroy the deployments (import dynamically to avoid circular imports)
+        from .orchestrator import destroy
+        
+        # Teardown is dominated by terraform/AWS waits, so run it concurrently
+        with ThreadPoolExecutor(max_workers=SWEEP_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(destroy, deployment_id): deployment_id
+                for deployment_id in expired_deployments
+            }
             
-            # Check if expired
-            if _is_deployment_expired(ttl_data):
-                expired_deployments.append(deployment_id)
-                
-                logger.info(f"Deployment {deployment_id} has expired, destroying...")
-                
+            for future in as_completed(futures):
+                deployment_id = futures[future]
                 try:
-                    # Destroy the deployment (import dynamically to avoid circular imports)
-                    from .orchestrator import destroy
-                    result = destroy(deployment_id)
+                    result = future.result()
                     
                     if result.get("status") == "destroyed":
                         destroyed_count += 1
@@ -93,78 +145,342 @@ def run_ttl_sweep() -> Dict[str, Any]:
                 except Exception as e:
                     failed_count += 1
                     logger.error(f"Exception destroying expired deployment {deployment_id}: {e}")
-        
-        except Exception as e:
-            logger.error(f"Error checking TTL for deployment {deployment_id}: {e}")
     
     return {
         "expired_deployments": expired_deployments,
         "destroyed_count": destroyed_count,
         "failed_count": failed_count,
-        "total_checked": len(deployment_ids)
+        "total_checked": total_checked
     }
 
 
+def _expired_registry_entries(registry: Dict[str, Dict[str, Any]], now: float) -> List[str]:
+    """
+    Find expired deployments in the TTL registry.
+    
+    Entries are ordered by expiry timestamp and the expired prefix is found
+    with a binary search against the current time.
+    
+    Args:
+        registry: Folded TTL registry
+        now: Current UNIX timestamp
+        
+    Returns:
+        List of expired deployment IDs, earliest expiry first
+    """
+    timed = []
+    
+    for deployment_id, ttl_data in registry.items():
+        expires_timestamp = ttl_data.get("expires_timestamp")
+        if isinstance(expires_timestamp, (int, float)):
+            timed.append((expires_timestamp, deployment_id))
+        else:
+            # Reports the legacy entry; it never counts as expired
+            _is_deployment_expired(ttl_data, now)
+    
+    timed.sort()
+    cutoff = bisect_right(timed, now, key=itemgetter(0))
+    
+    return [deployment_id for _, deployment_id in timed[:cutoff]]
+
+
+def _existing_deployment_dirs() -> set:
+    """Get the names of all directories under the Arvo home in one scan."""
+    try:
+        with os.scandir(get_arvo_home()) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
 def _get_ttl_data(deployment_id: str) -> Optional[Dict[str, Any]]:
     """Get TTL data for a deployment."""
     try:
+        ttl_data = _cached_ttl_registry().get(deployment_id)
+        if ttl_data is not None:
+            return ttl_data
+        
         deployment_dir = get_deployment_dir(deployment_id)
         ttl_file = deployment_dir / "ttl.json"
         
-        if ttl_file.exists():
-            with open(ttl_file, 'r') as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return _loads(ttl_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, IOError, OSError):
         pass
     
     return None
 
 
-def _is_deployment_expired(ttl_data: Dict[str, Any]) -> bool:
-    """Check if a deployment is expired based on TTL data."""
-    try:
-        expires_timestamp = ttl_data.get("expires_timestamp")
-        if expires_timestamp:
-            return time.time() > expires_timestamp
+def _is_deployment_expired(ttl_data: Dict[str, Any], now: Optional[float] = None) -> bool:
+    """
+    Check if a deployment is expired based on TTL data.
+    
+    Only the numeric expires_timestamp is consulted; legacy entries without
+    it are reported once and treated as not expired until rescheduled.
+    
+    Args:
+        ttl_data: TTL data for the deployment
+        now: Current UNIX timestamp (taken from the clock if None)
         
-        # Fallback to ISO string parsing
-        expires_at = ttl_data.get("expires_at")
-        if expires_at:
-            expires_dt = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
-            return datetime.utcnow().replace(tzinfo=expires_dt.tzinfo) > expires_dt
-    except (ValueError, TypeError):
-        pass
+    Returns:
+        True if the deployment has expired
+    """
+    expires_timestamp = ttl_data.get("expires_timestamp")
+    if isinstance(expires_timestamp, (int, float)):
+        return (time.time() if now is None else now) > expires_timestamp
+    
+    deployment_id = ttl_data.get("deployment_id")
+    if deployment_id not in _LEGACY_TTL_WARNED:
+        _LEGACY_TTL_WARNED.add(deployment_id)
+        logger.warning(
+            f"TTL entry for deployment {deployment_id} has no expires_timestamp; "
+            "reschedule its TTL to enable auto-destroy"
+        )
     
     return False
 
 
-def _update_global_ttl_registry(deployment_id: str, ttl_data: Dict[str, Any]) -> None:
-    """Update global TTL registry."""
+def _ttl_journal_file() -> Path:
+    """Get the path of the global TTL registry journal."""
+    return Path(".arvo") / TTL_JOURNAL_NAME
+
+
+def _legacy_ttl_registry_file() -> Path:
+    """Get the path of the legacy whole-file TTL registry."""
+    return Path(".arvo") / LEGACY_TTL_REGISTRY_NAME
+
+
+@contextmanager
+def _ttl_journal_lock(journal_file: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the TTL journal.
+    
+    Every write (append, migration, compaction) runs under this lock, so a
+    rewrite can never drop a record appended by another process. The lock
+    lives in a sibling file because compaction replaces the journal inode.
+    """
+    journal_file.parent.mkdir(exist_ok=True)
+    
+    with open(journal_file.with_suffix(".lock"), 'ab') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _append_ttl_journal(record: Dict[str, Any]) -> None:
+    """Append a single record to the global TTL registry journal."""
+    journal_file = _ttl_journal_file()
+    
+    with _ttl_journal_lock(journal_file):
+        _migrate_legacy_ttl_registry(journal_file)
+        with open(journal_file, 'ab') as f:
+            f.write(_dumps(record) + b"\n")
+
+
+def _migrate_legacy_ttl_registry(journal_file: Path) -> None:
+    """
+    Fold TTL entries the journal does not know about into it.
+    
+    Runs when the journal is about to be created or a legacy ttl.json
+    registry is still present. Entries come from the legacy registry and,
+    for deployments missing from both, their own ttl.json files. They are
+    written ahead of the existing journal lines so newer records still win,
+    and the legacy registry is renamed so this happens only once.
+    Must be called with the journal lock held.
+    
+    Args:
+        journal_file: Journal to migrate into
+    """
+    legacy_file = journal_file.with_name(LEGACY_TTL_REGISTRY_NAME)
+    journal_exists = journal_file.exists()
+    if journal_exists and not legacy_file.exists():
+        return
+    
+    journal_data = journal_file.read_bytes() if journal_exists else b""
+    known, _ = _fold_ttl_journal(journal_data)
+    records: Dict[str, Dict[str, Any]] = {}
+    
     try:
-        # Create .arvo directory if it doesn't exist
-        arvo_dir = Path(".arvo")
-        arvo_dir.mkdir(exist_ok=True)
-        
-        ttl_registry_file = arvo_dir / "ttl.json"
-        
-        # Load existing registry
-        registry = {}
-        if ttl_registry_file.exists():
-            try:
-                with open(ttl_registry_file, 'r') as f:
-                    registry = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                registry = {}
-        
-        # Update registry
-        registry[deployment_id] = ttl_data
+        legacy = _loads(legacy_file.read_bytes())
+    except FileNotFoundError:
+        legacy = {}
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Failed to read legacy TTL registry: {e}")
+        legacy = {}
+    
+    if isinstance(legacy, dict):
+        for deployment_id, ttl_data in legacy.items():
+            if isinstance(ttl_data, dict):
+                records[deployment_id] = dict(ttl_data, deployment_id=deployment_id)
+    
+    for deployment_id in list_deployments():
+        if deployment_id in records or deployment_id in known:
+            continue
+        try:
+            ttl_data = _loads((get_deployment_dir(deployment_id) / "ttl.json").read_bytes())
+        except FileNotFoundError:
+            continue
+        except (json.JSONDecodeError, OSError):
+            continue
+        if isinstance(ttl_data, dict):
+            records[deployment_id] = dict(ttl_data, deployment_id=deployment_id)
+    
+    if records:
+        tmp_file = journal_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_bytes(b"".join(
+            _dumps(ttl_data) + b"\n" for ttl_data in records.values()
+        ) + journal_data)
+        os.replace(tmp_file, journal_file)
+    
+    if legacy_file.exists():
+        legacy_file.replace(legacy_file.with_name(LEGACY_TTL_REGISTRY_NAME + ".migrated"))
+
+
+def _fold_ttl_journal(data: bytes) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Fold journal bytes into a registry keyed by deployment ID.
+    
+    Later records override earlier ones and tombstone records remove the
+    deployment.
+    
+    Args:
+        data: Raw journal contents
+    
+    Returns:
+        Tuple of (registry of live TTL entries, number of journal lines)
+    """
+    registry: Dict[str, Dict[str, Any]] = {}
+    line_count = 0
+    
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        line_count += 1
+        try:
+            record = _loads(line)
+        except json.JSONDecodeError:
+            continue  # Skip torn or malformed lines
+        if not isinstance(record, dict):
+            continue
         
-        # Write back to file
-        with open(ttl_registry_file, 'w') as f:
-            json.dump(registry, f, indent=2)
+        deployment_id = record.get("deployment_id")
+        if not deployment_id:
+            continue
+        if record.get("_tombstone"):
+            registry.pop(deployment_id, None)
+        else:
+            registry[deployment_id] = record
+    
+    return registry, line_count
+
+
+def _journal_needs_compaction(line_count: int, live_count: int) -> bool:
+    """Check whether the journal has grown well past the live registry."""
+    return (line_count >= JOURNAL_COMPACT_MIN_LINES
+            and line_count > JOURNAL_COMPACT_FACTOR * max(live_count, 1))
+
+
+def _load_ttl_registry(journal_file: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Fold the TTL journal into a registry keyed by deployment ID.
+    
+    The journal is compacted when it has grown well past the size of the
+    live registry.
+    
+    Args:
+        journal_file: Journal to read (defaults to the global journal)
+    
+    Returns:
+        Registry of live TTL entries
+    """
+    if journal_file is None:
+        journal_file = _ttl_journal_file()
+    
+    try:
+        data = journal_file.read_bytes()
+    except FileNotFoundError:
+        return {}
+    
+    registry, line_count = _fold_ttl_journal(data)
+    
+    if _journal_needs_compaction(line_count, len(registry)):
+        _compact_ttl_journal(journal_file)
     
+    return registry
+
+
+def _cached_ttl_registry() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the folded TTL registry, reusing the in-process copy.
+    
+    The journal is only re-read when its path, inode, size or modification
+    time has changed since the last load. Size catches appends within one
+    mtime tick and the inode catches compaction swapping the file in. A leftover legacy registry is migrated
+    into the journal first.
+    
+    Returns:
+        Registry of live TTL entries (treat as read-only)
+    """
+    journal_file = _ttl_journal_file()
+    
+    if _legacy_ttl_registry_file().exists():
+        try:
+            with _ttl_journal_lock(journal_file):
+                _migrate_legacy_ttl_registry(journal_file)
+        except OSError as e:
+            logger.warning(f"Failed to migrate legacy TTL registry: {e}")
+    
+    try:
+        st = journal_file.stat()
+    except FileNotFoundError:
+        return {}
+    
+    version = (st.st_ino, st.st_size, st.st_mtime_ns)
+    return _load_registry_snapshot(str(journal_file.resolve()), version)
+
+
+@lru_cache(maxsize=4)
+def _load_registry_snapshot(path: str, version: Tuple[int, int, int]) -> Dict[str, Dict[str, Any]]:
+    """Load the registry for a given journal version (cached per path and (inode, size, mtime))."""
+    return _load_ttl_registry(Path(path))
+
+
+def _invalidate_ttl_cache() -> None:
+    """Drop the in-process TTL registry copies."""
+    _load_registry_snapshot.cache_clear()
+
+
+def _compact_ttl_journal(journal_file: Path) -> None:
+    """
+    Atomically rewrite the journal with one line per live entry.
+    
+    The journal is re-read under the lock, so records appended since the
+    caller's read are kept, and left alone if it no longer needs compacting.
+    """
+    try:
+        with _ttl_journal_lock(journal_file):
+            registry, line_count = _fold_ttl_journal(journal_file.read_bytes())
+            if not _journal_needs_compaction(line_count, len(registry)):
+                return
+            
+            tmp_file = journal_file.with_suffix(".jsonl.tmp")
+            tmp_file.write_bytes(b"".join(
+                _dumps(ttl_data) + b"\n" for ttl_data in registry.values()
+            ))
+            os.replace(tmp_file, journal_file)
+    except OSError as e:
+        logger.warning(f"Failed to compact TTL journal: {e}")
+
+
+def _update_global_ttl_registry(deployment_id: str, ttl_data: Dict[str, Any]) -> None:
+    """Update global TTL registry."""
+    try:
+        _append_ttl_journal(ttl_data)
     except Exception as e:
         logger.warning(f"Failed to update global TTL registry: {e}")
+    finally:
+        _invalidate_ttl_cache()
 
 
 def list_ttl_deployments() -> List[Dict[str, Any]]:
@@ -177,24 +493,22 @@ def list_ttl_deployments() -> List[Dict[str, Any]]:
     ttl_deployments = []
     
     try:
-        arvo_dir = Path(".arvo")
-        ttl_registry_file = arvo_dir / "ttl.json"
+        registry = _cached_ttl_registry()
+        existing = _existing_deployment_dirs()
+        now = time.time()
         
-        if ttl_registry_file.exists():
-            with open(ttl_registry_file, 'r') as f:
-                registry = json.load(f)
+        for deployment_id, cached_data in registry.items():
+            ttl_data = dict(cached_data)
             
-            for deployment_id, ttl_data in registry.items():
-                # Check if deployment still exists
-                deployment_dir = get_deployment_dir(deployment_id)
-                if deployment_dir.exists():
-                    ttl_data["exists"] = True
-                    ttl_data["expired"] = _is_deployment_expired(ttl_data)
-                else:
-                    ttl_data["exists"] = False
-                    ttl_data["expired"] = False
-                
-                ttl_deployments.append(ttl_data)
+            # Check if deployment still exists
+            if deployment_id in existing:
+                ttl_data["exists"] = True
+                ttl_data["expired"] = _is_deployment_expired(ttl_data, now)
+            else:
+                ttl_data["exists"] = False
+                ttl_data["expired"] = False
+            
+            ttl_deployments.append(ttl_data)
     
     except (json.JSONDecodeError, IOError) as e:
         logger.warning(f"Failed to read TTL registry: {e}")
@@ -217,22 +531,12 @@ def cancel_ttl(deployment_id: str) -> bool:
         deployment_dir = get_deployment_dir(deployment_id)
         ttl_file = deployment_dir / "ttl.json"
         
-        if ttl_file.exists():
-            ttl_file.unlink()
+        ttl_file.unlink(missing_ok=True)
         
         # Remove from global registry
-        arvo_dir = Path(".arvo")
-        ttl_registry_file = arvo_dir / "ttl.json"
-        
-        if ttl_registry_file.exists():
-            with open(ttl_registry_file, 'r') as f:
-                registry = json.load(f)
-            
-            if deployment_id in registry:
-                del registry[deployment_id]
-                
-                with open(ttl_registry_file, 'w') as f:
-                    json.dump(registry, f, indent=2)
+        if _ttl_journal_file().exists() or _legacy_ttl_registry_file().exists():
+            _append_ttl_journal({"deployment_id": deployment_id, "_tombstone": True})
+            _invalidate_ttl_cache()
         
         return True
     
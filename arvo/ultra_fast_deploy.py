@@ -2,18 +2,24 @@
 ULTRA FAST deployment - minimal LLM usage, maximum speed.
 """
 
+import os
 import time
 import json
+import zlib
 import subprocess
+import requests
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# Reused across health-check attempts so retries share pooled connections
+_SESSION = requests.Session()
 
 
 def ultra_fast_deploy(instructions: str, repo_url: str, region: str = "us-west-2") -> Dict[str, Any]:
     """
     ULTRA FAST deployment - minimal processing, maximum speed.
     """
-    deployment_id = f"d-{int(time.time())}-{hash(repo_url) % 10000:04x}"
+    deployment_id = f"d-{int(time.time())}-{zlib.crc32(repo_url.encode()) & 0xFFFF:04x}"
     
     print(f"⚡⚡ ULTRA FAST Deployment: {deployment_id}")
     print(f"📝 Instructions: {instructions}")
@@ -42,7 +48,7 @@ def ultra_fast_deploy(instructions: str, repo_url: str, region: str = "us-west-2
         
         # Step 4: Deploy infrastructure
         print("\n⚙️  Step 4: Deploying infrastructure...")
-        success = _run_terraform_fast(terraform_dir)
+        success, outputs = _run_terraform_fast(terraform_dir)
         
         if not success:
             return {
@@ -51,9 +57,10 @@ def ultra_fast_deploy(instructions: str, repo_url: str, region: str = "us-west-2
                 "error": "Terraform deployment failed"
             }
         
-        # Step 5: Get outputs
+        # Step 5: Get outputs (already streamed by apply when available)
         print("\n📊 Step 5: Getting deployment outputs...")
-        outputs = _get_terraform_outputs_fast(terraform_dir)
+        if not outputs:
+            outputs = _get_terraform_outputs_fast(terraform_dir)
         
         # Step 6: Quick health check
         print("\n⏳ Step 6: Quick health check...")
@@ -151,13 +158,15 @@ if [ -f "requirements.txt" ]; then
 else
     pip install flask gunicorn flask-cors
 fi
-for py_file in *.py; do
-    if [ -f "$py_file" ]; then
-        sed -i 's/app.run(host="127.0.0.1")/app.run(host="0.0.0.0", port={port})/g' "$py_file"
-        sed -i 's/app.run(host="127.0.0.1", port=5000)/app.run(host="0.0.0.0", port={port})/g' "$py_file"
-        sed -i 's/app.run()/app.run(host="0.0.0.0", port={port})/g' "$py_file"
-    fi
-done
+python3 - <<'PY'
+import pathlib, re
+pattern = re.compile(r'app\\.run\\((?:host="127\\.0\\.0\\.1"(?:, port=5000)?)?\\)')
+for path in pathlib.Path('.').glob('*.py'):
+    text = path.read_text()
+    patched = pattern.sub('app.run(host="0.0.0.0", port={port})', text)
+    if patched != text:
+        path.write_text(patched)
+PY
 cat > /etc/systemd/system/app.service << 'EOF'
 [Unit]
 Description=Application
@@ -216,38 +225,59 @@ output "instance_id" {
     return terraform_dir
 
 
-def _run_terraform_fast(terraform_dir: Path) -> bool:
-    """Run Terraform with minimal commands."""
+def _run_terraform_fast(terraform_dir: Path) -> Tuple[bool, Dict[str, Any]]:
+    """Run Terraform with minimal commands, returning (success, outputs)."""
     try:
+        # Share downloaded providers across deployments
+        plugin_cache = Path(".arvo/tfcache").resolve()
+        plugin_cache.mkdir(parents=True, exist_ok=True)
+        env = {**os.environ, "TF_PLUGIN_CACHE_DIR": str(plugin_cache)}
+        
         # Initialize (skip if already done)
         if not (terraform_dir / ".terraform").exists():
             result = subprocess.run(
                 ["terraform", "init", "-upgrade=false"],
                 cwd=terraform_dir,
                 capture_output=True,
-                text=True
+                text=True,
+                env=env
             )
             if result.returncode != 0:
                 print(f"Terraform init failed: {result.stderr}")
-                return False
+                return False, {}
         
-        # Apply directly
+        # Apply directly; -json streams the outputs so no separate
+        # `terraform output` process is needed
         result = subprocess.run(
-            ["terraform", "apply", "-auto-approve", "-refresh=false"],
+            ["terraform", "apply", "-auto-approve", "-refresh=false", "-json"],
             cwd=terraform_dir,
             capture_output=True,
-            text=True
+            text=True,
+            env=env
         )
         
+        outputs = {}
+        errors = []
+        for line in result.stdout.splitlines():
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if message.get("type") == "outputs":
+                outputs = message.get("outputs", {})
+            elif message.get("@level") == "error":
+                errors.append(message.get("@message", ""))
+        
         if result.returncode != 0:
-            print(f"Terraform apply failed: {result.stderr}")
-            return False
+            details = result.stderr or "\n".join(errors)
+            print(f"Terraform apply failed: {details}")
+            return False, {}
         
-        return True
+        return True, outputs
         
     except Exception as e:
         print(f"Terraform error: {e}")
-        return False
+        return False, {}
 
 
 def _get_terraform_outputs_fast(terraform_dir: Path) -> Dict[str, Any]:
@@ -271,14 +301,15 @@ def _get_terraform_outputs_fast(terraform_dir: Path) -> Dict[str, Any]:
 
 def _quick_health_check(public_ip: str, port: int) -> bool:
     """Quick health check."""
-    import requests
-    
     url = f"http://{public_ip}:{port}"
     
     # Try 3 times with 2 second intervals
     for i in range(3):
         try:
-            response = requests.get(url, timeout=3)
+            # HEAD avoids downloading the body; fall back to GET if unsupported
+            response = _SESSION.head(url, timeout=2)
+            if response.status_code != 200:
+                response = _SESSION.get(url, timeout=3)
             if response.status_code == 200:
                 print(f"   ✅ Application is responding at {url}")
                 return True
@@ -316,9 +347,8 @@ def test_ultra_fast_deployment():
         
         # Test the application
         print(f"\n🧪 Testing application...")
-        import requests
         try:
-            response = requests.get(result['application_url'], timeout=5)
+            response = _SESSION.get(result['application_url'], timeout=5)
             if response.status_code == 200:
                 print(f"✅ Application is working! Response: {len(response.text)} characters")
             else:
@@ -5,13 +5,24 @@ User-friendly web interface for Arvo deployment system.
 from flask import Flask, render_template, request, jsonify, redirect, url_for
 import os
 import time
+import zlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from arvo.simple_deploy import deploy
 
 app = Flask(__name__)
 
-# Store deployment history
+# Store deployment history (guarded by _LOCK; updated from worker threads)
 deployments = {}
+_LOCK = threading.Lock()
+
+# Most recent log lines kept per deployment
+MAX_LOG_LINES = 1000
+
+# Bounded pool for background deployments; extra requests queue up
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="arvo-deploy")
 
 @app.route('/')
 def index():
@@ -34,24 +45,22 @@ def deploy_app():
             }), 400
         
         # Generate deployment ID
-        deployment_id = f"d-{int(time.time())}-{hash(repo_url) % 10000:04x}"
+        deployment_id = f"d-{int(time.time())}-{zlib.crc32(repo_url.encode()) & 0xFFFF:04x}"
         
         # Store deployment info
-        deployments[deployment_id] = {
-            'id': deployment_id,
-            'instructions': instructions,
-            'repo_url': repo_url,
-            'region': region,
-            'status': 'starting',
-            'start_time': time.time(),
-            'logs': []
-        }
+        with _LOCK:
+            deployments[deployment_id] = {
+                'id': deployment_id,
+                'instructions': instructions,
+                'repo_url': repo_url,
+                'region': region,
+                'status': 'starting',
+                'start_time': time.time(),
+                'logs': deque(maxlen=MAX_LOG_LINES)
+            }
         
         # Start deployment in background
-        import threading
-        thread = threading.Thread(target=run_deployment, args=(deployment_id, instructions, repo_url, region))
-        thread.daemon = True
-        thread.start()
+        _EXECUTOR.submit(run_deployment, deployment_id, instructions, repo_url, region)
         
         return jsonify({
             'status': 'success',
@@ -68,72 +77,78 @@ def deploy_app():
 def run_deployment(deployment_id, instructions, repo_url, region):
     """Run deployment in background thread."""
     try:
-        deployments[deployment_id]['status'] = 'running'
-        deployments[deployment_id]['logs'].append(f"Starting deployment: {instructions}")
+        with _LOCK:
+            deployments[deployment_id]['status'] = 'running'
+            deployments[deployment_id]['logs'].append(f"Starting deployment: {instructions}")
         
         # Run the actual deployment
         result = deploy(instructions, repo_url, region)
         
         # Update deployment status
-        deployments[deployment_id]['status'] = result['status']
-        deployments[deployment_id]['end_time'] = time.time()
-        deployments[deployment_id]['result'] = result
-        
-        if result['status'] == 'success':
-            deployments[deployment_id]['logs'].append(f"✅ Deployment successful!")
-            deployments[deployment_id]['logs'].append(f"🌐 Application URL: {result['application_url']}")
-        else:
-            deployments[deployment_id]['logs'].append(f"❌ Deployment failed: {result.get('error', 'Unknown error')}")
+        with _LOCK:
+            deployments[deployment_id]['status'] = result['status']
+            deployments[deployment_id]['end_time'] = time.time()
+            deployments[deployment_id]['result'] = result
+            
+            if result['status'] == 'success':
+                deployments[deployment_id]['logs'].append(f"✅ Deployment successful!")
+                deployments[deployment_id]['logs'].append(f"🌐 Application URL: {result['application_url']}")
+            else:
+                deployments[deployment_id]['logs'].append(f"❌ Deployment failed: {result.get('error', 'Unknown error')}")
             
     except Exception as e:
-        deployments[deployment_id]['status'] = 'failed'
-        deployments[deployment_id]['logs'].append(f"❌ Deployment error: {str(e)}")
+        with _LOCK:
+            deployments[deployment_id]['status'] = 'failed'
+            deployments[deployment_id]['logs'].append(f"❌ Deployment error: {str(e)}")
 
 @app.route('/status/<deployment_id>')
 def get_status(deployment_id):
     """Get deployment status."""
-    if deployment_id not in deployments:
-        return jsonify({'status': 'error', 'message': 'Deployment not found'}), 404
-    
-    deployment = deployments[deployment_id]
-    return jsonify({
-        'id': deployment_id,
-        'status': deployment['status'],
-        'instructions': deployment['instructions'],
-        'repo_url': deployment['repo_url'],
-        'region': deployment['region'],
-        'logs': deployment['logs'],
-        'start_time': deployment['start_time'],
-        'end_time': deployment.get('end_time'),
-        'result': deployment.get('result')
-    })
+    with _LOCK:
+        if deployment_id not in deployments:
+            return jsonify({'status': 'error', 'message': 'Deployment not found'}), 404
+        
+        deployment = deployments[deployment_id]
+        return jsonify({
+            'id': deployment_id,
+            'status': deployment['status'],
+            'instructions': deployment['instructions'],
+            'repo_url': deployment['repo_url'],
+            'region': deployment['region'],
+            'logs': list(deployment['logs']),
+            'start_time': deployment['start_time'],
+            'end_time': deployment.get('end_time'),
+            'result': deployment.get('result')
+        })
 
 @app.route('/deployments')
 def list_deployments():
     """List all deployments."""
-    return jsonify({
-        'deployments': [
-            {
-                'id': dep_id,
-                'instructions': dep['instructions'],
-                'repo_url': dep['repo_url'],
-                'status': dep['status'],
-                'start_time': dep['start_time']
-            }
-            for dep_id, dep in deployments.items()
-        ]
-    })
+    with _LOCK:
+        return jsonify({
+            'deployments': [
+                {
+                    'id': dep_id,
+                    'instructions': dep['instructions'],
+                    'repo_url': dep['repo_url'],
+                    'status': dep['status'],
+                    'start_time': dep['start_time']
+                }
+                for dep_id, dep in deployments.items()
+            ]
+        })
 
 @app.route('/logs/<deployment_id>')
 def get_logs(deployment_id):
     """Get deployment logs."""
-    if deployment_id not in deployments:
-        return jsonify({'status': 'error', 'message': 'Deployment not found'}), 404
-    
-    return jsonify({
-        'deployment_id': deployment_id,
-        'logs': deployments[deployment_id]['logs']
-    })
+    with _LOCK:
+        if deployment_id not in deployments:
+            return jsonify({'status': 'error', 'message': 'Deployment not found'}), 404
+        
+        return jsonify({
+            'deployment_id': deployment_id,
+            'logs': list(deployments[deployment_id]['logs'])
+        })
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
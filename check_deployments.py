@@ -8,7 +8,11 @@ This script helps you verify if your deployments are working correctly.
 import requests
 import json
 import sys
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Tuple
+
+# Shared session so repeated checks reuse pooled connections
+_SESSION = requests.Session()
 
 def check_deployment(url: str, expected_status: int = 200) -> Dict[str, Any]:
     """
@@ -21,6 +25,21 @@ def check_deployment(url: str, expected_status: int = 200) -> Dict[str, Any]:
     Returns:
         Dictionary with check results
     """
+    result, _ = check_deployment_raw(url, expected_status)
+    return result
+
+def check_deployment_raw(url: str, expected_status: int = 200) -> Tuple[Dict[str, Any], Optional[requests.Response]]:
+    """
+    Check if a deployment is working and keep the HTTP response.
+    
+    Args:
+        url: The deployment URL to check
+        expected_status: Expected HTTP status code
+        
+    Returns:
+        Tuple of (check results, response or None if the request failed)
+    """
+    response = None
     result = {
         "url": url,
         "status": "unknown",
@@ -34,7 +53,7 @@ def check_deployment(url: str, expected_status: int = 200) -> Dict[str, Any]:
         import time
         start_time = time.time()
         
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         
         result["response_time"] = round((time.time() - start_time) * 1000, 2)  # ms
         result["status_code"] = response.status_code
@@ -55,7 +74,7 @@ def check_deployment(url: str, expected_status: int = 200) -> Dict[str, Any]:
         result["status"] = "❌ ERROR"
         result["error"] = str(e)
     
-    return result
+    return result, response
 
 def check_api_endpoint(base_url: str, endpoint: str = "/api/message") -> Dict[str, Any]:
     """
@@ -69,11 +88,10 @@ def check_api_endpoint(base_url: str, endpoint: str = "/api/message") -> Dict[st
         Dictionary with API check results
     """
     api_url = base_url.rstrip('/') + endpoint
-    result = check_deployment(api_url)
+    result, response = check_deployment_raw(api_url)
     
     if result["status"] == "✅ WORKING":
         try:
-            response = requests.get(api_url, timeout=5)
             if response.headers.get("content-type", "").startswith("application/json"):
                 data = response.json()
                 result["api_response"] = data
@@ -85,6 +103,47 @@ def check_api_endpoint(base_url: str, endpoint: str = "/api/message") -> Dict[st
     
     return result
 
+def check_url(url: str) -> Dict[str, Any]:
+    """
+    Check a deployment and, if it is up, its API endpoint.
+    
+    Args:
+        url: The deployment URL to check
+        
+    Returns:
+        Dictionary with main and API check results
+    """
+    main_result = check_deployment(url)
+    api_result = None
+    
+    # Check API endpoint if main app is working
+    if main_result["status"] == "✅ WORKING":
+        api_result = check_api_endpoint(url)
+    
+    return {"url": url, "main": main_result, "api": api_result}
+
+def print_check(check: Dict[str, Any]) -> None:
+    """Print the results of a single URL check."""
+    main_result = check["main"]
+    api_result = check["api"]
+    
+    print(f"\n📱 Checking: {check['url']}")
+    print(f"   Main App: {main_result['status']}")
+    
+    if main_result["response_time"]:
+        print(f"   Response Time: {main_result['response_time']}ms")
+    
+    if main_result["error"]:
+        print(f"   Error: {main_result['error']}")
+    
+    if api_result:
+        print(f"   API Endpoint: {api_result['status']}")
+        
+        if "api_response" in api_result:
+            print(f"   API Response: {api_result['api_response']}")
+    
+    print("-" * 40)
+
 def main():
     """Main function to check deployments."""
     if len(sys.argv) < 2:
@@ -97,28 +156,11 @@ def main():
     print("🔍 Checking Deployments...")
     print("=" * 60)
     
-    for url in urls:
-        print(f"\n📱 Checking: {url}")
-        
-        # Check main application
-        main_result = check_deployment(url)
-        print(f"   Main App: {main_result['status']}")
-        
-        if main_result["response_time"]:
-            print(f"   Response Time: {main_result['response_time']}ms")
-        
-        if main_result["error"]:
-            print(f"   Error: {main_result['error']}")
-        
-        # Check API endpoint if main app is working
-        if main_result["status"] == "✅ WORKING":
-            api_result = check_api_endpoint(url)
-            print(f"   API Endpoint: {api_result['status']}")
-            
-            if "api_response" in api_result:
-                print(f"   API Response: {api_result['api_response']}")
-        
-        print("-" * 40)
+    # Checks are network-bound, so run them concurrently and print as they finish
+    with ThreadPoolExecutor(max_workers=min(len(urls), 32)) as executor:
+        futures = [executor.submit(check_url, url) for url in urls]
+        for future in as_completed(futures):
+            print_check(future.result())
     
     print("\n✅ Deployment check complete!")
 
@@ -0,0 +1,26 @@
+"""
+Optional compiled build of the analyzer.
+
+Package metadata lives in pyproject.toml. Setting ARVO_CYTHON=1 compiles the
+arvo.analyzer modules with Cython; without it the pure-Python modules are used.
+
+    ARVO_CYTHON=1 python setup.py build_ext --inplace
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+
+if os.environ.get("ARVO_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["arvo/analyzer/*.py"],
+        exclude=["arvo/analyzer/__init__.py"],
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+
+setup(ext_modules=ext_modules)
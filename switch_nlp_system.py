@@ -7,21 +7,40 @@ import os
 import sys
 import shutil
 
+SIMPLE_DEPLOY_PATH = 'arvo/simple_deploy.py'
+OPENROUTER_IMPORT = 'from .openrouter_nlp import extract_deployment_requirements'
+REGEX_IMPORT = 'from .simple_nlp import extract_deployment_requirements'
+
+def _swap_import(old_import, new_import):
+    """
+    Replace one import line in simple_deploy.py with another.
+    
+    The file is rewritten atomically via a temp file and os.replace, and
+    left untouched when the old import is not present.
+    
+    Returns:
+        True if the file was changed
+    """
+    with open(SIMPLE_DEPLOY_PATH, 'r') as f:
+        content = f.read()
+    
+    if old_import not in content:
+        return False
+    
+    tmp_path = SIMPLE_DEPLOY_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(content.replace(old_import, new_import))
+    os.replace(tmp_path, SIMPLE_DEPLOY_PATH)
+    return True
+
 def switch_to_openrouter():
     """Switch to OpenRouter system with Claude 4.1 Opus Max."""
     print("🔄 Switching to OpenRouter system with Claude 4.1 Opus Max...")
     
     # Update simple_deploy.py to use OpenRouter
-    with open('arvo/simple_deploy.py', 'r') as f:
-        content = f.read()
-    
-    content = content.replace(
-        'from .simple_nlp import extract_deployment_requirements',
-        'from .openrouter_nlp import extract_deployment_requirements'
-    )
-    
-    with open('arvo/simple_deploy.py', 'w') as f:
-        f.write(content)
+    if not _swap_import(REGEX_IMPORT, OPENROUTER_IMPORT):
+        print("✅ Already using OpenRouter system, nothing to change")
+        return
     
     print("✅ Switched to OpenRouter system with Claude 4.1 Opus Max")
     print("🤖 Now using: Claude 4.1 Opus Max via OpenRouter API")
@@ -32,16 +51,9 @@ def switch_to_regex():
     print("🔄 Switching back to regex system...")
     
     # Update simple_deploy.py to use regex
-    with open('arvo/simple_deploy.py', 'r') as f:
-        content = f.read()
-    
-    content = content.replace(
-        'from .openrouter_nlp import extract_deployment_requirements',
-        'from .simple_nlp import extract_deployment_requirements'
-    )
-    
-    with open('arvo/simple_deploy.py', 'w') as f:
-        f.write(content)
+    if not _swap_import(OPENROUTER_IMPORT, REGEX_IMPORT):
+        print("✅ Already using regex system, nothing to change")
+        return
     
     print("✅ Switched back to regex system")
     print("🔧 Now using: Fast regex pattern matching")
@@ -49,7 +61,7 @@ def switch_to_regex():
 
 def show_status():
     """Show current NLP system status."""
-    with open('arvo/simple_deploy.py', 'r') as f:
+    with open(SIMPLE_DEPLOY_PATH, 'r') as f:
         content = f.read()
     
     if 'openrouter_nlp' in content:
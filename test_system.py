@@ -4,10 +4,22 @@
 import requests
 import json
 import time
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
+from arvo.analyzer.spec import DeploymentSpec
+from arvo.nlp.extract import extract_overrides
+from arvo.recipes.registry import select_recipe
+
+# Probes of the locally running API/UI share ports, so keep them on one xdist worker
+network = pytest.mark.network
+network_group = pytest.mark.xdist_group("network")
+
+@network
+@network_group
 def test_api_health():
     """Test API health endpoint."""
     print("🔍 Testing API health...")
@@ -24,6 +36,8 @@ def test_api_health():
         print(f"❌ API health check failed: {e}")
         return False
 
+@network
+@network_group
 def test_api_docs():
     """Test API documentation endpoint."""
     print("🔍 Testing API documentation...")
@@ -39,6 +53,8 @@ def test_api_docs():
         print(f"❌ API docs failed: {e}")
         return False
 
+@network
+@network_group
 def test_web_ui():
     """Test web UI accessibility."""
     print("🔍 Testing web UI...")
@@ -58,16 +74,17 @@ def test_cli():
     """Test CLI commands."""
     print("🔍 Testing CLI...")
     try:
-        # Test help command
-        result = subprocess.run([
-            sys.executable, "-m", "arvo.cli.main", "--help"
-        ], capture_output=True, text=True, timeout=10)
+        # Test help command in-process instead of spawning an interpreter
+        from click.testing import CliRunner
+        from arvo.cli.main import main as cli
+        
+        result = CliRunner().invoke(cli, ["--help"])
         
-        if result.returncode == 0 and "Arvo" in result.stdout:
+        if result.exit_code == 0 and "Arvo" in result.output:
             print("✅ CLI is working")
             return True
         else:
-            print(f"❌ CLI failed: {result.stderr}")
+            print(f"❌ CLI failed: {result.output}")
             return False
     except Exception as e:
         print(f"❌ CLI failed: {e}")
@@ -77,8 +94,6 @@ def test_nlp_system():
     """Test NLP system."""
     print("🔍 Testing NLP system...")
     try:
-        from arvo.nlp.extract import extract_overrides
-        
         # Test simple extraction
         overrides, report = extract_overrides("Deploy Flask app on AWS")
         
@@ -96,9 +111,6 @@ def test_recipe_system():
     """Test recipe system."""
     print("🔍 Testing recipe system...")
     try:
-        from arvo.recipes.registry import select_recipe
-        from arvo.analyzer.spec import DeploymentSpec
-        
         # Create a test spec
         spec = DeploymentSpec(
             app_path="/test",
@@ -138,24 +150,35 @@ def main():
     print("🚀 Testing Arvo System Components")
     print("=" * 50)
     
-    tests = [
+    # Independent HTTP probes run concurrently so the phase costs max(RTT), not sum
+    probes = [
         test_api_health,
         test_api_docs,
-        test_web_ui,
+        test_web_ui
+    ]
+    tests = [
         test_cli,
         test_nlp_system,
         test_recipe_system
     ]
     
     passed = 0
-    total = len(tests)
+    total = len(probes) + len(tests)
     
-    for test in tests:
+    def run(test):
         try:
-            if test():
-                passed += 1
+            return bool(test())
         except Exception as e:
             print(f"❌ Test {test.__name__} crashed: {e}")
+            return False
+    
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        passed += sum(executor.map(run, probes))
+    print()
+    
+    for test in tests:
+        if run(test):
+            passed += 1
         print()
     
     print("=" * 50)
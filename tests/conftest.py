@@ -0,0 +1,164 @@
+"""
+Shared pytest fixtures.
+
+The analyzer fixture trees are checked in under tests/fixtures_analyzer and
+are read-only, so each one is copied once per test session and handed to
+every test that needs it. Manifests such as package.json are stored
+pre-serialized there; nothing is generated with json.dumps at test time.
+"""
+
+import copy
+import dataclasses
+import functools
+import hashlib
+import os
+import shutil
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+# Warm the import cache so package import cost is paid once, outside any test
+import arvo.analyzer
+import arvo.nlp.extract
+import arvo.recipes.registry
+from arvo.nlp.providers import MockProvider
+from arvo.nlp.rules import extract_pass_a
+from arvo.selector import select_infra
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures_analyzer"
+
+_analyze_repo = arvo.analyzer.analyze_repo
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a fixture file, copying when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _copy_fixture(root: Path, name: str) -> Path:
+    """Materialize a fixture tree under root unless it was already copied this session."""
+    app_dir = root / name
+    marker = root / f".{name}.built"
+    if not marker.exists():
+        shutil.copytree(FIXTURES_DIR / name, app_dir, copy_function=_link_or_copy, dirs_exist_ok=True)
+        marker.touch()
+    return app_dir
+
+
+@pytest.fixture(scope="session")
+def fixtures_root(tmp_path_factory) -> Path:
+    """Session-wide directory holding the analyzer fixture trees."""
+    return tmp_path_factory.mktemp("fixtures", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def flask_app_dir(fixtures_root) -> Path:
+    """Flask app fixture tree."""
+    return _copy_fixture(fixtures_root, "flask_app")
+
+
+@pytest.fixture(scope="session")
+def node_app_dir(fixtures_root) -> Path:
+    """Node.js Express app fixture tree."""
+    return _copy_fixture(fixtures_root, "node_app")
+
+
+@pytest.fixture(scope="session")
+def nextjs_app_dir(fixtures_root) -> Path:
+    """Next.js app fixture tree."""
+    return _copy_fixture(fixtures_root, "nextjs_app")
+
+
+@pytest.fixture(scope="session")
+def docker_app_dir(fixtures_root) -> Path:
+    """Containerized app fixture tree."""
+    return _copy_fixture(fixtures_root, "docker_app")
+
+
+def _tree_hash(path: str) -> bytes:
+    """Fingerprint a directory tree from file names, mtimes and sizes (no content reads)."""
+    h = hashlib.blake2b(digest_size=16)
+    stack = [path]
+    while stack:
+        dirpath = stack.pop()
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            st = entry.stat(follow_symlinks=False)
+            h.update(os.path.relpath(entry.path, path).encode())
+            h.update(st.st_size.to_bytes(8, "little"))
+            h.update(st.st_mtime_ns.to_bytes(8, "little"))
+    return h.digest()
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_analyze(path: str, tree_hash: bytes, instructions: str):
+    """Analyze a tree once per (path, content fingerprint, instructions)."""
+    return _analyze_repo(path, instructions)
+
+
+def _memoized_analyze_repo(app_root: str, instructions: str = ""):
+    """Drop-in analyze_repo that reuses results for unchanged trees."""
+    spec = _cached_analyze(app_root, _tree_hash(app_root), instructions)
+    # Hand out a copy so one test cannot mutate another's result
+    return copy.deepcopy(spec)
+
+
+@pytest.fixture(autouse=True)
+def memoize_analyze_repo(request, monkeypatch):
+    """Serve analyze_repo from a session-wide cache keyed by tree content."""
+    monkeypatch.setattr(arvo.analyzer, "analyze_repo", _memoized_analyze_repo)
+    if getattr(request.module, "analyze_repo", None) is _analyze_repo:
+        monkeypatch.setattr(request.module, "analyze_repo", _memoized_analyze_repo)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_nlp_rules():
+    """Run Pass A once up front so each xdist worker starts with warm caches."""
+    extract_pass_a("warmup aws ec2 us-west-2")
+
+
+@pytest.fixture(scope="module")
+def mock_provider() -> MockProvider:
+    """A MockProvider shared by the tests of one module."""
+    return MockProvider()
+
+
+def _freeze(value):
+    """Turn nested lists and mappings into hashable tuples for use as a cache key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def cached_select():
+    """select_infra memoized per (spec, overrides) for the whole session.
+
+    Relies on select_infra leaving its inputs untouched, which
+    test_select_infra_does_not_mutate_inputs checks.
+    """
+    cache = {}
+
+    def _call(spec, overrides=None):
+        # Field by field rather than dataclasses.astuple, which cannot deepcopy
+        # the read-only mappings test specs use for empty defaults
+        key = (
+            tuple(_freeze(getattr(spec, f.name)) for f in dataclasses.fields(spec)),
+            _freeze(overrides or {}),
+        )
+        if key not in cache:
+            cache[key] = select_infra(spec, overrides=overrides)
+        # Hand out a copy so one test cannot mutate another's plan
+        return copy.deepcopy(cache[key])
+
+    return _call
@@ -0,0 +1,14 @@
+
+from flask import Flask
+app = Flask(__name__)
+
+@app.route('/')
+def hello():
+    return 'Hello World!'
+
+@app.route('/health')
+def health():
+    return {'status': 'ok'}
+
+if __name__ == '__main__':
+    app.run(host='127.0.0.1', port=5000)
@@ -0,0 +1,4 @@
+
+export default function Home() {
+    return <h1>Hello World!</h1>
+}
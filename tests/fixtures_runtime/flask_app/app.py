@@ -2,6 +2,8 @@
 Simple Flask application for testing.
 """
 
+import os
+
 from flask import Flask, jsonify
 
 app = Flask(__name__)
@@ -19,4 +21,4 @@ def api_message():
     return jsonify({"message": "Hello from Flask API!", "data": "test"})
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1', use_reloader=False)
@@ -0,0 +1,37 @@
+"""
+Shared DeploymentSpec factory for tests.
+"""
+
+from dataclasses import replace
+from types import MappingProxyType
+
+from arvo.analyzer.spec import DeploymentSpec
+
+# A plain Flask app; empty collections are immutable so every spec can share them
+BASE_SPEC = DeploymentSpec(
+    app_path="/tmp/app",
+    runtime="python",
+    framework="flask",
+    containerized=False,
+    multi_service=False,
+    start_command="flask run",
+    port=5000,
+    health_path="/health",
+    needs_build=False,
+    build_command=None,
+    static_assets=None,
+    db_required=False,
+    env_required=(),
+    env_example_path=None,
+    localhost_refs=(),
+    loopback_binds=(),
+    warnings=(),
+    rationale=(),
+    manifests=MappingProxyType({}),
+    extra=MappingProxyType({}),
+)
+
+
+def make_spec(**overrides) -> DeploymentSpec:
+    """Build a DeploymentSpec from BASE_SPEC with the given fields replaced."""
+    return replace(BASE_SPEC, **overrides)
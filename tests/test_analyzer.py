@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the Arvo analyzer implementation.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from arvo.analyzer import analyze_repo, fetch_into_workspace
+from arvo.analyzer.report import emit_report
+
+logger = logging.getLogger(__name__)
+
+
+def test_flask(flask_app_dir):
+    """Flask app detection."""
+    spec = analyze_repo(str(flask_app_dir), "Deploy this Flask app")
+    
+    logger.debug("Runtime: %s", spec.runtime)
+    logger.debug("Framework: %s", spec.framework)
+    logger.debug("Port: %s", spec.port)
+    logger.debug("Start Command: %s", spec.start_command)
+    logger.debug("Health Path: %s", spec.health_path)
+    logger.debug("DB Required: %s", spec.db_required)
+    logger.debug("Localhost Refs: %d files", len(spec.localhost_refs))
+    logger.debug("Loopback Binds: %d files", len(spec.loopback_binds))
+    logger.debug("Env Required: %s", spec.env_required)
+    logger.debug("Warnings: %s", spec.warnings)
+    logger.debug("Rationale: %s", spec.rationale)
+    
+    assert spec.runtime == "python", f"Expected 'python', got '{spec.runtime}'"
+    assert spec.framework == "flask", f"Expected 'flask', got '{spec.framework}'"
+    assert spec.port == 5000, f"Expected port 5000, got {spec.port}"
+    # Flask start commands are left to the recipe (see detect_python)
+    assert spec.start_command is None, f"Expected no start command, got '{spec.start_command}'"
+    assert spec.health_path == "/health", f"Expected '/health', got '{spec.health_path}'"
+    assert len(spec.localhost_refs) > 0, "Should detect localhost references"
+    assert len(spec.loopback_binds) > 0, "Should detect loopback binds"
+    assert "FLASK_ENV" in spec.env_required, "Should detect env variables"
+
+
+def test_node(node_app_dir):
+    """Node.js Express app detection."""
+    spec = analyze_repo(str(node_app_dir), "Deploy this Express app")
+    
+    logger.debug("Runtime: %s", spec.runtime)
+    logger.debug("Framework: %s", spec.framework)
+    logger.debug("Port: %s", spec.port)
+    logger.debug("Start Command: %s", spec.start_command)
+    logger.debug("DB Required: %s", spec.db_required)
+    logger.debug("Rationale: %s", spec.rationale)
+    
+    assert spec.runtime == "node", f"Expected 'node', got '{spec.runtime}'"
+    assert spec.framework == "express", f"Expected 'express', got '{spec.framework}'"
+    assert spec.port == 3000, f"Expected port 3000, got {spec.port}"
+    assert "node server.js" in (spec.start_command or ""), f"Expected node command, got '{spec.start_command}'"
+    assert spec.db_required == True, "Should detect database requirement from 'pg' dependency"
+
+
+def test_nextjs(nextjs_app_dir):
+    """Next.js app detection."""
+    spec = analyze_repo(str(nextjs_app_dir), "Deploy this Next.js app")
+    
+    logger.debug("Runtime: %s", spec.runtime)
+    logger.debug("Framework: %s", spec.framework)
+    logger.debug("Port: %s", spec.port)
+    logger.debug("Needs Build: %s", spec.needs_build)
+    logger.debug("Build Command: %s", spec.build_command)
+    logger.debug("Start Command: %s", spec.start_command)
+    logger.debug("Rationale: %s", spec.rationale)
+    
+    assert spec.runtime == "node", f"Expected 'node', got '{spec.runtime}'"
+    assert spec.framework == "nextjs", f"Expected 'nextjs', got '{spec.framework}'"
+    assert spec.port == 3000, f"Expected port 3000, got {spec.port}"
+    assert spec.needs_build == True, "Next.js should need build"
+    assert "build" in (spec.build_command or ""), f"Expected build command, got '{spec.build_command}'"
+    assert "next start" in (spec.start_command or ""), f"Expected next start, got '{spec.start_command}'"
+
+
+def test_docker(docker_app_dir):
+    """Docker/container app detection."""
+    spec = analyze_repo(str(docker_app_dir), "Deploy this containerized app")
+    
+    logger.debug("Runtime: %s", spec.runtime)
+    logger.debug("Containerized: %s", spec.containerized)
+    logger.debug("Multi Service: %s", spec.multi_service)
+    logger.debug("Rationale: %s", spec.rationale)
+    
+    assert spec.runtime == "container", f"Expected 'container', got '{spec.runtime}'"
+    assert spec.containerized == True, "Should detect containerization"
+    assert spec.multi_service == True, "Should detect multi-service from docker-compose"
+
+
+def test_report(docker_app_dir, tmp_path):
+    """Report generation."""
+    spec = analyze_repo(str(docker_app_dir), "Deploy this containerized app")
+    report_dir = tmp_path / "reports"
+    emit_report(spec, str(report_dir))
+    
+    spec_file = report_dir / "deployment_spec.json"
+    analysis_file = report_dir / "analysis.md"
+    
+    assert spec_file.exists(), "Should create deployment_spec.json"
+    assert analysis_file.exists(), "Should create analysis.md"
+    
+    # Verify JSON content
+    with open(spec_file) as f:
+        saved_spec = json.load(f)
+    assert saved_spec["runtime"] == "container", "Should save correct runtime"
+    
+    # Verify markdown content
+    analysis_content = analysis_file.read_text()
+    assert "Runtime: container" in analysis_content, "Should include runtime in analysis"
+    assert "Containerized: True" in analysis_content, "Should include containerized status"
+
+
+def test_fetcher(flask_app_dir, tmp_path):
+    """Local path fetching."""
+    try:
+        checkout_path, commit_hint = fetch_into_workspace(str(flask_app_dir), str(tmp_path / "workspace"))
+    except Exception as e:
+        pytest.skip(f"Fetcher unavailable: {e}")
+    
+    assert Path(checkout_path).exists(), "Should create checkout directory"
+    assert commit_hint == "local", f"Expected 'local', got '{commit_hint}'"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -1,23 +1,25 @@
+import pytest
+
 from arvo.analyzer import analyze_repo
-from pathlib import Path
-import tempfile
 
-def test_analyzer_flask_detects_python_flask():
-    with tempfile.TemporaryDirectory() as td:
-        p = Path(td)
-        (p/"app.py").write_text("from flask import Flask\napp=Flask(__name__)\n")
-        (p/"requirements.txt").write_text("flask==2.3.0\n")
-        spec = analyze_repo(str(p))
-        assert spec.runtime == "python"
-        assert spec.framework == "flask"
-        assert spec.port in (5000, None)
+
+def _build_flask(p):
+    (p/"app.py").write_text("from flask import Flask\napp=Flask(__name__)\n")
+    (p/"requirements.txt").write_text("flask==2.3.0\n")
 
 
-def test_analyzer_next_detects_node_nextjs():
-    with tempfile.TemporaryDirectory() as td:
-        p = Path(td)
-        (p/"package.json").write_text('{"name":"x","scripts":{"build":"next build","start":"next start"},"dependencies":{"next":"13.0.0","react":"18.0.0"}}')
-        spec = analyze_repo(str(p))
-        assert spec.runtime == "node"
-        assert spec.framework == "nextjs"
-        assert spec.needs_build is True
+def _build_next(p):
+    (p/"package.json").write_text('{"name":"x","scripts":{"build":"next build","start":"next start"},"dependencies":{"next":"13.0.0","react":"18.0.0"}}')
+
+
+@pytest.mark.parametrize("builder,expected", [
+    (_build_flask, {"runtime": "python", "framework": "flask"}),
+    (_build_next, {"runtime": "node", "framework": "nextjs", "needs_build": True}),
+], ids=["python-flask", "node-nextjs"])
+def test_analyzer_detects(tmp_path, builder, expected):
+    builder(tmp_path)
+    spec = analyze_repo(str(tmp_path))
+    for field, value in expected.items():
+        assert getattr(spec, field) == value
+    if spec.framework == "flask":
+        assert spec.port in (5000, None)
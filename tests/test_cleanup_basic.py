@@ -2,11 +2,38 @@
 Basic tests for cleanup and tagging functionality.
 """
 
+import json
+import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from dataclasses import dataclass
+from unittest.mock import patch, MagicMock, mock_open
 from arvo.tags import base_tags, parse_user_tags, add_ttl_tags, is_expired
 from arvo.cost import estimate_cost, format_cost_hint, should_show_cost_warning
 from arvo.cleanup.models import FoundResource
+from arvo import ttl
+
+
+INFRACOST_JSON = b'''
+{
+    "projects": [
+        {
+            "breakdown": {
+                "resources": [
+                    {"monthlyCost": "15.50"},
+                    {"monthlyCost": "3.25"}
+                ]
+            }
+        }
+    ]
+}
+'''
+
+
+@dataclass(frozen=True, slots=True)
+class _FakeCompleted:
+    """Stand-in for subprocess.CompletedProcess."""
+    returncode: int
+    stdout: bytes
 
 
 class TestTags:
@@ -59,6 +86,7 @@ class TestTags:
         assert tags_with_ttl["ttl_hours"] == "24"
         assert "expires_at" in tags_with_ttl
         assert tags_with_ttl["expires_at"].endswith("Z")
+        assert int(tags_with_ttl["expires_at_epoch"]) > 0
     
     def test_is_expired(self):
         """Test expiration checking."""
@@ -77,6 +105,17 @@ class TestTags:
         # No expiration
         tags_no_ttl = {"project": "arvo"}
         assert not is_expired(tags_no_ttl)
+    
+    def test_is_expired_epoch(self):
+        """Test expiration checking via the integer epoch tag."""
+        import time
+        
+        assert not is_expired({"expires_at_epoch": str(int(time.time()) + 3600)})
+        assert is_expired({"expires_at_epoch": str(int(time.time()) - 3600)})
+        assert not is_expired(add_ttl_tags({"project": "arvo"}, 1))
+        
+        # Malformed epoch falls back to the ISO timestamp
+        assert is_expired({"expires_at_epoch": "soon", "expires_at": "2000-01-01T00:00:00Z"})
 
 
 class TestCost:
@@ -119,24 +158,8 @@ class TestCost:
     @patch('subprocess.run')
     def test_estimate_cost_infracost_success(self, mock_run):
         """Test cost estimation with Infracost success."""
-        # Mock successful infracost run
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = '''
-        {
-            "projects": [
-                {
-                    "breakdown": {
-                        "resources": [
-                            {"monthlyCost": "15.50"},
-                            {"monthlyCost": "3.25"}
-                        ]
-                    }
-                }
-            ]
-        }
-        '''
-        mock_run.return_value = mock_result
+        # Successful infracost run
+        mock_run.return_value = _FakeCompleted(0, INFRACOST_JSON)
         
         cost_data = estimate_cost("/fake/path")
         
@@ -171,3 +194,83 @@ class TestCleanupModels:
         assert resource.arn_or_id == "i-1234567890abcdef0"
         assert resource.tags["project"] == "arvo"
         assert resource.reason == "Tagged with project=arvo"
+
+
+class TestTTLRegistry:
+    """Test the global TTL registry journal."""
+    
+    EXPIRED_ID = "d-20240101-000000-abcd"
+    
+    @pytest.fixture
+    def arvo_dir(self, tmp_path, monkeypatch):
+        """An empty .arvo directory as the working registry."""
+        monkeypatch.delenv("ARVO_HOME", raising=False)
+        monkeypatch.chdir(tmp_path)
+        ttl._invalidate_ttl_cache()
+        arvo_dir = tmp_path / ".arvo"
+        arvo_dir.mkdir()
+        yield arvo_dir
+        ttl._invalidate_ttl_cache()
+    
+    def _write_legacy_entry(self, arvo_dir):
+        ttl_data = {"deployment_id": self.EXPIRED_ID, "ttl_hours": 1, "expires_timestamp": 1.0}
+        (arvo_dir / self.EXPIRED_ID).mkdir()
+        (arvo_dir / self.EXPIRED_ID / "ttl.json").write_text(json.dumps(ttl_data))
+        (arvo_dir / "ttl.json").write_text(json.dumps({self.EXPIRED_ID: ttl_data}))
+    
+    def test_legacy_registry_is_listed(self, arvo_dir):
+        """Test that entries from the legacy ttl.json registry are still listed."""
+        self._write_legacy_entry(arvo_dir)
+        
+        listed = {d["deployment_id"]: d for d in ttl.list_ttl_deployments()}
+        assert listed[self.EXPIRED_ID]["expired"] is True
+        assert not (arvo_dir / "ttl.json").exists()
+    
+    def test_legacy_registry_survives_new_schedule(self, arvo_dir):
+        """Test that the first journal write keeps legacy entries sweepable."""
+        self._write_legacy_entry(arvo_dir)
+        new_id = "d-20240101-000001-efgh"
+        (arvo_dir / new_id).mkdir()
+        ttl.schedule_ttl_deployment(new_id, 24)
+        
+        with patch("arvo.orchestrator.destroy", return_value={"status": "destroyed"}) as destroy:
+            result = ttl.run_ttl_sweep()
+        
+        assert result["expired_deployments"] == [self.EXPIRED_ID]
+        destroy.assert_called_once_with(self.EXPIRED_ID)
+    
+    def test_non_object_journal_lines_are_skipped(self, arvo_dir):
+        """Test that valid JSON lines that are not records are ignored."""
+        (arvo_dir / "ttl.jsonl").write_text(
+            '[1]\n"x"\n{"deployment_id": "%s", "expires_timestamp": 1.0}\n' % self.EXPIRED_ID
+        )
+        
+        assert [d["deployment_id"] for d in ttl.list_ttl_deployments()] == [self.EXPIRED_ID]
+    
+    def test_snapshot_sees_append_within_one_mtime_tick(self, arvo_dir):
+        """Test that an append keeping the journal mtime still invalidates the snapshot."""
+        journal = arvo_dir / "ttl.jsonl"
+        journal.write_text('{"deployment_id": "%s", "expires_timestamp": 1.0}\n' % self.EXPIRED_ID)
+        st = journal.stat()
+        assert list(ttl._cached_ttl_registry()) == [self.EXPIRED_ID]
+        
+        other_id = "d-20240101-000001-efgh"
+        with open(journal, "a") as f:
+            f.write('{"deployment_id": "%s", "expires_timestamp": 2.0}\n' % other_id)
+        os.utime(journal, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert list(ttl._cached_ttl_registry()) == [self.EXPIRED_ID, other_id]
+    
+    def test_compaction_keeps_live_entries(self, arvo_dir):
+        """Test that compacting the journal keeps the latest live records."""
+        for i in range(ttl.JOURNAL_COMPACT_MIN_LINES):
+            ttl._append_ttl_journal({"deployment_id": self.EXPIRED_ID, "expires_timestamp": float(i)})
+        ttl._append_ttl_journal({"deployment_id": "d-20240101-000001-efgh", "_tombstone": True})
+        
+        registry = ttl._load_ttl_registry()
+        
+        assert registry == {self.EXPIRED_ID: {
+            "deployment_id": self.EXPIRED_ID,
+            "expires_timestamp": float(ttl.JOURNAL_COMPACT_MIN_LINES - 1)
+        }}
+        assert len((arvo_dir / "ttl.jsonl").read_bytes().splitlines()) == 1
@@ -1,12 +1,13 @@
-from arvo.events import emit_event, get_status_from_events
+import os
+
+from arvo.events import emit_event, emit_events, get_status_from_events, read_events
 from arvo.state import create_deployment_dir
 from arvo.ids import new_deployment_id
 
-def test_status_progression_basic(tmp_path):
+def test_status_progression_basic(tmp_path, monkeypatch):
     deployment_id = new_deployment_id()
-    # use tmp dir as ARVO_HOME
-    import os
-    os.environ['ARVO_HOME'] = str(tmp_path)
+    # use tmp dir as ARVO_HOME, restored after the test
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path))
     create_deployment_dir(deployment_id)
     emit_event(deployment_id, "INIT", {})
     assert get_status_from_events(deployment_id) == "queued"
@@ -14,3 +15,50 @@ def test_status_progression_basic(tmp_path):
     assert get_status_from_events(deployment_id) == "init"
     emit_event(deployment_id, "DONE", {})
     assert get_status_from_events(deployment_id) == "healthy"
+
+
+def test_emit_events_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path))
+    deployment_id = new_deployment_id()
+    create_deployment_dir(deployment_id)
+    emit_events(deployment_id, [("INIT", {}), ("TF_INIT", {"n": 1}), ("DONE", {})])
+    assert [e["type"] for e in read_events(deployment_id)] == ["INIT", "TF_INIT", "DONE"]
+    assert get_status_from_events(deployment_id) == "healthy"
+
+
+def test_status_rescans_rewritten_log(tmp_path, monkeypatch):
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path))
+    deployment_id = new_deployment_id()
+    deployment_dir = create_deployment_dir(deployment_id)
+    emit_events(deployment_id, [("INIT", {}), ("ERROR", {"message": "boom"})])
+    assert get_status_from_events(deployment_id) == "failed"
+    # A shorter rewritten log must not be read from the old offset
+    (deployment_dir / "logs.ndjson").write_text('{"type": "DONE"}\n')
+    assert get_status_from_events(deployment_id) == "healthy"
+
+
+def test_status_rescans_replaced_log(tmp_path, monkeypatch):
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path))
+    deployment_id = new_deployment_id()
+    deployment_dir = create_deployment_dir(deployment_id)
+    emit_events(deployment_id, [("INIT", {}), ("TF_INIT", {})])
+    assert get_status_from_events(deployment_id) == "init"
+    # A recreated log at least as long as the old offset must be read from the start
+    replacement = deployment_dir / "logs.new"
+    replacement.write_text('{"type": "DESTROY_DONE", "padding": "%s"}\n{"type": "INIT"' % ("x" * 200))
+    replacement.replace(deployment_dir / "logs.ndjson")
+    assert get_status_from_events(deployment_id) == "destroyed"
+
+
+def test_status_rescans_same_size_rewrite(tmp_path, monkeypatch):
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path))
+    deployment_id = new_deployment_id()
+    deployment_dir = create_deployment_dir(deployment_id)
+    logs_file = deployment_dir / "logs.ndjson"
+    logs_file.write_text('{"type": "ERROR"}\n')
+    assert get_status_from_events(deployment_id) == "failed"
+    st = logs_file.stat()
+    with open(logs_file, "r+") as f:
+        f.write('{"type": "DONE!"}\n')
+    os.utime(logs_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert get_status_from_events(deployment_id) == "unknown"
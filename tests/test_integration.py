@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Integration test showing how the analyzer works with the orchestrator.
+"""
+
+import logging
+
+import pytest
+
+from arvo.analyzer import analyze_repo
+from arvo.analyzer.report import emit_report
+
+logger = logging.getLogger(__name__)
+
+
+def test_integration(flask_app_dir, tmp_path):
+    """Test the full analyze → report pipeline."""
+    # Test with the shared local Flask app
+    app_dir = flask_app_dir
+    logger.debug("Using test app at: %s", app_dir)
+    
+    # Analyze the app
+    spec = analyze_repo(str(app_dir), "Deploy this Flask application to AWS")
+    
+    logger.debug("Runtime: %s", spec.runtime)
+    logger.debug("Framework: %s", spec.framework)
+    logger.debug("Port: %s", spec.port)
+    logger.debug("Start Command: %s", spec.start_command)
+    logger.debug("Health Path: %s", spec.health_path)
+    logger.debug("DB Required: %s", spec.db_required)
+    logger.debug("Containerized: %s", spec.containerized)
+    logger.debug("Multi Service: %s", spec.multi_service)
+    logger.debug("Needs Build: %s", spec.needs_build)
+    logger.debug("Env Required: %s", spec.env_required)
+    logger.debug("Localhost Refs: %d files", len(spec.localhost_refs))
+    logger.debug("Loopback Binds: %d files", len(spec.loopback_binds))
+    logger.debug("Warnings: %s", spec.warnings)
+    logger.debug("Rationale: %s", spec.rationale)
+    logger.debug("Manifests: %s", list(spec.manifests.keys()))
+    
+    # Generate report
+    report_dir = tmp_path / "analysis_report"
+    emit_report(spec, str(report_dir))
+    logger.debug("JSON Spec: %s", report_dir / 'deployment_spec.json')
+    logger.debug("Analysis: %s", report_dir / 'analysis.md')
+    
+    # Show the analysis markdown
+    analysis_content = (report_dir / "analysis.md").read_text()
+    logger.debug("Analysis Summary:\n%s", analysis_content)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-v"]))
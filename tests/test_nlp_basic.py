@@ -2,6 +2,8 @@
 Basic tests for the NLP extraction system.
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from arvo.nlp import extract_overrides
@@ -10,6 +12,9 @@ from arvo.nlp.rules import extract_pass_a
 from arvo.nlp.normalize import normalize_infra, normalize_region, validate_and_normalize_overrides
 from arvo.nlp.providers import MockProvider, get_provider
 
+# Keep the NLP tests on one xdist worker so they share its warm caches
+pytestmark = pytest.mark.xdist_group("nlp")
+
 
 class TestPassARules:
     """Test deterministic rule extraction (Pass A)."""
@@ -213,6 +218,22 @@ class TestSchema:
         assert overrides.db.engine == "postgres"
         assert overrides.db.size == "small"
     
+    def test_overrides_to_json(self):
+        """Test Overrides JSON serialization."""
+        overrides = Overrides(
+            cloud="aws",
+            env_overrides={"DEBUG": "true"},
+            db=DatabaseConfig(engine="postgres"),
+            confidence=1.0
+        )
+        
+        assert json.loads(overrides.to_json()) == overrides.to_dict()
+        assert overrides.to_json() == json.dumps(overrides.to_dict())
+        
+        # Equal-comparing values of different types must not share a cached string
+        assert json.loads(Overrides(confidence=1).to_json())["confidence"] == 1
+        assert '"confidence": 1.0' in Overrides(confidence=1.0).to_json()
+    
     def test_nlp_report(self):
         """Test NLPReport creation."""
         report = NLPReport(
@@ -233,9 +254,9 @@ class TestSchema:
 class TestProviders:
     """Test NLP providers."""
     
-    def test_mock_provider(self):
+    def test_mock_provider(self, mock_provider):
         """Test mock provider."""
-        provider = MockProvider()
+        provider = mock_provider
         result = provider.extract("Deploy on AWS", {}, [], 5.0)
         assert result == {}
         assert provider.name == "mock"
@@ -307,6 +328,43 @@ class TestExtraction:
         assert overrides.region == "us-west-2"  # Default
         assert len(report.assumptions) > 0
     
+    def test_extract_overrides_cached_results_are_independent(self):
+        """Repeat calls reuse the cached result but return fresh objects."""
+        first, first_report = extract_overrides("Deploy with DEBUG=true on AWS in Oregon")
+        first.env_overrides["DEBUG"] = "false"
+        first_report.assumptions.append("mutated")
+        
+        second, second_report = extract_overrides("Deploy with DEBUG=true on AWS in Oregon")
+        assert second.env_overrides == {"DEBUG": "true"}
+        assert "mutated" not in second_report.assumptions
+        assert second.region == "us-west-2"
+    
+    def test_extract_overrides_retries_llm_after_provider_error(self):
+        """A provider error is not cached, so the next call reaches the LLM again."""
+        class FlakyProvider(MockProvider):
+            calls = 0
+            
+            def extract(self, instructions, schema, examples, timeout_s):
+                # Real providers swallow their errors and return {}
+                FlakyProvider.calls += 1
+                try:
+                    if FlakyProvider.calls == 1:
+                        raise TimeoutError("read timed out")
+                    return {"instance_size": "large"}
+                except TimeoutError:
+                    return {}
+        
+        instructions = "Deploy the flaky provider app on AWS"
+        with patch("arvo.nlp.extract.get_provider", return_value=FlakyProvider()):
+            first, first_report = extract_overrides(instructions)
+            second, second_report = extract_overrides(instructions)
+        
+        assert "LLM unavailable; used rules-only" in first_report.assumptions
+        assert first.instance_size != "large"
+        assert FlakyProvider.calls == 2
+        assert second.instance_size == "large"
+        assert "LLM unavailable; used rules-only" not in second_report.assumptions
+    
     def test_extract_overrides_garbage_input(self):
         """Test extraction with garbage input."""
         overrides, report = extract_overrides("asdf qwerty random text")
@@ -9,17 +9,47 @@ from arvo.obs import (
     FailureClassifier, FailureRule, Severity,
     StatusDeriver, DeploymentStatus,
     CloudWatchLinkBuilder,
-    DiagnosticReporter
+    DiagnosticReporter,
+    EventStore
 )
 
 
+@pytest.fixture(scope="module")
+def shared_classifier():
+    """One classifier per module, so the rule patterns compile once."""
+    return FailureClassifier()
+
+
+@pytest.fixture
+def classifier(shared_classifier):
+    """Shared classifier with its detected-failure tracking reset."""
+    shared_classifier.clear_detected_failures()
+    return shared_classifier
+
+
+@pytest.fixture(scope="module")
+def deriver():
+    """Shared status deriver."""
+    return StatusDeriver()
+
+
+@pytest.fixture(scope="module")
+def builder():
+    """Shared us-west-2 link builder."""
+    return CloudWatchLinkBuilder("us-west-2")
+
+
+@pytest.fixture(scope="module")
+def reporter():
+    """Shared diagnostic reporter."""
+    return DiagnosticReporter()
+
+
 class TestFailureClassifier:
     """Test failure detection and classification."""
     
-    def test_classify_pip_error(self):
+    def test_classify_pip_error(self, classifier):
         """Test detection of pip install errors."""
-        classifier = FailureClassifier()
-        
         # Test pip install failure
         failure = classifier.detect_failure("pip install failed with error", "ec2:cloud-init")
         assert failure is not None
@@ -27,48 +57,38 @@ class TestFailureClassifier:
         assert "Python dependencies failed to install" in failure["message"]
         assert failure["severity"] == "high"
     
-    def test_classify_npm_error(self):
+    def test_classify_npm_error(self, classifier):
         """Test detection of npm errors."""
-        classifier = FailureClassifier()
-        
         # Test npm error
         failure = classifier.detect_failure("npm ERR! something went wrong", "ecs:task")
         assert failure is not None
         assert failure["reason_code"] == "npm_error"
         assert "Node.js install/build failed" in failure["message"]
     
-    def test_classify_address_in_use(self):
+    def test_classify_address_in_use(self, classifier):
         """Test detection of port conflicts."""
-        classifier = FailureClassifier()
-        
         # Test address in use
         failure = classifier.detect_failure("Address already in use: 8080", "systemd")
         assert failure is not None
         assert failure["reason_code"] == "address_in_use"
         assert "Port already in use" in failure["message"]
     
-    def test_classify_bind_loopback(self):
+    def test_classify_bind_loopback(self, classifier):
         """Test detection of loopback binding issues."""
-        classifier = FailureClassifier()
-        
         # Test loopback bind
         failure = classifier.detect_failure("binding to 127.0.0.1:8080", "ec2:cloud-init")
         assert failure is not None
         assert failure["reason_code"] == "bind_loopback"
         assert "bound to loopback address" in failure["message"]
     
-    def test_no_failure_detected(self):
+    def test_no_failure_detected(self, classifier):
         """Test that normal messages don't trigger failures."""
-        classifier = FailureClassifier()
-        
         # Test normal message
         failure = classifier.detect_failure("Application started successfully", "ec2:cloud-init")
         assert failure is None
     
-    def test_detected_failures_tracking(self):
+    def test_detected_failures_tracking(self, classifier):
         """Test that detected failures are tracked."""
-        classifier = FailureClassifier()
-        
         # Detect a failure
         failure = classifier.detect_failure("pip install failed with error", "ec2:cloud-init")
         assert failure is not None
@@ -77,10 +97,8 @@ class TestFailureClassifier:
         detected = classifier.get_detected_failures()
         assert "pip_install_error" in detected
     
-    def test_clear_detected_failures(self):
+    def test_clear_detected_failures(self, classifier):
         """Test clearing detected failures."""
-        classifier = FailureClassifier()
-        
         # Detect a failure
         classifier.detect_failure("pip install failed with error", "ec2:cloud-init")
         assert len(classifier.get_detected_failures()) == 1
@@ -88,15 +106,23 @@ class TestFailureClassifier:
         # Clear failures
         classifier.clear_detected_failures()
         assert len(classifier.get_detected_failures()) == 0
+    
+    def test_repeated_message_tracking(self, classifier):
+        """Test that repeated log lines are reported once until cleared."""
+        message = "npm ERR! something went wrong"
+        
+        assert classifier.detect_failure(message, "ecs:task") is not None
+        assert classifier.detect_failure(message, "ecs:task") is None
+        
+        classifier.clear_detected_failures()
+        assert classifier.detect_failure(message, "ecs:task")["reason_code"] == "npm_error"
 
 
 class TestStatusDeriver:
     """Test status derivation from events."""
     
-    def test_derive_healthy_status(self):
+    def test_derive_healthy_status(self, deriver):
         """Test deriving healthy status."""
-        deriver = StatusDeriver()
-        
         events = [
             {"type": "INIT", "timestamp": 1000},
             {"type": "TF_APPLY_DONE", "timestamp": 2000},
@@ -108,10 +134,8 @@ class TestStatusDeriver:
         assert status_info.status == DeploymentStatus.HEALTHY
         assert "successful" in status_info.message
     
-    def test_derive_failed_status(self):
+    def test_derive_failed_status(self, deriver):
         """Test deriving failed status."""
-        deriver = StatusDeriver()
-        
         events = [
             {"type": "INIT", "timestamp": 1000},
             {"type": "TF_APPLY_DONE", "timestamp": 2000},
@@ -123,10 +147,8 @@ class TestStatusDeriver:
         assert status_info.failure_reason == "pip_install_error"
         assert status_info.failure_hint == "Check requirements.txt"
     
-    def test_derive_in_progress_status(self):
+    def test_derive_in_progress_status(self, deriver):
         """Test deriving in-progress status."""
-        deriver = StatusDeriver()
-        
         events = [
             {"type": "INIT", "timestamp": 1000},
             {"type": "TF_APPLY_START", "timestamp": 2000}
@@ -136,10 +158,8 @@ class TestStatusDeriver:
         assert status_info.status == DeploymentStatus.TF_APPLY
         assert "Applying infrastructure" in status_info.message
     
-    def test_extract_log_links(self):
+    def test_extract_log_links(self, deriver):
         """Test extracting log links from outputs."""
-        deriver = StatusDeriver()
-        
         outputs = {
             "log_links": json.dumps({
                 "cloudwatch_group": "https://console.aws.amazon.com/...",
@@ -151,50 +171,68 @@ class TestStatusDeriver:
         assert "cloudwatch_group" in log_links
         assert "ec2_console" in log_links
     
-    def test_is_terminal_status(self):
-        """Test terminal status detection."""
-        deriver = StatusDeriver()
+    def test_extract_log_links_dict(self, deriver):
+        """Test that log links passed as a dict are used without re-parsing."""
+        links = {"cloudwatch_group": "https://console.aws.amazon.com/..."}
+        outputs = {"log_links": links, "log_app_url": "https://example.com/logs"}
         
+        log_links = deriver._extract_log_links(outputs)
+        assert log_links == {**links, "app": "https://example.com/logs"}
+        assert links == {"cloudwatch_group": "https://console.aws.amazon.com/..."}
+    
+    def test_is_terminal_status(self, deriver):
+        """Test terminal status detection."""
         assert deriver.is_terminal_status(DeploymentStatus.HEALTHY)
         assert deriver.is_terminal_status(DeploymentStatus.FAILED)
         assert deriver.is_terminal_status(DeploymentStatus.DESTROYED)
         assert not deriver.is_terminal_status(DeploymentStatus.TF_APPLY)
+    
+    def test_event_store_matches_list(self, deriver, reporter):
+        """Test that an EventStore derives the same status and report as a list."""
+        events = [
+            {"type": "INIT", "timestamp": 1000},
+            {"type": "FAILURE_DETECTED", "timestamp": 2000, "reason_code": "address_in_use", "message": "Port in use", "hint": "Change port", "severity": "medium"},
+            {"type": "TF_APPLY_START", "timestamp": 3000},
+            {"type": "LOG", "timestamp": 4000},
+            {"type": "FAILURE_DETECTED", "timestamp": 5000, "reason_code": "pip_install_error", "message": "Python deps failed", "hint": "Check requirements.txt", "severity": "high"}
+        ]
+        store = EventStore(events)
+        
+        for prefix in (events[:1], events[:4], events):
+            from_list = deriver.derive_status(prefix)
+            from_store = deriver.derive_status(EventStore(prefix))
+            assert (from_store.status, from_store.failure_reason) == (from_list.status, from_list.failure_reason)
+        
+        assert store.positions("FAILURE_DETECTED") == [1, 4]
+        assert reporter.generate_report("d-1", store).failures == reporter.generate_report("d-1", events).failures
 
 
 class TestCloudWatchLinkBuilder:
     """Test CloudWatch link building."""
     
-    def test_build_log_group_url(self):
+    def test_build_log_group_url(self, builder):
         """Test building log group URL."""
-        builder = CloudWatchLinkBuilder("us-west-2")
-        
         url = builder.build_log_group_url("/arvo/d-12345")
         assert "us-west-2" in url
         assert "%2Farvo%2Fd-12345" in url  # URL encoded
         assert "log-groups" in url
     
-    def test_build_log_stream_url(self):
+    def test_build_log_stream_url(self, builder):
         """Test building log stream URL."""
-        builder = CloudWatchLinkBuilder("us-west-2")
-        
         url = builder.build_log_stream_url("/arvo/d-12345", "ec2/cloud-init")
         assert "us-west-2" in url
         assert "%2Farvo%2Fd-12345" in url  # URL encoded
         assert "ec2%2Fcloud-init" in url  # URL encoded
     
-    def test_build_ec2_console_url(self):
+    def test_build_ec2_console_url(self, builder):
         """Test building EC2 console URL."""
-        builder = CloudWatchLinkBuilder("us-west-2")
-        
         url = builder.build_ec2_console_url("i-1234567890abcdef0")
         assert "us-west-2" in url
         assert "i-1234567890abcdef0" in url
         assert "ec2" in url
     
-    def test_build_log_links_ec2(self):
+    def test_build_log_links_ec2(self, builder):
         """Test building comprehensive log links for EC2."""
-        builder = CloudWatchLinkBuilder("us-west-2")
-        
         outputs = {
             "instance_id": "i-1234567890abcdef0"
         }
@@ -206,10 +244,8 @@ class TestCloudWatchLinkBuilder:
         assert "ec2_cloud_init" in links
         assert "ec2_systemd" in links
     
-    def test_build_tail_command(self):
+    def test_build_tail_command(self, builder):
         """Test building AWS CLI tail command."""
-        builder = CloudWatchLinkBuilder("us-west-2")
-        
         cmd = builder.build_tail_command("/arvo/d-12345", "ec2/cloud-init")
         assert "aws logs tail" in cmd
         assert "/arvo/d-12345" in cmd
@@ -221,10 +257,8 @@ class TestCloudWatchLinkBuilder:
 class TestDiagnosticReporter:
     """Test diagnostic reporting."""
     
-    def test_generate_healthy_report(self):
+    def test_generate_healthy_report(self, reporter):
         """Test generating report for healthy deployment."""
-        reporter = DiagnosticReporter()
-        
         events = [
             {"type": "INIT", "timestamp": 1000},
             {"type": "DONE", "timestamp": 2000}
@@ -237,10 +271,8 @@ class TestDiagnosticReporter:
         assert len(report.failures) == 0
         assert len(report.recommendations) == 0
     
-    def test_generate_failed_report(self):
+    def test_generate_failed_report(self, reporter):
         """Test generating report for failed deployment."""
-        reporter = DiagnosticReporter()
-        
         events = [
             {"type": "INIT", "timestamp": 1000},
             {"type": "FAILURE_DETECTED", "timestamp": 2000, "reason_code": "pip_install_error", "message": "Python deps failed", "hint": "Check requirements.txt", "severity": "high"}
@@ -255,10 +287,8 @@ class TestDiagnosticReporter:
         assert report.failures[0]["reason_code"] == "pip_install_error"
         assert len(report.recommendations) > 0
     
-    def test_format_report(self):
+    def test_format_report(self, reporter):
         """Test formatting diagnostic report."""
-        reporter = DiagnosticReporter()
-        
         events = [
             {"type": "INIT", "timestamp": 1000},
             {"type": "FAILURE_DETECTED", "timestamp": 2000, "reason_code": "pip_install_error", "message": "Python deps failed", "hint": "Check requirements.txt", "severity": "high"}
@@ -272,10 +302,8 @@ class TestDiagnosticReporter:
         assert "Python deps failed" in formatted
         assert "Check requirements.txt" in formatted
     
-    def test_analyze_failures(self):
+    def test_analyze_failures(self, reporter):
         """Test failure analysis."""
-        reporter = DiagnosticReporter()
-        
         events = [
             {"type": "FAILURE_DETECTED", "timestamp": 1000, "reason_code": "pip_install_error", "message": "Python deps failed", "hint": "Check requirements.txt", "severity": "high"},
             {"type": "FAILURE_DETECTED", "timestamp": 2000, "reason_code": "address_in_use", "message": "Port in use", "hint": "Change port", "severity": "medium"}
@@ -1,33 +1,9 @@
+import os
 import tempfile
 from pathlib import Path
 from arvo.patcher import apply_patches
-from arvo.analyzer.spec import DeploymentSpec
 from arvo.selector.plan import InfraPlan
-
-
-def make_spec(runtime="python", framework="flask", port=5000):
-    return DeploymentSpec(
-        app_path="/app",
-        runtime=runtime,
-        framework=framework,
-        containerized=False,
-        multi_service=False,
-        start_command="flask run",
-        port=port,
-        health_path="/health",
-        needs_build=False,
-        build_command=None,
-        static_assets=None,
-        db_required=False,
-        env_required=[],
-        env_example_path=None,
-        localhost_refs=[],
-        loopback_binds=[],
-        warnings=[],
-        rationale=[],
-        manifests={},
-        extra={},
-    )
+from spec_factory import make_spec
 
 
 def test_flask_localhost_rewrite_and_systemd():
@@ -53,3 +29,31 @@ def test_express_listen_rewrite_and_container_cmd():
         result = apply_patches(spec, plan, td)
         assert result.container_cmd is not None
         assert result.env_overrides["PORT"] == str(spec.port)
+
+
+def test_rerun_skips_settled_files_but_sees_edits():
+    spec = make_spec()
+    plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
+    with tempfile.TemporaryDirectory() as td:
+        app = Path(td)/"app.py"
+        app.write_text("app.run(host='127.0.0.1', port=5000)\n")
+        assert apply_patches(spec, plan, td).changes
+        assert not any("app.py" in c for c in apply_patches(spec, plan, td).changes)
+        # A fresh, differently sized file is patched again
+        app.write_text("# replaced\napp.run(host='localhost', port=5001)\n")
+        assert any("app.py" in c for c in apply_patches(spec, plan, td).changes)
+
+
+def test_rerun_sees_same_size_edit_with_unchanged_mtime():
+    spec = make_spec()
+    plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
+    with tempfile.TemporaryDirectory() as td:
+        app = Path(td)/"app.py"
+        app.write_text("# http://127.0.0.2:5000/api\n")
+        assert not any("app.py" in c for c in apply_patches(spec, plan, td).changes)
+        # Same size and mtime, as an edit within one timestamp tick would leave it
+        st = app.stat()
+        app.write_text("# http://127.0.0.1:5000/api\n")
+        os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert app.stat().st_size == st.st_size
+        assert any("app.py" in c for c in apply_patches(spec, plan, td).changes)
@@ -1,39 +1,12 @@
 import tempfile
 from pathlib import Path
 from arvo.patcher import apply_patches
-from arvo.analyzer.spec import DeploymentSpec
 from arvo.selector.plan import InfraPlan
-
-
-def spec_of(**kw):
-    base = dict(
-        app_path="/app",
-        runtime="python",
-        framework="flask",
-        containerized=False,
-        multi_service=False,
-        start_command="flask run",
-        port=5000,
-        health_path="",
-        needs_build=False,
-        build_command=None,
-        static_assets=None,
-        db_required=False,
-        env_required=[],
-        env_example_path=None,
-        localhost_refs=[],
-        loopback_binds=[],
-        warnings=[],
-        rationale=[],
-        manifests={},
-        extra={},
-    )
-    base.update(kw)
-    return DeploymentSpec(**base)
+from spec_factory import make_spec
 
 
 def test_fastapi_uvicorn_synth_ec2_and_health_default():
-    spec = spec_of(runtime="python", framework="fastapi", start_command="uvicorn main:app", port=8000)
+    spec = make_spec(runtime="python", framework="fastapi", start_command="uvicorn main:app", port=8000)
     plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         p = Path(td)
@@ -46,7 +19,7 @@ def test_fastapi_uvicorn_synth_ec2_and_health_default():
 
 
 def test_django_synth_ec2_produces_unit_and_port_env():
-    spec = spec_of(runtime="python", framework="django", start_command=None, port=8000)
+    spec = make_spec(runtime="python", framework="django", start_command=None, port=8000)
     plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         (Path(td)/"manage.py").write_text("print('ok')\n")
@@ -57,7 +30,7 @@ def test_django_synth_ec2_produces_unit_and_port_env():
 
 
 def test_static_site_noop():
-    spec = spec_of(runtime="static", framework=None, start_command=None, static_assets="build/", port=None)
+    spec = make_spec(runtime="static", framework=None, start_command=None, static_assets="build/", port=None)
     plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         result = apply_patches(spec, plan, td)
@@ -66,7 +39,7 @@ def test_static_site_noop():
 
 
 def test_html_js_localhost_to_relative():
-    spec = spec_of()
+    spec = make_spec()
     plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         html = Path(td)/"index.html"
@@ -81,7 +54,7 @@ def test_html_js_localhost_to_relative():
 
 
 def test_express_container_cmd_and_loopback_bind_rewrite():
-    spec = spec_of(runtime="node", framework="express", start_command="node server.js", port=3000)
+    spec = make_spec(runtime="node", framework="express", start_command="node server.js", port=3000)
     plan = InfraPlan(target="ecs_fargate", module_hint="ecs_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         srv = Path(td)/"server.js"
@@ -95,7 +68,7 @@ def test_express_container_cmd_and_loopback_bind_rewrite():
 
 
 def test_multi_service_enables_auto_cors():
-    spec = spec_of(multi_service=True)
+    spec = make_spec(multi_service=True)
     plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         result = apply_patches(spec, plan, td)
@@ -104,7 +77,7 @@ def test_multi_service_enables_auto_cors():
 
 
 def test_service_origin_placeholder_when_multi_service():
-    spec = spec_of(multi_service=True)
+    spec = make_spec(multi_service=True)
     plan = InfraPlan(target="ec2", module_hint="ec2_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         api = Path(td)/"app.js"
@@ -115,7 +88,7 @@ def test_service_origin_placeholder_when_multi_service():
 
 
 def test_container_entrypoint_and_cmd_present_for_ecs():
-    spec = spec_of(runtime="node", framework="express", start_command="node server.js", port=3000)
+    spec = make_spec(runtime="node", framework="express", start_command="node server.js", port=3000)
     plan = InfraPlan(target="ecs_fargate", module_hint="ecs_web", parameters={})
     with tempfile.TemporaryDirectory() as td:
         Path(td, "server.js").write_text("const app=require('express')(); app.listen(3000);")
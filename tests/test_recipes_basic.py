@@ -10,8 +10,12 @@ from arvo.recipes.python_flask import FlaskRecipe
 from arvo.recipes.python_fastapi import FastAPIRecipe
 from arvo.recipes.python_django import DjangoRecipe
 from arvo.recipes.registry import AVAILABLE_RECIPES
-from arvo.analyzer.spec import DeploymentSpec
 from arvo.selector import InfraPlan
+from spec_factory import make_spec
+
+
+# Fields that turn the shared Flask spec into an app no recipe recognizes
+_UNKNOWN_APP = dict(runtime="unknown", framework=None, start_command=None, port=None)
 
 
 class TestRecipeSelection:
@@ -19,16 +23,7 @@ class TestRecipeSelection:
     
     def test_flask_recipe_selection(self):
         """Test Flask recipe selection."""
-        spec = DeploymentSpec(
-            app_path=".", runtime="python", framework="flask",
-            containerized=False, multi_service=False,
-            start_command="flask run", port=5000,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"requirements.txt": "Flask==2.3.3"}, extra={}
-        )
+        spec = make_spec(manifests={"requirements.txt": "Flask==2.3.3"})
         
         infra_plan = InfraPlan(
             target="ec2", module_hint="ec2_web", parameters={},
@@ -41,15 +36,9 @@ class TestRecipeSelection:
     
     def test_fastapi_recipe_selection(self):
         """Test FastAPI recipe selection."""
-        spec = DeploymentSpec(
-            app_path=".", runtime="python", framework="fastapi",
-            containerized=False, multi_service=False,
-            start_command="uvicorn main:app", port=8000,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"requirements.txt": "fastapi==0.104.1"}, extra={}
+        spec = make_spec(
+            framework="fastapi", start_command="uvicorn main:app", port=8000,
+            manifests={"requirements.txt": "fastapi==0.104.1"}
         )
         
         infra_plan = InfraPlan(
@@ -63,15 +52,9 @@ class TestRecipeSelection:
     
     def test_django_recipe_selection(self):
         """Test Django recipe selection."""
-        spec = DeploymentSpec(
-            app_path=".", runtime="python", framework="django",
-            containerized=False, multi_service=False,
-            start_command="python manage.py runserver", port=8000,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"requirements.txt": "Django==4.2.0", "manage.py": "#!/usr/bin/env python"}, extra={}
+        spec = make_spec(
+            framework="django", start_command="python manage.py runserver", port=8000,
+            manifests={"requirements.txt": "Django==4.2.0", "manage.py": "#!/usr/bin/env python"}
         )
         
         infra_plan = InfraPlan(
@@ -85,16 +68,7 @@ class TestRecipeSelection:
     
     def test_no_suitable_recipe(self):
         """Test when no suitable recipe is found."""
-        spec = DeploymentSpec(
-            app_path=".", runtime="unknown", framework=None,
-            containerized=False, multi_service=False,
-            start_command=None, port=None,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={}, extra={}
-        )
+        spec = make_spec(**_UNKNOWN_APP)
         
         infra_plan = InfraPlan(
             target="ec2", module_hint="ec2_web", parameters={},
@@ -117,45 +91,21 @@ class TestRecipeScoring:
         recipe = FlaskRecipe()
         
         # Perfect Flask match
-        spec = DeploymentSpec(
-            app_path=".", runtime="python", framework="flask",
-            containerized=False, multi_service=False,
-            start_command="flask run", port=5000,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"requirements.txt": "Flask==2.3.3"}, extra={}
-        )
+        spec = make_spec(manifests={"requirements.txt": "Flask==2.3.3"})
         
         score = recipe.applies(spec)
         assert score >= 80  # Should be high score for perfect match
         
         # Partial Flask match
-        spec_partial = DeploymentSpec(
-            app_path=".", runtime="unknown", framework=None,
-            containerized=False, multi_service=False,
-            start_command=None, port=None,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"requirements.txt": "Flask==2.3.3"}, extra={}
-        )
+        spec_partial = make_spec(**_UNKNOWN_APP, manifests={"requirements.txt": "Flask==2.3.3"})
         
         score_partial = recipe.applies(spec_partial)
         assert 0 < score_partial < score  # Should be lower than perfect match
         
         # No Flask match
-        spec_no_flask = DeploymentSpec(
-            app_path=".", runtime="node", framework="express",
-            containerized=False, multi_service=False,
-            start_command="npm start", port=3000,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"package.json": '{"dependencies": {"express": "^4.18.2"}}'}, extra={}
+        spec_no_flask = make_spec(
+            runtime="node", framework="express", start_command="npm start", port=3000,
+            manifests={"package.json": '{"dependencies": {"express": "^4.18.2"}}'}
         )
         
         score_no_flask = recipe.applies(spec_no_flask)
@@ -169,16 +119,7 @@ class TestRecipePlanning:
         """Test Flask recipe planning."""
         recipe = FlaskRecipe()
         
-        spec = DeploymentSpec(
-            app_path=".", runtime="python", framework="flask",
-            containerized=False, multi_service=False,
-            start_command="flask run", port=5000,
-            health_path="/", needs_build=False, build_command=None,
-            static_assets=None, db_required=False,
-            env_required=[], env_example_path=None,
-            localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-            manifests={"requirements.txt": "Flask==2.3.3"}, extra={}
-        )
+        spec = make_spec(manifests={"requirements.txt": "Flask==2.3.3"})
         
         infra_plan = InfraPlan(
             target="ec2", module_hint="ec2_web", parameters={},
@@ -212,7 +153,7 @@ class TestSmokeTesting:
         ]
         
         # Mock successful requests
-        with patch('requests.get') as mock_get:
+        with patch('arvo.recipes.smoke._session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.text = '{"status": "ok", "health": "healthy"}'
@@ -231,7 +172,7 @@ class TestSmokeTesting:
         ]
         
         # Mock failed requests
-        with patch('requests.get') as mock_get:
+        with patch('arvo.recipes.smoke._session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_response.text = 'Not Found'
@@ -242,6 +183,27 @@ class TestSmokeTesting:
             assert result.success is False
             assert "failed" in result.message.lower()
     
+    def test_smoke_test_partial_failure(self):
+        """Test that concurrent checks are reported per path, in check order."""
+        smoke_checks = [
+            {"path": "/", "expect": 200},
+            {"path": "/missing", "expect": 200},
+            {"path": "/health", "expect": 200}
+        ]
+        
+        def fake_get(url, timeout):
+            response = Mock()
+            response.status_code = 404 if url.endswith("/missing") else 200
+            response.text = ""
+            return response
+        
+        with patch('arvo.recipes.smoke._session.get', side_effect=fake_get):
+            result = run_smoke_test("http://example.com", smoke_checks, max_retries=1, retry_delay=0)
+        
+        assert result.success is False
+        assert [c["path"] for c in result.details["successful_checks"]] == ["/", "/health"]
+        assert [c["path"] for c in result.details["failed_checks"]] == ["/missing"]
+    
     def test_smoke_test_no_checks(self):
         """Test smoke test with no checks."""
         result = run_smoke_test("http://example.com", [], max_retries=1, retry_delay=0)
@@ -277,17 +239,25 @@ class TestRecipeRegistry:
             assert hasattr(recipe, 'plan')
             
             # Test that applies returns an integer
-            spec = DeploymentSpec(
-                app_path=".", runtime="unknown", framework=None,
-                containerized=False, multi_service=False,
-                start_command=None, port=None,
-                health_path="/", needs_build=False, build_command=None,
-                static_assets=None, db_required=False,
-                env_required=[], env_example_path=None,
-                localhost_refs=[], loopback_binds=[], warnings=[], rationale=[],
-                manifests={}, extra={}
-            )
+            spec = make_spec(**_UNKNOWN_APP)
             
             score = recipe.applies(spec)
             assert isinstance(score, int)
             assert 0 <= score <= 100
+    
+    def test_recipe_score_cache(self):
+        """Test that memoized scores match applies and track spec changes."""
+        recipe = FlaskRecipe()
+        spec = make_spec(
+            framework=None, start_command=None, port=None,
+            manifests={"requirements.txt": "Flask==2.3.3"}
+        )
+        
+        assert recipe.score(spec) == recipe.applies(spec)
+        assert recipe.score(spec) == recipe.applies(spec)
+        
+        spec.manifests = {"requirements.txt": "requests==2.31.0"}
+        assert recipe.score(spec) == recipe.applies(spec)
+        
+        spec.containerized = True
+        assert recipe.score(spec) == recipe.applies(spec)
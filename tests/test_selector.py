@@ -1,75 +1,81 @@
-from arvo.selector import select_infra
-from arvo.analyzer.spec import DeploymentSpec
+import copy
 
+import pytest
 
-def make_spec(**kw):
-    base = dict(
-        app_path="/tmp/app",
-        runtime="python",
-        framework="flask",
-        containerized=False,
-        multi_service=False,
-        start_command="flask run",
-        port=5000,
-        health_path="/health",
-        needs_build=False,
-        build_command=None,
-        static_assets=None,
-        db_required=False,
-        env_required=[],
-        env_example_path=None,
-        localhost_refs=[],
-        loopback_binds=[],
-        warnings=[],
-        rationale=[],
-        manifests={},
-        extra={},
+from arvo.selector import select_infra
+from spec_factory import make_spec
+
+
+CONTAINER_TARGETS = {"ecs_fargate", "lightsail_containers"}
+
+CASES = [
+    pytest.param(
+        dict(runtime="python", framework="flask", containerized=False), None,
+        {"target": "ec2", "module_hint": "ec2_web", "rationale_contains": "framework=flask"},
+        id="flask-defaults-to-ec2",
+    ),
+    pytest.param(
+        dict(runtime="python", framework="django"), None,
+        {"target": "ec2"},
+        id="django-defaults-to-ec2",
+    ),
+    pytest.param(
+        dict(containerized=True), None,
+        {"target_in": CONTAINER_TARGETS},
+        id="containerized-chooses-ecs",
+    ),
+    pytest.param(
+        dict(manifests={"Dockerfile": "/tmp/app/Dockerfile"}), None,
+        {"target_in": CONTAINER_TARGETS},
+        id="dockerfile-chooses-ecs",
+    ),
+    pytest.param(
+        dict(runtime="static", framework=None, static_assets="build/", start_command=None, port=None), None,
+        {"target": "s3_cf", "module_hint": "static_site"},
+        id="static-site-s3-cf",
+    ),
+    pytest.param(
+        dict(), {"infra": "ecs_fargate", "region": "us-west-2"},
+        {"target": "ecs_fargate", "parameters": {"region": "us-west-2"}},
+        id="overrides-win",
+    ),
+    pytest.param(
+        dict(), {"infra": "lambda"},
+        {"target_or_fallback": "ec2"},
+        id="lambda-stub-falls-back",
+    ),
+]
+
+
+@pytest.mark.parametrize("spec_kwargs, overrides, expected", CASES)
+def test_selects(cached_select, spec_kwargs, overrides, expected):
+    plan = cached_select(make_spec(**spec_kwargs), overrides)
+    if "target" in expected:
+        assert plan.target == expected["target"]
+    if "target_in" in expected:
+        assert plan.target in expected["target_in"]
+    if "target_or_fallback" in expected:
+        assert plan.target == expected["target_or_fallback"] or plan.fallback_used
+    if "module_hint" in expected:
+        assert plan.module_hint == expected["module_hint"]
+    if "rationale_contains" in expected:
+        assert any(expected["rationale_contains"] in r for r in plan.rationale)
+    for key, value in expected.get("parameters", {}).items():
+        assert plan.parameters.get(key) == value
+
+
+def test_select_infra_does_not_mutate_inputs():
+    spec = make_spec(
+        containerized=True,
+        warnings=["existing"],
+        rationale=["existing"],
+        manifests={"Dockerfile": "/tmp/app/Dockerfile"},
+        extra={"key": "value"},
     )
-    base.update(kw)
-    return DeploymentSpec(**base)
-
-
-def test_flask_defaults_to_ec2():
-    spec = make_spec(runtime="python", framework="flask", containerized=False)
-    plan = select_infra(spec)
-    assert plan.target == "ec2"
-    assert plan.module_hint == "ec2_web"
-    assert any("framework=flask" in r for r in plan.rationale)
-
-
-def test_django_defaults_to_ec2():
-    spec = make_spec(runtime="python", framework="django")
-    plan = select_infra(spec)
-    assert plan.target == "ec2"
-
-
-def test_containerized_chooses_ecs():
-    spec = make_spec(containerized=True)
-    plan = select_infra(spec)
-    assert plan.target in {"ecs_fargate", "lightsail_containers"}
-
-
-def test_dockerfile_chooses_ecs():
-    spec = make_spec(manifests={"Dockerfile": "/tmp/app/Dockerfile"})
-    plan = select_infra(spec)
-    assert plan.target in {"ecs_fargate", "lightsail_containers"}
-
-
-def test_static_site_s3_cf():
-    spec = make_spec(runtime="static", framework=None, static_assets="build/", start_command=None, port=None)
-    plan = select_infra(spec)
-    assert plan.target == "s3_cf"
-    assert plan.module_hint == "static_site"
-
-
-def test_overrides_win():
-    spec = make_spec()
-    plan = select_infra(spec, overrides={"infra": "ecs_fargate", "region": "us-west-2"})
-    assert plan.target == "ecs_fargate"
-    assert plan.parameters.get("region") == "us-west-2"
-
-
-def test_lambda_stub_falls_back():
-    spec = make_spec()
-    plan = select_infra(spec, overrides={"infra": "lambda"})
-    assert plan.target == "ec2" or plan.fallback_used
+    overrides = {"infra": "ecs_fargate", "region": "us-west-2"}
+    spec_before = copy.deepcopy(spec)
+    overrides_before = copy.deepcopy(overrides)
+    select_infra(spec)
+    select_infra(spec, overrides=overrides)
+    assert spec == spec_before
+    assert overrides == overrides_before
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from arvo.smart_deploy import _SESSION, _try_rule_parse, smart_analyze_instructions
+
+
+@pytest.mark.parametrize("instructions, expected", [
+    pytest.param(
+        "deploy flask app on aws us-east-1 t2.medium with ssl",
+        {"region": "us-east-1", "type": "t2.medium", "framework": "flask", "port": 5000, "ssl": True},
+        id="full",
+    ),
+    pytest.param(
+        "Deploy Django in EU-WEST-1",
+        {"region": "eu-west-1", "type": "t2.micro", "framework": "django", "port": 8000, "ssl": False},
+        id="defaults",
+    ),
+    pytest.param(
+        "deploy https://github.com/x/y to us-east-1 with flask",
+        {"region": "us-east-1", "type": "t2.micro", "framework": "flask", "port": 5000, "ssl": False},
+        id="url-is-not-ssl",
+    ),
+    pytest.param(
+        "express api in ap-southeast-2 behind TLS",
+        {"region": "ap-southeast-2", "type": "t2.micro", "framework": "express", "port": 3000, "ssl": True},
+        id="tls",
+    ),
+])
+def test_rule_parse_plans(instructions, expected):
+    plan = _try_rule_parse(instructions)
+    assert plan["instance_config"]["region"] == expected["region"]
+    assert plan["instance_config"]["type"] == expected["type"]
+    assert plan["application_config"]["framework"] == expected["framework"]
+    assert plan["application_config"]["port"] == expected["port"]
+    assert plan["security_config"]["ssl"] is expected["ssl"]
+    assert ("configure_ssl" in plan["deployment_steps"]) is expected["ssl"]
+
+
+def test_rule_parse_extras():
+    plan = _try_rule_parse(
+        "flask on us-east-1 with autoscaling, a PostgreSQL database and CloudWatch monitoring"
+    )
+    assert plan["infrastructure_type"] == "scaled_vm"
+    assert plan["application_config"]["needs_database"] is True
+    assert plan["monitoring_config"]["enabled"] is True
+
+
+@pytest.mark.parametrize("instructions", [
+    pytest.param("deploy my app please", id="nothing"),
+    pytest.param("deploy flask with ssl", id="no-region"),
+    pytest.param("deploy to us-east-1 with https", id="no-framework"),
+    pytest.param("deploy https://github.com/acme/flask-app to us-east-1", id="framework-only-in-url"),
+])
+def test_rule_parse_declines(instructions):
+    assert _try_rule_parse(instructions) is None
+
+
+def test_analyze_instructions_skips_llm_for_rule_plans():
+    with patch("arvo.smart_deploy.get_free_llm_response") as llm:
+        plan = smart_analyze_instructions("deploy flask on us-west-2")
+    llm.assert_not_called()
+    assert plan["instance_config"]["region"] == "us-west-2"
+
+
+def test_llm_session_retries_post():
+    retry = _SESSION.get_adapter("https://api.groq.com").max_retries
+    assert retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 400)
@@ -0,0 +1,93 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from arvo.events import read_events
+from arvo.ids import new_deployment_id
+from arvo.state import create_deployment_dir
+from arvo.terraform import PLAN_OK_CODES, _count_planned_changes, prepare_workdir, tf_plan
+
+
+def _planned_change(action):
+    return json.dumps({"type": "planned_change", "change": {"action": action, "resource": {"addr": "a.b"}}})
+
+
+PLAN_OUTPUT = "\n".join([
+    json.dumps({"type": "version", "terraform": "1.6.0"}),
+    _planned_change("create"),
+    _planned_change("create"),
+    _planned_change("update"),
+    _planned_change("delete"),
+    _planned_change("replace"),
+    _planned_change("noop"),
+    "Warning: not JSON, mentions \"planned_change\" anyway",
+    '{"type": "planned_change", "change": ',
+    json.dumps({"type": "change_summary", "changes": {"add": 3, "change": 1, "remove": 2}}),
+])
+
+
+def test_prepare_workdir_recopies_edited_sources(tmp_path, monkeypatch):
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+    deployment_id = new_deployment_id()
+    create_deployment_dir(deployment_id)
+    
+    # Nothing to copy yet: the directory must not be marked prepared
+    deployment_dir = prepare_workdir(deployment_id)
+    assert not (deployment_dir / ".arvo_prepared").exists()
+    
+    source = tmp_path / "infra" / "main.tf"
+    source.parent.mkdir()
+    source.write_text('resource "a" "b" {}\n')
+    # Age the sources so a coarse clock cannot tie them with the sentinel
+    for path in (source, source.parent):
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+    prepare_workdir(deployment_id)
+    copied = deployment_dir / "infra" / "main.tf"
+    assert copied.read_text() == 'resource "a" "b" {}\n'
+    
+    # Unchanged sources are not copied again
+    copied.write_text("local scratch\n")
+    prepare_workdir(deployment_id)
+    assert copied.read_text() == "local scratch\n"
+    
+    # An edit after the last copy is picked up
+    source.write_text('resource "a" "c" {}\n')
+    sentinel_ns = (deployment_dir / ".arvo_prepared").stat().st_mtime_ns
+    os.utime(source, ns=(sentinel_ns + 1_000_000_000, sentinel_ns + 1_000_000_000))
+    prepare_workdir(deployment_id)
+    assert copied.read_text() == 'resource "a" "c" {}\n'
+
+
+def test_count_planned_changes():
+    assert _count_planned_changes(PLAN_OUTPUT) == {"adds": 3, "changes": 1, "destroys": 2}
+    assert _count_planned_changes("") == {"adds": 0, "changes": 0, "destroys": 0}
+
+
+class _FakePlanProcess:
+    def __init__(self, returncode):
+        self.stdout = iter(line + "\n" for line in PLAN_OUTPUT.splitlines())
+        self.returncode = returncode
+    
+    def wait(self):
+        return self.returncode
+
+
+@pytest.mark.parametrize("returncode, ok", [(0, True), (2, True), (1, False)])
+def test_tf_plan_detailed_exitcode(tmp_path, monkeypatch, returncode, ok):
+    monkeypatch.setenv('ARVO_HOME', str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+    deployment_id = new_deployment_id()
+    create_deployment_dir(deployment_id)
+    
+    with patch("arvo.terraform.subprocess.Popen", return_value=_FakePlanProcess(returncode)):
+        assert tf_plan(deployment_id) is ok
+    
+    assert (returncode in PLAN_OK_CODES) is ok
+    plan_events = [e["data"] for e in read_events(deployment_id) if e["type"] == "TF_PLAN"]
+    if ok:
+        assert plan_events[-1] == {"adds": 3, "changes": 1, "destroys": 2, "ok": True}
+    else:
+        assert plan_events == []